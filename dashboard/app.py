@@ -7,7 +7,8 @@ import dash
 from dash import dcc, html, Input, Output, callback, State
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
-from datetime import datetime
+import numpy as np
+from datetime import datetime, timedelta, timezone
 import os
 import sys
 
@@ -15,18 +16,66 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.data_loader import KafkaDataLoader, HistoricalDataProcessor
+from utils.cache import ByteBoundedLRU
+from utils.figure_cache import FigureCache
+from utils.history_store import TieredHistoryStore
+from utils.refresher import SnapshotRefresher
+from utils.report_summary import ReportSummary
+from utils.retention import ingest_trend_metrics
+from utils.report_watcher import ReportWatcher
+from utils.push import PUSH_EVENTS_PATH, PushChannel
+from utils.server_store import ServerDataStore
+from utils.table_query import IndexedTable
 from components.charts import ChartBuilder, MetricsCards
-from components.layout import LayoutComponents, TabsLayout
+from components.layout import LayoutComponents, TabsLayout, HEALTH_TABLE_COLUMNS, TOPICS_TABLE_COLUMNS
+
+
+# Trend window -> (span, spacing between plotted reports)
+TREND_WINDOWS = {
+    '24h': (timedelta(hours=24), timedelta(minutes=5)),
+    '7d': (timedelta(days=7), timedelta(hours=1)),
+    '90d': (timedelta(days=90), timedelta(hours=6))
+}
+DEFAULT_TREND_WINDOW = '24h'
+
+# Serialized figures and components kept for repeat views
+FIGURE_CACHE_BYTES = 64 * 1024 * 1024
+
+# Indexed tables behind server-side paged DataTables
+TABLE_CACHE_BYTES = 128 * 1024 * 1024
+
+# Server-side paged tables: DataTable id -> (report sections, rows per page)
+PAGED_TABLES = {
+    'health-table': (('health',), 15),
+    'topics-data-table': (('topic_rows',), 25)
+}
 
 
 class KafkaDashboard:
     """Main dashboard application class"""
     
-    def __init__(self, data_dir: str = "../kafka-analysis"):
+    def __init__(self, data_dir: str = "../kafka-analysis", watch_reports: bool = True,
+                 background_refresh: bool = True, push_updates: bool = False):
         self.data_dir = data_dir
         self.data_loader = KafkaDataLoader(data_dir)
+        self.history_dir = os.path.join(data_dir, ".history")
+        self.history_store = None
+        # Loads and summarizes new reports off the request path
+        self.refresher = SnapshotRefresher(self.data_loader, on_refresh=self.on_snapshot_refresh)
+        self.background_refresh = background_refresh
+        # Pushes new reports into the loader as they are written
+        self.report_watcher = ReportWatcher(self.data_loader, on_change=self.refresher.wake) \
+            if watch_reports else None
+        # Optional Server-Sent Events channel announcing new data versions
+        self.push_channel = PushChannel() if push_updates else None
+        # Report data stays on the server; dcc.Store components only hold tokens
+        self.data_store = ServerDataStore()
         self.chart_builder = ChartBuilder()
         self.layout_components = LayoutComponents()
+        # Serialized views keyed by (section keys of the report, view, parameters)
+        self.figure_cache = FigureCache(FIGURE_CACHE_BYTES)
+        # Indexed tables keyed by (table, section keys of the report)
+        self.table_cache = ByteBoundedLRU(TABLE_CACHE_BYTES)
         
         # Initialize Dash app
         self.app = dash.Dash(
@@ -70,6 +119,9 @@ class KafkaDashboard:
         </html>
         '''
         
+        if self.push_channel is not None:
+            self.push_channel.register(self.app.server)
+        
         self.setup_layout()
         self.setup_callbacks()
     
@@ -92,9 +144,23 @@ class KafkaDashboard:
                 n_intervals=0
             ),
             
-            # Data store
+            # Clicked by assets/push_updates.js when the server announces new data
+            html.Button(
+                id='push-trigger',
+                n_clicks=0,
+                style={'display': 'none'},
+                **({'data-push-url': PUSH_EVENTS_PATH} if self.push_channel is not None else {})
+            ),
+            
+            # Data version tokens, resolved through the server-side data store
             dcc.Store(id='kafka-data'),
-            dcc.Store(id='historical-data')
+            dcc.Store(id='historical-data'),
+            dcc.Store(id='data-version'),
+            
+            # Fingerprints of the report sections the views are built from
+            *[dcc.Store(id=f'section-{section}') for section in ReportSummary.SECTIONS],
+            # Whether main-content holds the dashboard or the no-data message
+            dcc.Store(id='content-mode')
             
         ], fluid=True)
     
@@ -104,50 +170,174 @@ class KafkaDashboard:
         @self.app.callback(
             [Output('kafka-data', 'data'),
              Output('historical-data', 'data'),
-             Output('last-updated', 'children')],
+             Output('last-updated', 'children'),
+             Output('data-version', 'data'),
+             Output('cluster-selector', 'options')],
             [Input('interval-component', 'n_intervals'),
-             Input('refresh-button', 'n_clicks')]
+             Input('refresh-button', 'n_clicks'),
+             Input('cluster-selector', 'value'),
+             Input('push-trigger', 'n_clicks')],
+            [State('data-version', 'data'),
+             State('kafka-data', 'data'),
+             State('historical-data', 'data')]
         )
-        def update_data(n_intervals, refresh_clicks):
-            """Update data from latest reports"""
-            # Load latest report
-            latest_data = self.data_loader.get_latest_report()
+        def update_data(n_intervals, refresh_clicks, cluster, push_clicks,
+                        client_etag, client_latest, client_history):
+            """Update data from latest reports
+            
+            ``data-version`` holds the ETag of the data the browser last
+            received. Outputs whose token the browser already holds are
+            left as ``dash.no_update``, so an idle tick does not re-trigger
+            the content and chart callbacks.
+            """
+            triggered_id = dash.callback_context.triggered_id
+            if triggered_id == 'refresh-button':
+                # An explicit refresh picks up new reports right away
+                snapshot = self.refresher.refresh()
+            else:
+                # Reports are loaded and summarized by the background
+                # refresher; this only reads its current snapshot
+                snapshot = self.refresher.snapshot()
             
-            # Load all reports for historical analysis
-            all_reports = self.data_loader.get_all_reports()
+            etag = snapshot.etag
+            latest_kind = self.cluster_kind('latest', cluster)
+            history_kind = self.cluster_kind('history', cluster)
+            latest_token = self.data_store.make_token(latest_kind, etag)
+            history_token = self.data_store.make_token(history_kind, etag)
             
-            # Current timestamp
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            # Same data and same cluster as the browser already has
+            if etag == client_etag and latest_token == client_latest and history_token == client_history:
+                return dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update
             
-            return latest_data, all_reports, current_time
+            # Latest report and handles for historical analysis, of the
+            # selected cluster if any; bodies are loaded on demand.
+            # Each cluster gets its own slots in the data store.
+            if latest_token != client_latest:
+                latest_token = self.data_store.put(latest_kind, etag, snapshot.latest_report(cluster))
+            else:
+                latest_token = dash.no_update
+            if history_token != client_history:
+                history_token = self.data_store.put(history_kind, etag, snapshot.report_handles(cluster))
+            else:
+                history_token = dash.no_update
+            
+            # Time the snapshot was built
+            current_time = snapshot.built_at.strftime("%Y-%m-%d %H:%M:%S")
+            
+            # Cluster options only change with the data
+            if etag == client_etag:
+                return latest_token, history_token, current_time, dash.no_update, dash.no_update
+            return latest_token, history_token, current_time, etag, self.get_cluster_options(snapshot)
         
         @self.app.callback(
-            Output('main-content', 'children'),
-            Input('kafka-data', 'data')
+            [Output('main-content', 'children'),
+             Output('content-mode', 'data')],
+            Input('kafka-data', 'data'),
+            State('content-mode', 'data')
         )
-        def update_main_content(kafka_data):
-            """Update main content based on available data"""
+        def update_main_content(kafka_token, content_mode):
+            """Update main content based on available data
+            
+            The views are filled in by their own callbacks, so the layout
+            is only rendered again when data appears or disappears.
+            """
+            kafka_data = self.resolve_latest_report(kafka_token)
+            mode = 'dashboard' if kafka_data else 'no-data'
+            if mode == content_mode:
+                return dash.no_update, dash.no_update
             if not kafka_data:
-                return self.layout_components.create_no_data_message()
+                return self.layout_components.create_no_data_message(), mode
             
-            return self.create_dashboard_content(kafka_data)
+            return self.create_dashboard_content(), mode
         
-    def create_dashboard_content(self, kafka_data):
-        """Create the main dashboard content"""
-        # Extract data summaries
-        health_score = self.data_loader.get_health_score(kafka_data)
-        topics_summary = self.data_loader.get_topics_summary(kafka_data)
-        broker_info = self.data_loader.get_broker_info(kafka_data)
-        consumer_summary = self.data_loader.get_consumer_groups_summary(kafka_data)
-        
-        # Create metrics cards
-        metrics = MetricsCards.create_cluster_metrics(
-            broker_info, topics_summary, consumer_summary
+        @self.app.callback(
+            [Output(f'section-{section}', 'data') for section in ReportSummary.SECTIONS],
+            Input('kafka-data', 'data'),
+            [State(f'section-{section}', 'data') for section in ReportSummary.SECTIONS]
         )
+        def update_sections(kafka_token, *client_keys):
+            """Publish the section keys of the latest report
+            
+            Only keys that changed are sent, so views built from the other
+            sections are not re-triggered.
+            """
+            kafka_data = self.resolve_latest_report(kafka_token)
+            summary = self.data_loader.get_report_summary(kafka_data)
+            return [
+                dash.no_update if key == client_key else key
+                for key, client_key in zip(
+                    [summary.section_key(section) if kafka_data else None
+                     for section in ReportSummary.SECTIONS],
+                    client_keys
+                )
+            ]
+        
+    def resolve_latest_report(self, token):
+        """Resolve a kafka-data token to the report it stands for"""
+        if not token:
+            return None
+        if token in self.data_store:
+            return self.data_store.get(token)
+        # Token issued before a restart or already expired
+        kind = self.data_store.token_kind(token)
+        cluster = kind.split('/', 1)[1] if '/' in kind else None
+        return self.data_loader.get_latest_report(cluster)
+    
+    @staticmethod
+    def cluster_kind(kind, cluster):
+        """Data store kind for one cluster's data, e.g. latest/prod-east"""
+        return f"{kind}/{cluster}" if cluster else kind
+    
+    def get_cluster_options(self, snapshot):
+        """Cluster selector options from the snapshot's per-cluster index"""
+        options = []
+        for cluster in snapshot.clusters:
+            label = f"{cluster['cluster_id']} ({cluster['vendor']}, {cluster['report_count']} reports)"
+            options.append({'label': label, 'value': cluster['cluster_id']})
+        return options
+    
+    def get_history_store(self):
+        """Open the on-disk trend store once the data directory exists"""
+        if self.history_store is None and os.path.isdir(self.data_dir):
+            try:
+                self.history_store = TieredHistoryStore(self.history_dir)
+            except Exception as e:
+                print(f"Error opening history store: {e}")
+        return self.history_store
+    
+    def on_snapshot_refresh(self, snapshot):
+        """Append metrics of newly seen reports to the trend store
         
+        Runs in the refresher thread; only the trend fields of new reports
+        are parsed. History that aged out of the full-resolution tier is
+        rolled up as well. Push clients are notified once trends include
+        the new reports.
+        """
+        try:
+            history_store = self.get_history_store()
+            if history_store is not None:
+                ingest_trend_metrics(history_store, snapshot.handles)
+                history_store.rollup()
+        finally:
+            if self.push_channel is not None:
+                self.push_channel.publish(snapshot.etag)
+    
+    def get_trend_processor(self, cluster=None):
+        """Trend queries from the history store, or else the report index
+        
+        The history store does not record clusters, so trends of one
+        cluster are read from the loader's per-cluster index when the data
+        directory holds more than one cluster.
+        """
+        if cluster and len(self.refresher.snapshot().clusters) > 1:
+            return HistoricalDataProcessor(loader=self.data_loader, cluster=cluster)
+        return HistoricalDataProcessor(store=self.get_history_store(), loader=self.data_loader)
+    
+    def create_dashboard_content(self):
+        """Create the main dashboard layout; views are filled in by their callbacks"""
         return html.Div([
             # Metrics cards
-            self.layout_components.create_metrics_cards(metrics),
+            html.Div(id="metrics-cards"),
             
             # Charts row 1
             dbc.Row([
@@ -206,6 +396,27 @@ class KafkaDashboard:
                 ], width=12, lg=6)
             ], className="mb-4"),
             
+            # Trends
+            self.layout_components.create_trend_window_selector(
+                "trend-window", list(TREND_WINDOWS), DEFAULT_TREND_WINDOW
+            ),
+            dbc.Row([
+                dbc.Col([
+                    self.layout_components.create_chart_card(
+                        "health-trend-chart",
+                        "Health Score Trend",
+                        "Health score over the selected window"
+                    )
+                ], width=12, lg=6),
+                dbc.Col([
+                    self.layout_components.create_chart_card(
+                        "topics-trend-chart",
+                        "Topics Trend",
+                        "Topic and partition counts over the selected window"
+                    )
+                ], width=12, lg=6)
+            ], className="mb-4"),
+            
             # Health details table
             dbc.Row([
                 dbc.Col([
@@ -213,6 +424,13 @@ class KafkaDashboard:
                 ], width=12)
             ]),
             
+            # Per-topic table
+            dbc.Row([
+                dbc.Col([
+                    self.layout_components.create_topics_table("topics-table")
+                ], width=12)
+            ], className="mt-4"),
+            
             # Hidden divs for charts data
             html.Div(id="chart-data", style={"display": "none"})
         ])
@@ -220,55 +438,216 @@ class KafkaDashboard:
     def create_chart_callbacks(self):
         """Create callbacks for chart updates"""
         
+        # Each view, the report sections it is built from and how to build it
+        views = [
+            (Output('metrics-cards', 'children'), ('brokers', 'topics', 'consumers'),
+             self.create_metrics_content),
+            (Output('health-score-gauge', 'figure'), ('health',),
+             lambda summary: self.chart_builder.create_health_score_gauge(summary.health_score)),
+            (Output('health-checks-summary', 'figure'), ('health',),
+             lambda summary: self.chart_builder.create_health_checks_summary(summary.health_checks)),
+            (Output('topics-distribution', 'figure'), ('topics',),
+             lambda summary: self.chart_builder.create_topics_distribution(summary.topics_summary)),
+            (Output('partitions-chart', 'figure'), ('topics',),
+             lambda summary: self.chart_builder.create_partitions_per_topic(
+                 summary.user_topic_names, summary.user_topic_partitions)),
+            (Output('consumer-groups-chart', 'figure'), ('consumers',),
+             lambda summary: self.chart_builder.create_consumer_groups_chart(summary.consumer_summary)),
+            (Output('replication-factor-chart', 'figure'), ('topics',),
+             lambda summary: self.chart_builder.create_replication_factor_chart(
+                 summary.replication_factor_counts)),
+            (Output('cluster-info', 'children'), ('report', 'brokers', 'partitions'),
+             self.create_cluster_info_content),
+            (Output('health-details-table', 'children'), ('health',),
+             self.create_health_details_table),
+            (Output('topics-table', 'children'), ('topic_rows',),
+             self.create_topics_table_content)
+        ]
+        for output, sections, build in views:
+            self.create_view_callback(output, sections, build)
+        
+        for table_id in PAGED_TABLES:
+            self.create_table_page_callback(table_id)
+        
         @self.app.callback(
-            [Output('health-score-gauge', 'figure'),
-             Output('health-checks-summary', 'figure'),
-             Output('topics-distribution', 'figure'),
-             Output('partitions-chart', 'figure'),
-             Output('consumer-groups-chart', 'figure'),
-             Output('replication-factor-chart', 'figure'),
-             Output('cluster-info', 'children'),
-             Output('health-details-table', 'children')],
-            Input('kafka-data', 'data')
+            [Output('health-trend-chart', 'figure'),
+             Output('topics-trend-chart', 'figure')],
+            [Input('trend-window', 'value'),
+             Input('historical-data', 'data')],
+            State('cluster-selector', 'value')
         )
-        def update_charts(kafka_data):
-            """Update all charts with new data"""
-            if not kafka_data:
-                # Return empty charts
-                empty_fig = go.Figure()
-                empty_content = html.Div("No data available")
-                return (empty_fig, empty_fig, empty_fig, empty_fig, 
-                       empty_fig, empty_fig, empty_content, empty_content)
+        def update_trends(window, history_token, cluster):
+            """Update trend charts for the selected time window"""
+            span, step = TREND_WINDOWS.get(window, TREND_WINDOWS[DEFAULT_TREND_WINDOW])
+            end = datetime.now(timezone.utc)
             
-            # Extract data
-            health_score = self.data_loader.get_health_score(kafka_data)
-            health_data = kafka_data.get('healthChecks', {})
-            topics_summary = self.data_loader.get_topics_summary(kafka_data)
-            topics = kafka_data.get('topics', [])
-            consumer_groups = kafka_data.get('consumerGroups', [])
-            broker_info = self.data_loader.get_broker_info(kafka_data)
+            # New reports change the token; within one step the window
+            # only drops points at its far end
+            params = (window, cluster, int(end.timestamp() // step.total_seconds()))
+            processor = self.get_trend_processor(cluster)
             
-            # Create charts
-            health_gauge = self.chart_builder.create_health_score_gauge(health_score)
-            health_summary = self.chart_builder.create_health_checks_summary(health_data)
-            topics_dist = self.chart_builder.create_topics_distribution(topics_summary)
-            partitions_chart = self.chart_builder.create_partitions_per_topic(topics)
-            consumer_chart = self.chart_builder.create_consumer_groups_chart(consumer_groups)
-            replication_chart = self.chart_builder.create_replication_factor_chart(topics)
+            def build_health_trend():
+                health_trend = processor.get_health_score_trend(end - span, end, step)
+                return self.chart_builder.create_health_score_trend(health_trend)
             
-            # Create cluster info
-            cluster_info = self.create_cluster_info_content(kafka_data, broker_info)
+            def build_topics_trend():
+                topics_trend = processor.get_topics_trend(end - span, end, step)
+                return self.chart_builder.create_topics_trend(topics_trend)
             
-            # Create health details table
-            health_details = self.create_health_details_table(kafka_data)
+            return (
+                self.figure_cache.view(
+                    self.figure_cache.make_key(history_token, 'health-trend-chart', params),
+                    build_health_trend),
+                self.figure_cache.view(
+                    self.figure_cache.make_key(history_token, 'topics-trend-chart', params),
+                    build_topics_trend)
+            )
+    
+    def create_view_callback(self, output, sections, build):
+        """Create a callback that rebuilds one view when its report sections change
+        
+        Serialized views are cached on the keys of those sections, so
+        switching back to a cluster or report seen before, or opening the
+        dashboard in another tab, reuses them as well.
+        """
+        @self.app.callback(
+            output,
+            [Input(f'section-{section}', 'data') for section in sections],
+            State('kafka-data', 'data')
+        )
+        def update_view(*args):
+            kafka_data = self.resolve_latest_report(args[-1])
+            if not kafka_data:
+                if output.component_property == 'figure':
+                    return go.Figure()
+                return html.Div("No data available")
             
-            return (health_gauge, health_summary, topics_dist, partitions_chart,
-                   consumer_chart, replication_chart, cluster_info, health_details)
+            # Memoized per report content, so this is not a fresh walk
+            summary = self.data_loader.get_report_summary(kafka_data)
+            section_keys = tuple(summary.section_key(section) for section in sections)
+            key = self.figure_cache.make_key(section_keys, output.component_id)
+            return self.figure_cache.view(key, lambda: build(summary))
+    
+    def create_table_page_callback(self, table_id):
+        """Create the callback that serves pages of a server-side paged table
+        
+        The view that renders the table already includes its first page,
+        so this only runs when the page, sort order or filter changes.
+        """
+        @self.app.callback(
+            [Output(table_id, 'data'),
+             Output(table_id, 'page_count')],
+            [Input(table_id, 'page_current'),
+             Input(table_id, 'page_size'),
+             Input(table_id, 'sort_by'),
+             Input(table_id, 'filter_query')],
+            State('kafka-data', 'data'),
+            prevent_initial_call=True
+        )
+        def update_table_page(page_current, page_size, sort_by, filter_query, kafka_token):
+            kafka_data = self.resolve_latest_report(kafka_token)
+            if not kafka_data:
+                return [], 1
+            summary = self.data_loader.get_report_summary(kafka_data)
+            return self.page_indexed_table(table_id, summary, page_current, page_size, sort_by, filter_query)
+    
+    def indexed_table_key(self, table_id, summary):
+        sections, _ = PAGED_TABLES[table_id]
+        return (table_id, tuple(summary.section_key(section) for section in sections))
+    
+    def get_indexed_table(self, table_id, summary):
+        """Indexed rows of a paged table for one report, built once per section keys"""
+        key = self.indexed_table_key(table_id, summary)
+        table = self.table_cache.get(key)
+        if table is None:
+            if table_id == 'health-table':
+                table = self.build_health_table(summary)
+            else:
+                table = self.build_topics_table(summary)
+            self.table_cache.put(key, table, table.nbytes)
+        return table
+    
+    def page_indexed_table(self, table_id, summary, page_current=0, page_size=None,
+                           sort_by=None, filter_query=None):
+        """One page of a paged table and the number of pages"""
+        table = self.get_indexed_table(table_id, summary)
+        nbytes = table.nbytes
+        result = table.page(page_current, page_size or PAGED_TABLES[table_id][1], sort_by, filter_query)
+        if table.nbytes != nbytes:
+            # Charge the cache for the ranks and selections the query added or dropped
+            self.table_cache.put(self.indexed_table_key(table_id, summary), table, table.nbytes)
+        return result
+    
+    def build_health_table(self, summary):
+        """Health check rows for the health details table"""
+        return IndexedTable.from_records([
+            {
+                'status': self.get_status_emoji(check.get('status', 'UNKNOWN')),
+                'name': check.get('name', 'Unknown Check'),
+                'message': check.get('message', 'No message'),
+                'recommendation': check.get('recommendation', 'No recommendation')
+            }
+            for check in summary.health_details
+        ], [column['id'] for column in HEALTH_TABLE_COLUMNS])
+    
+    def build_topics_table(self, summary):
+        """Per-topic rows, straight from the summary's topic and partition arrays"""
+        topics = summary.topic_table
+        return IndexedTable({
+            'topic': topics.names,
+            'partitions': topics.partitions,
+            'replication_factor': topics.replication_factor,
+            'under_replicated': summary.under_replicated_by_topic,
+            'internal': np.where(topics.is_internal, 'Yes', 'No')
+        })
+    
+    def create_paged_table(self, table_id, summary, columns):
+        """Create a server-side paged DataTable showing its first page"""
+        _, page_size = PAGED_TABLES[table_id]
+        rows, page_count = self.page_indexed_table(table_id, summary, 0, page_size)
+        return self.layout_components.create_data_table(
+            rows, table_id, columns, page_count=page_count, page_size=page_size
+        )
+    
+    def create_topics_table_content(self, summary):
+        """Create per-topic table"""
+        if not len(summary.topic_table):
+            return html.Div([
+                html.P("No topics in this report", className="text-muted text-center p-4")
+            ])
+        return self.create_paged_table('topics-data-table', summary, TOPICS_TABLE_COLUMNS)
+    
+    def create_metrics_content(self, summary):
+        """Create metrics cards content"""
+        metrics = MetricsCards.create_cluster_metrics(
+            summary.broker_info, summary.topics_summary, summary.consumer_summary
+        )
+        return self.layout_components.create_metrics_cards(metrics)
     
-    def create_cluster_info_content(self, kafka_data, broker_info):
+    def create_cluster_info_content(self, summary):
         """Create cluster information content"""
-        timestamp = kafka_data.get('timestamp', 'Unknown')
-        vendor = kafka_data.get('vendor', 'Unknown')
+        timestamp = summary.timestamp
+        vendor = summary.vendor
+        broker_info = summary.broker_info
+        partition_summary = summary.partition_summary
+        broker_load = partition_summary.get('broker_load', {})
+        
+        partition_health = []
+        if partition_summary:
+            partition_health = [
+                html.P([html.Strong("⚠️ Under-replicated Partitions: "),
+                        str(partition_summary['under_replicated_partitions'])]),
+                html.P([html.Strong("🚫 Offline Partitions: "),
+                        str(partition_summary['offline_partitions'])]),
+                html.P([html.Strong("⚖️ Leader Skew: "), f"{partition_summary['leader_skew']:.2f}"])
+            ]
+        
+        def broker_label(broker):
+            node_id = broker.get('nodeId', 'Unknown')
+            load = broker_load.get(node_id)
+            if load is None:
+                return f"Broker {node_id}"
+            return f"Broker {node_id} · {load['leaders']} leaders / {load['replicas']} replicas"
         
         return html.Div([
             html.P([html.Strong("🏢 Vendor: "), vendor]),
@@ -276,19 +655,19 @@ class KafkaDashboard:
             html.P([html.Strong("👑 Controller: "), str(broker_info.get('controller', 'Unknown'))]),
             html.P([html.Strong("📅 Last Analysis: "), timestamp]),
             html.P([html.Strong("🖥️ Total Brokers: "), str(broker_info.get('total_brokers', 0))]),
+            *partition_health,
             html.Hr(),
             html.H6("📡 Broker Details:"),
             html.Div([
-                dbc.Badge(f"Broker {broker.get('nodeId', 'Unknown')}", 
+                dbc.Badge(broker_label(broker), 
                          color="secondary", className="me-2 mb-2")
                 for broker in broker_info.get('brokers', [])
             ])
         ])
     
-    def create_health_details_table(self, kafka_data):
+    def create_health_details_table(self, summary):
         """Create health details table"""
-        # Extract health check details
-        health_details = self.data_loader.extract_health_checks_details(kafka_data)
+        health_details = summary.health_details
         
         if not health_details:
             return html.Div([
@@ -296,17 +675,8 @@ class KafkaDashboard:
                       className="text-muted text-center p-4")
             ])
         
-        # Process for table display
-        table_data = []
-        for check in health_details:
-            table_data.append({
-                'status': self.get_status_emoji(check.get('status', 'UNKNOWN')),
-                'name': check.get('name', 'Unknown Check'),
-                'message': check.get('message', 'No message'),
-                'recommendation': check.get('recommendation', 'No recommendation')
-            })
-        
-        return self.layout_components.create_data_table(table_data, "health-table")
+        # Rows are paged, sorted and filtered on the server
+        return self.create_paged_table('health-table', summary, HEALTH_TABLE_COLUMNS)
     
     def get_status_emoji(self, status):
         """Get emoji for status"""
@@ -321,6 +691,18 @@ class KafkaDashboard:
         # Register chart callbacks
         self.create_chart_callbacks()
         
+        # Watch the data directory for new reports
+        if self.report_watcher is not None:
+            self.report_watcher.start()
+            print(f"👀 Watching for new reports ({self.report_watcher.mode})")
+        
+        # Keep dashboard data current in the background; push updates are
+        # announced from the refresher thread, so they need it as well
+        if self.background_refresh or self.push_channel is not None:
+            self.refresher.start()
+        if self.push_channel is not None:
+            print(f"📡 Pushing new data to open dashboards ({PUSH_EVENTS_PATH})")
+        
         print(f"🚀 Starting Kafka Dashboard on http://{host}:{port}")
         print(f"📁 Data directory: {os.path.abspath(self.data_dir)}")
         
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Kafka Dashboard Retention
+Roll aging report history up into hourly and daily tiers and optionally delete old reports
+"""
+
+import argparse
+import os
+import sys
+from datetime import timedelta
+
+# Make the dashboard packages importable when run from any directory
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.data_loader import KafkaDataLoader
+from utils.formatting import format_bytes
+from utils.history_store import RetentionPolicy, TieredHistoryStore
+from utils.retention import RetentionManager
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Apply the tiered retention policy to a Kafka analysis directory',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python apply_retention.py                                 # Roll up history older than 7 days
+  python apply_retention.py --delete-originals --dry-run    # Show which reports would be deleted
+  python apply_retention.py --full-days 14 --hourly-days 180 --delete-originals
+        """
+    )
+
+    parser.add_argument('--data-dir',
+                       help='Directory containing Kafka analysis reports')
+    parser.add_argument('--history-dir',
+                       help='History store directory (default: <data-dir>/.history)')
+    parser.add_argument('--backend', choices=['auto', 'parquet', 'sqlite'], default='auto',
+                       help='History store backend (default: auto)')
+    parser.add_argument('--full-days', type=float, default=7,
+                       help='Keep full reports for this many days (default: 7)')
+    parser.add_argument('--hourly-days', type=float, default=90,
+                       help='Keep hourly rollups up to this many days, daily after (default: 90)')
+    parser.add_argument('--delete-originals', action='store_true',
+                       help='Delete reports older than --full-days once their metrics are stored')
+    parser.add_argument('--dry-run', action='store_true',
+                       help='Show what would be done without changing anything')
+
+    args = parser.parse_args()
+
+    if args.data_dir:
+        data_dir = args.data_dir
+    else:
+        from run_dashboard import find_data_directory
+        data_dir = find_data_directory() or "../kafka-analysis"
+
+    if not os.path.isdir(data_dir):
+        print(f"❌ Data directory not found: {os.path.abspath(data_dir)}")
+        sys.exit(1)
+
+    try:
+        policy = RetentionPolicy(full_age=timedelta(days=args.full_days),
+                                 hourly_age=timedelta(days=args.hourly_days),
+                                 delete_originals=args.delete_originals)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    history_dir = args.history_dir or os.path.join(data_dir, ".history")
+    store = TieredHistoryStore(history_dir, policy, backend=args.backend)
+
+    print("🗂️  Kafka Dashboard Retention")
+    print("=" * 40)
+    print(f"📁 Data directory: {os.path.abspath(data_dir)}")
+    print(f"🗄️  History store: {os.path.abspath(history_dir)} ({store.backend_name})")
+    print(f"📐 Full reports {args.full_days:g}d, hourly rollups to {args.hourly_days:g}d, daily after")
+
+    manager = RetentionManager(KafkaDataLoader(data_dir), store)
+    result = manager.apply(dry_run=args.dry_run)
+
+    print(f"\n📊 {result['reports']} report(s), {result['expired']} older than {args.full_days:g} day(s)")
+    if args.dry_run:
+        print(f"🔍 Dry run: {result['ingested']} report(s) would be ingested")
+    else:
+        print(f"✅ Ingested {result['ingested']} report(s)")
+        for tier, count in result['rolled_up'].items():
+            print(f"✅ {count} new {tier} rollup row(s)")
+
+    if args.delete_originals:
+        verb = "would be deleted" if args.dry_run else "deleted"
+        print(f"🗑️  {result['deleted']} report(s) {verb} ({format_bytes(result['freed_bytes'])})")
+
+
+if __name__ == "__main__":
+    main()
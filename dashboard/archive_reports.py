@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Kafka Dashboard Report Archive
+Append reports to the delta-encoded archive, or rebuild a report as of a point in time
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Make the dashboard packages importable when run from any directory
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.data_loader import KafkaDataLoader, read_report_file
+from utils.formatting import format_bytes
+from utils.report_archive import ReportArchive
+
+
+def rebuilds(archive: ReportArchive, report_id: str, report: dict) -> bool:
+    try:
+        return archive.get(report_id) == report
+    except ValueError:
+        return False
+
+
+def restore(archive: ReportArchive, at: str, cluster: str, output: str) -> None:
+    report = archive.reconstruct(at, cluster)
+    if report is None:
+        print(f"❌ No archived report at or before {at}")
+        sys.exit(1)
+
+    cluster_id = report.get('clusterInfo', {}).get('clusterId', 'Unknown')
+    print(f"📄 {cluster_id} report of {report.get('timestamp', 'Unknown')}")
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Written to {output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Archive Kafka analysis reports as deltas with periodic keyframes',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python archive_reports.py --data-dir /path/to/kafka-reports      # Archive new reports
+  python archive_reports.py --keyframe-every 100 --verify         # Longer chains, check each report
+  python archive_reports.py --at 2026-01-31T12:00:00Z --cluster prod --output report.json
+        """
+    )
+
+    parser.add_argument('--data-dir',
+                       help='Directory containing Kafka analysis reports')
+    parser.add_argument('--archive-dir',
+                       help='Archive directory (default: <data-dir>/.archive)')
+    parser.add_argument('--keyframe-every', type=int, default=50,
+                       help='Store a full report every N reports per cluster (default: 50)')
+    parser.add_argument('--verify', action='store_true',
+                       help='Rebuild each newly archived report and compare it with the original')
+    parser.add_argument('--at',
+                       help='Instead of archiving, rebuild the latest report at or before this time')
+    parser.add_argument('--cluster',
+                       help='Cluster id for --at (default: any cluster)')
+    parser.add_argument('--output',
+                       help='Write the report rebuilt with --at to this file')
+
+    args = parser.parse_args()
+
+    if args.data_dir:
+        data_dir = args.data_dir
+    else:
+        from run_dashboard import find_data_directory
+        data_dir = find_data_directory() or "../kafka-analysis"
+
+    archive_dir = args.archive_dir or os.path.join(data_dir, ".archive")
+    archive = ReportArchive(archive_dir, keyframe_interval=args.keyframe_every)
+
+    if args.at:
+        restore(archive, args.at, args.cluster, args.output)
+        return
+
+    if not os.path.isdir(data_dir):
+        print(f"❌ Data directory not found: {os.path.abspath(data_dir)}")
+        sys.exit(1)
+
+    print("🗃️  Kafka Dashboard Report Archive")
+    print("=" * 40)
+    print(f"📁 Data directory: {os.path.abspath(data_dir)}")
+    print(f"🗄️  Archive: {os.path.abspath(archive_dir)} (keyframe every {args.keyframe_every})")
+
+    # Deltas are taken against the previous report, so archive in time order
+    loader = KafkaDataLoader(data_dir)
+    pending = [handle for handle in loader.get_range() if handle.report_id not in archive]
+    print(f"✅ {len(archive)} report(s) already archived, {len(pending)} to go")
+
+    started = time.monotonic()
+    failed = 0
+    for handle in pending:
+        try:
+            report = read_report_file(handle.filepath)
+            entry = archive.append(report, handle.report_id, source_bytes=handle.size)
+            if args.verify and not rebuilds(archive, handle.report_id, report):
+                # Keep the archive free of reports it cannot rebuild
+                archive.rollback(entry)
+                raise ValueError("rebuilt report differs from the original; not archived")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {handle.filename}: {e}")
+
+    stats = archive.stats()
+    elapsed = time.monotonic() - started
+    print(f"\n✅ Archived {len(pending) - failed} report(s) in {elapsed:.1f}s")
+    print(f"💾 {stats['reports']} report(s) of {stats['clusters']} cluster(s): "
+          f"{format_bytes(stats['source_bytes'])} -> {format_bytes(stats['archive_bytes'])} "
+          f"({stats['ratio']:.1f}x, {stats['keyframes']} keyframe(s))")
+    if failed:
+        print(f"⚠️  {failed} report(s) could not be archived")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
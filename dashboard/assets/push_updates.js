@@ -0,0 +1,38 @@
+/*
+ * Server push for the Kafka Dashboard.
+ *
+ * When the dashboard runs with push updates, the hidden #push-trigger button
+ * carries the event stream URL in data-push-url. Each "version" event clicks
+ * the button, which runs update_data; it only sends the views whose data
+ * changed. Interval polling stays active as a fallback.
+ */
+(function () {
+    var source = null;
+
+    function connect(trigger) {
+        var url = trigger.getAttribute('data-push-url');
+        if (!url || source || !window.EventSource) {
+            return;
+        }
+        source = new EventSource(url);
+        source.addEventListener('version', function (event) {
+            var current = document.getElementById('push-trigger');
+            var etag = JSON.parse(event.data).etag;
+            if (current && current.getAttribute('data-etag') !== etag) {
+                current.setAttribute('data-etag', etag);
+                current.click();
+            }
+        });
+        // EventSource reconnects by itself after errors
+    }
+
+    // The button only exists once the Dash layout has rendered
+    var observer = new MutationObserver(function () {
+        var trigger = document.getElementById('push-trigger');
+        if (trigger) {
+            observer.disconnect();
+            connect(trigger);
+        }
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+})();
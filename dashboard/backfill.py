@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Kafka Dashboard Backfill
+Bulk-ingest an existing archive of analysis reports into the trend history store
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List, Any, Tuple
+
+# Make the dashboard packages importable when run from any directory
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.data_loader import KafkaDataLoader, TREND_PROJECTION, report_id
+from utils.history_store import TieredHistoryStore, extract_report_metrics
+
+
+CHECKPOINT_FILE = "backfill-checkpoint.json"
+
+
+def summarize_chunk(data_dir: str, file_paths: List[str], decoder: str,
+                    streaming: bool) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    """Parse a chunk of reports in a worker process
+
+    Returns the extracted metric rows and a map of failed file names to errors.
+    """
+    # Only scalar metrics are extracted: skip building topic arrays and the
+    # deduplicated body cache, which the worker would throw away
+    loader = KafkaDataLoader(data_dir, decoder=decoder, compact_topics=False, deduplicate=False)
+    projection = TREND_PROJECTION if streaming else None
+
+    rows = []
+    failed = {}
+    for file_path in file_paths:
+        try:
+            report = loader.read_report(file_path, os.stat(file_path), projection)
+            metrics = extract_report_metrics(report)
+            if metrics is None:
+                raise ValueError("report has no timestamp")
+            rows.append(metrics)
+        except Exception as e:
+            failed[report_id(file_path)] = str(e)
+
+    return rows, failed
+
+
+def load_checkpoint(path: str) -> Dict[str, Any]:
+    """Load the checkpoint of a previous run, if any"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'failed': {}}
+
+
+def save_checkpoint(path: str, checkpoint: Dict[str, Any]) -> None:
+    """Write the checkpoint atomically"""
+    checkpoint['updated'] = datetime.now().isoformat()
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def print_progress(done: int, total: int, failed: int, started: float) -> None:
+    elapsed = time.monotonic() - started
+    rate = done / elapsed if elapsed > 0 else 0.0
+    eta = (total - done) / rate if rate > 0 else 0.0
+    percent = done / total * 100 if total else 100.0
+    print(f"\r📥 {done}/{total} ({percent:.1f}%)  {rate:.1f} reports/s  "
+          f"❌ {failed} failed  ETA {eta:.0f}s   ", end="", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Backfill the dashboard history store from existing reports',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python backfill.py --data-dir ./reports         # Ingest all reports not yet in the store
+  python backfill.py --workers 16 --chunk-size 32 # Tune parallelism
+  python backfill.py --streaming                  # Bound worker memory on very large reports
+  python backfill.py --retry-failed               # Retry files that failed previously
+        """
+    )
+
+    parser.add_argument('--data-dir',
+                       help='Directory containing Kafka analysis reports')
+    parser.add_argument('--history-dir',
+                       help='History store directory (default: <data-dir>/.history)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                       help='Worker processes (default: number of CPUs)')
+    parser.add_argument('--chunk-size', type=int, default=64,
+                       help='Reports per worker task (default: 64)')
+    parser.add_argument('--flush-every', type=int, default=5000,
+                       help='Rows to buffer before writing to the store and checkpointing (default: 5000)')
+    parser.add_argument('--backend', choices=['auto', 'parquet', 'sqlite'], default='auto',
+                       help='History store backend (default: auto)')
+    parser.add_argument('--decoder', default='auto',
+                       help='JSON decoder: auto, orjson, simdjson or json (default: auto)')
+    parser.add_argument('--streaming', action='store_true',
+                       help='Stream-parse only the trend fields instead of decoding whole reports')
+    parser.add_argument('--retry-failed', action='store_true',
+                       help='Retry files recorded as failed by a previous run')
+
+    args = parser.parse_args()
+
+    if args.data_dir:
+        data_dir = args.data_dir
+    else:
+        from run_dashboard import find_data_directory
+        data_dir = find_data_directory() or "../kafka-analysis"
+
+    if not os.path.isdir(data_dir):
+        print(f"❌ Data directory not found: {os.path.abspath(data_dir)}")
+        sys.exit(1)
+
+    history_dir = args.history_dir or os.path.join(data_dir, ".history")
+    # Tiered, so reports older than the rolled up history mark their buckets for a rebuild
+    store = TieredHistoryStore(history_dir, backend=args.backend)
+    checkpoint_path = os.path.join(history_dir, CHECKPOINT_FILE)
+    checkpoint = load_checkpoint(checkpoint_path)
+    if args.retry_failed:
+        checkpoint['failed'] = {}
+
+    print("🚀 Kafka Dashboard Backfill")
+    print("=" * 40)
+    print(f"📁 Data directory: {os.path.abspath(data_dir)}")
+    print(f"🗄️  History store: {os.path.abspath(history_dir)} ({store.backend_name})")
+
+    # Resume: skip reports already in the store or known to fail
+    loader = KafkaDataLoader(data_dir)
+    pending = [
+        file_path for file_path, _ in loader.get_report_files()
+        if report_id(file_path) not in store
+        and report_id(file_path) not in checkpoint['failed']
+    ]
+    print(f"✅ {len(store)} report(s) already ingested, {len(pending)} to go")
+    if not pending:
+        return
+
+    chunks = [pending[i:i + args.chunk_size] for i in range(0, len(pending), args.chunk_size)]
+    print(f"⚙️  {args.workers} worker(s), {len(chunks)} chunk(s) of up to {args.chunk_size}\n")
+
+    buffered: List[Dict[str, Any]] = []
+    done = 0
+    failed_count = 0
+    started = time.monotonic()
+
+    def flush():
+        store.append_metrics(buffered)
+        buffered.clear()
+        checkpoint['ingested'] = len(store)
+        save_checkpoint(checkpoint_path, checkpoint)
+
+    executor = ProcessPoolExecutor(max_workers=args.workers)
+    try:
+        futures = [
+            executor.submit(summarize_chunk, data_dir, chunk, args.decoder, args.streaming)
+            for chunk in chunks
+        ]
+        for future in as_completed(futures):
+            rows, failed = future.result()
+            buffered.extend(rows)
+            checkpoint['failed'].update(failed)
+            failed_count += len(failed)
+            done += len(rows) + len(failed)
+            print_progress(done, len(pending), failed_count, started)
+
+            if len(buffered) >= args.flush_every:
+                flush()
+
+        flush()
+        executor.shutdown()
+    except KeyboardInterrupt:
+        executor.shutdown(wait=False, cancel_futures=True)
+        flush()
+        print(f"\n\n⏸️  Interrupted after {done} report(s); run again to resume")
+        sys.exit(130)
+
+    store.compact()
+    elapsed = time.monotonic() - started
+    print(f"\n\n✅ Ingested {done - failed_count} report(s) in {elapsed:.1f}s")
+    if failed_count:
+        print(f"⚠️  {failed_count} report(s) failed; see {checkpoint_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Report decoding micro-benchmark
+Measures MB/s of each available JSON decoding backend on report-sized files
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Make the dashboard packages importable when run from any directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_loader import JSON_DECODERS, SUMMARY_PROJECTION, read_report_file
+from utils.json_stream import load_projected
+from benchmarks.fixtures import build_report, topics_for_size
+
+
+def read_text_json(file_path: str):
+    """Baseline: the original text-mode json.load path"""
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+
+def time_backend(fn, file_path: str, repeat: int) -> float:
+    """Return the best wall time over ``repeat`` runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(file_path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark report decoding backends')
+    parser.add_argument('--sizes-mb', type=float, nargs='+', default=[1, 10, 50],
+                       help='Synthetic fixture sizes in MB (default: 1 10 50)')
+    parser.add_argument('--files', nargs='*', default=[],
+                       help='Existing report files to benchmark instead of fixtures')
+    parser.add_argument('--repeat', type=int, default=3,
+                       help='Runs per backend; the best time is reported (default: 3)')
+    parser.add_argument('--projection', action='store_true',
+                       help='Also benchmark streaming parsing with SUMMARY_PROJECTION')
+    args = parser.parse_args()
+
+    backends = [('json.load (text)', read_text_json)]
+    for name in JSON_DECODERS:
+        backends.append((f"mmap + {name}", lambda path, name=name: read_report_file(path, name)))
+    if args.projection:
+        backends.append(('stream projection', lambda path: load_projected(path, SUMMARY_PROJECTION)))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        files = list(args.files)
+        if not files:
+            for size_mb in args.sizes_mb:
+                path = os.path.join(tmp_dir, f"kafka-analysis-{int(size_mb * 1000)}.json")
+                print(f"📝 Building ~{size_mb:g} MB fixture...")
+                with open(path, 'w') as f:
+                    json.dump(build_report(topics_for_size(size_mb)), f, indent=2)
+                files.append(path)
+
+        print()
+        print(f"{'File':<36} {'Size MB':>8}  {'Backend':<20} {'Seconds':>8} {'MB/s':>8}")
+        print("-" * 86)
+        for path in files:
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+            for name, fn in backends:
+                seconds = time_backend(fn, path, args.repeat)
+                print(f"{os.path.basename(path):<36} {size_mb:>8.1f}  {name:<20} "
+                      f"{seconds:>8.3f} {size_mb / seconds:>8.1f}")
+            print()
+
+
+if __name__ == "__main__":
+    main()
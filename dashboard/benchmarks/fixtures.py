@@ -0,0 +1,122 @@
+"""
+Benchmark fixtures for Kafka Dashboard
+Builds synthetic analysis reports shaped like the analyzer's JSON output
+"""
+
+import json
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any
+
+
+DEFAULT_TOPIC_CONFIG = {
+    'cleanup.policy': 'delete',
+    'compression.type': 'producer',
+    'max.message.bytes': '1048588',
+    'min.insync.replicas': '1',
+    'retention.bytes': '-1',
+    'retention.ms': '604800000',
+    'segment.bytes': '1073741824',
+    'segment.ms': '604800000'
+}
+
+
+def build_report(num_topics: int, num_groups: int = 50, num_brokers: int = 3,
+                 timestamp: datetime = None, cluster_id: str = "bench-cluster",
+                 seed: int = 0) -> Dict[str, Any]:
+    """Build a report with the same structure as the analyzer's saveJson output"""
+    rng = random.Random(seed)
+    timestamp = timestamp or datetime.now(timezone.utc)
+
+    topics: List[Dict[str, Any]] = []
+    for i in range(num_topics):
+        name = f"__internal-{i}" if i < 2 else f"orders.events.topic-{i:06d}"
+        partitions = rng.choice([1, 3, 6, 12, 24, 48])
+        replication_factor = min(rng.choice([1, 2, 3]), num_brokers)
+        topics.append({
+            'name': name,
+            'partitions': partitions,
+            'replicationFactor': replication_factor,
+            'config': {
+                key: {'value': value, 'isDefault': True, 'isSensitive': False}
+                for key, value in DEFAULT_TOPIC_CONFIG.items()
+            },
+            'isInternal': name.startswith('__'),
+            'errorCode': 0,
+            'errorMessage': None,
+            'vendor': 'apache',
+            'partitionDetails': [
+                {
+                    'id': p,
+                    'leader': (i + p) % num_brokers,
+                    'replicas': [(i + p + r) % num_brokers for r in range(replication_factor)],
+                    'isr': [(i + p + r) % num_brokers for r in range(replication_factor)]
+                }
+                for p in range(partitions)
+            ]
+        })
+
+    consumer_groups = [
+        {'groupId': f"service-{g:04d}", 'protocolType': 'consumer',
+         'state': 'Stable' if g % 3 else 'Empty', 'members': 0 if g % 3 == 0 else rng.randint(1, 8)}
+        for g in range(num_groups)
+    ]
+
+    return {
+        'clusterInfo': {
+            'clusterId': cluster_id,
+            'controller': 0,
+            'brokers': [{'nodeId': b, 'host': f"broker-{b}", 'port': 9092} for b in range(num_brokers)]
+        },
+        'topics': topics,
+        'consumerGroups': consumer_groups,
+        'summary': {
+            'totalTopics': len(topics),
+            'totalPartitions': sum(t['partitions'] for t in topics),
+            'internalTopics': sum(1 for t in topics if t['isInternal']),
+            'userTopics': sum(1 for t in topics if not t['isInternal']),
+            'topicsWithErrors': 0,
+            'consumerGroups': len(consumer_groups)
+        },
+        'timestamp': timestamp.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+        'healthChecks': {
+            'vendor': 'apache',
+            'totalChecks': 10,
+            'passedChecks': 8,
+            'failedChecks': 2,
+            'checks': [
+                {'name': f"Check {c}", 'status': 'PASSED' if c < 8 else 'FAILED',
+                 'description': 'Synthetic benchmark check', 'recommendation': 'None'}
+                for c in range(10)
+            ]
+        }
+    }
+
+
+def topics_for_size(target_mb: float) -> int:
+    """Estimate the topic count that yields a pretty-printed report of about target_mb"""
+    sample = json.dumps(build_report(200), indent=2)
+    return max(1, int(target_mb * 1024 * 1024 / (len(sample) / 200)))
+
+
+def write_report(report: Dict[str, Any], directory: str, epoch_ms: int) -> str:
+    """Write a report the way file-service.js saveJson does and set its mtime"""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"kafka-analysis-{epoch_ms}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    os.utime(path, ns=(epoch_ms * 1_000_000, epoch_ms * 1_000_000))
+    return path
+
+
+def write_history(directory: str, num_reports: int, num_topics: int,
+                  interval: timedelta = timedelta(minutes=5)) -> List[str]:
+    """Write a series of periodic reports ending now"""
+    end = datetime.now(timezone.utc)
+    paths = []
+    for i in range(num_reports):
+        timestamp = end - interval * (num_reports - 1 - i)
+        report = build_report(num_topics, timestamp=timestamp, seed=i)
+        paths.append(write_report(report, directory, int(timestamp.timestamp() * 1000)))
+    return paths
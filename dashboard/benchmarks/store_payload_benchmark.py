@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Data store payload benchmark
+Compares the update_data response size of full-report dcc.Store payloads
+with server-side version tokens
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Make the dashboard packages importable when run from any directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plotly.io.json import to_json_plotly
+
+from utils.data_loader import KafkaDataLoader
+from utils.server_store import ServerDataStore
+from benchmarks.fixtures import write_history
+
+
+TICKS_PER_HOUR = 3600 // 30
+
+
+def measure(payload) -> tuple:
+    """Serialize a callback response the way Dash does; return (bytes, seconds)"""
+    start = time.perf_counter()
+    body = to_json_plotly({'response': payload})
+    return len(body.encode('utf-8')), time.perf_counter() - start
+
+
+def format_bytes(size: float) -> str:
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare dcc.Store payload sizes before and after server-side storage')
+    parser.add_argument('--data-dir', help='Existing directory of analysis reports')
+    parser.add_argument('--reports', type=int, default=288,
+                       help='Synthetic reports to generate (default: 288, one day at 5 minutes)')
+    parser.add_argument('--topics', type=int, default=200,
+                       help='Topics per synthetic report (default: 200)')
+    parser.add_argument('--viewers', type=int, default=1,
+                       help='Open dashboard tabs to extrapolate for (default: 1)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = args.data_dir
+        if not data_dir:
+            print(f"📝 Writing {args.reports} reports with {args.topics} topics each...")
+            write_history(tmp_dir, args.reports, args.topics)
+            data_dir = tmp_dir
+
+        loader = KafkaDataLoader(data_dir)
+        version = loader.check_for_updates()
+        latest = loader.get_latest_report()
+        all_reports = loader.get_all_reports()
+        current_time = time.strftime("%Y-%m-%d %H:%M:%S")
+
+        # Before: both stores carried the full data
+        before_payload = {
+            'kafka-data': {'data': latest},
+            'historical-data': {'data': all_reports},
+            'last-updated': {'children': current_time}
+        }
+
+        # After: stores carry tokens resolved on the server
+        store = ServerDataStore()
+        after_payload = {
+            'kafka-data': {'data': store.put('latest', version, latest)},
+            'historical-data': {'data': store.put('history', version, loader.get_report_handles())},
+            'last-updated': {'children': current_time},
+            'data-version': {'data': version}
+        }
+
+        before_bytes, before_seconds = measure(before_payload)
+        after_bytes, after_seconds = measure(after_payload)
+
+    print()
+    print(f"Reports: {len(all_reports)}   Viewers: {args.viewers}")
+    print(f"{'':<22} {'Per tick':>12} {'Per hour':>12} {'Serialize':>11}")
+    print("-" * 60)
+    for label, size, seconds in [('Full payload (before)', before_bytes, before_seconds),
+                                 ('Tokens (after)', after_bytes, after_seconds)]:
+        print(f"{label:<22} {format_bytes(size * args.viewers):>12} "
+              f"{format_bytes(size * args.viewers * TICKS_PER_HOUR):>12} {seconds * 1000:>9.1f}ms")
+    print()
+    print(f"📉 Payload reduced {before_bytes / after_bytes:,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
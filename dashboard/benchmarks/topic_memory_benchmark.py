@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Topic table memory benchmark
+Compares the resident memory of cached topic lists with TopicTable arrays
+and their shared, interned names and config maps
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+# Make the dashboard packages importable when run from any directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.topic_table import NameInterner, TopicTable
+from benchmarks.fixtures import build_report
+
+
+TABLE_FIELDS = ['name', 'partitions', 'replicationFactor', 'isInternal', 'errorCode']
+
+
+def traced(build):
+    """Return (result, bytes allocated and still held by result)"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def format_bytes(size: float) -> str:
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare cached topic memory: dict lists vs TopicTable')
+    parser.add_argument('--reports', type=int, default=200,
+                       help='Reports of the same cluster to keep in memory (default: 200)')
+    parser.add_argument('--topics', type=int, default=2000,
+                       help='Topics per report (default: 2000)')
+    args = parser.parse_args()
+
+    # Each report is decoded separately, as the loader would, so nothing is shared
+    encoded = json.dumps(build_report(args.topics)['topics'])
+    print(f"📊 {args.reports} reports x {args.topics} topics\n")
+
+    full, full_bytes = traced(lambda: [json.loads(encoded) for _ in range(args.reports)])
+    del full
+
+    projected, projected_bytes = traced(lambda: [
+        [{field: topic[field] for field in TABLE_FIELDS} for topic in json.loads(encoded)]
+        for _ in range(args.reports)
+    ])
+    del projected
+
+    interner = NameInterner()
+    tables, table_bytes = traced(lambda: [
+        TopicTable.from_topics(json.loads(encoded), interner) for _ in range(args.reports)
+    ])
+
+    print(f"{'representation':<32}{'resident':>12}{'per topic':>12}{'vs table':>10}")
+    total_topics = args.reports * args.topics
+    for label, size in [("decoded topic dicts (full)", full_bytes),
+                        ("decoded topic dicts (5 fields)", projected_bytes),
+                        ("TopicTable + shared names/configs", table_bytes)]:
+        print(f"{label:<32}{format_bytes(size):>12}{size / total_topics:>10.1f} B"
+              f"{size / table_bytes:>9.1f}x")
+
+    print(f"\n🔤 {len(interner)} distinct names interned; "
+          f"{format_bytes(sum(table.nbytes for table in tables))} of arrays")
+
+
+if __name__ == "__main__":
+    main()
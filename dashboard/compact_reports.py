@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Kafka Dashboard Report Compaction
+Compress analysis reports older than a given age in place
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Make the dashboard packages importable when run from any directory
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.compression import compress_file, compression_suffix, zstandard
+from utils.data_loader import KafkaDataLoader
+from utils.formatting import format_bytes
+
+
+CODEC_SUFFIXES = {
+    'gz': '.gz',
+    'zst': '.zst',
+    'bz2': '.bz2'
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compress old Kafka analysis reports in place',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python compact_reports.py --older-than-days 7             # gzip reports older than a week
+  python compact_reports.py --older-than-days 30 --codec zst # Use zstd (requires zstandard)
+  python compact_reports.py --older-than-days 7 --dry-run   # Show what would be compressed
+        """
+    )
+
+    parser.add_argument('--data-dir',
+                       help='Directory containing Kafka analysis reports')
+    parser.add_argument('--older-than-days', type=float, required=True,
+                       help='Only compress reports last modified more than this many days ago')
+    parser.add_argument('--codec', choices=sorted(CODEC_SUFFIXES), default='gz',
+                       help='Compression codec (default: gz)')
+    parser.add_argument('--level', type=int,
+                       help='Compression level (default: codec specific)')
+    parser.add_argument('--dry-run', action='store_true',
+                       help='List the reports that would be compressed without changing them')
+
+    args = parser.parse_args()
+
+    if args.data_dir:
+        data_dir = args.data_dir
+    else:
+        from run_dashboard import find_data_directory
+        data_dir = find_data_directory() or "../kafka-analysis"
+
+    if not os.path.isdir(data_dir):
+        print(f"❌ Data directory not found: {os.path.abspath(data_dir)}")
+        sys.exit(1)
+
+    if args.codec == 'zst' and zstandard is None:
+        print("❌ zstandard is not installed; run: pip install zstandard")
+        sys.exit(1)
+
+    suffix = CODEC_SUFFIXES[args.codec]
+    cutoff_ns = time.time_ns() - int(args.older_than_days * 86400 * 1e9)
+
+    print("🗜️  Kafka Dashboard Report Compaction")
+    print("=" * 40)
+    print(f"📁 Data directory: {os.path.abspath(data_dir)}")
+
+    loader = KafkaDataLoader(data_dir)
+    candidates = [
+        (file_path, stat) for file_path, stat in loader.get_report_files()
+        if not compression_suffix(file_path) and stat.st_mtime_ns < cutoff_ns
+    ]
+    print(f"📊 {len(candidates)} uncompressed report(s) older than {args.older_than_days:g} day(s)")
+    if not candidates:
+        return
+
+    if args.dry_run:
+        for file_path, stat in candidates:
+            print(f"   {os.path.basename(file_path)} ({format_bytes(stat.st_size)})")
+        print(f"\n🔍 Dry run: {format_bytes(sum(stat.st_size for _, stat in candidates))} would be compressed")
+        return
+
+    bytes_before = 0
+    bytes_after = 0
+    failed = 0
+    for file_path, stat in candidates:
+        try:
+            compressed_path = compress_file(file_path, suffix, args.level)
+        except Exception as e:
+            failed += 1
+            print(f"❌ {os.path.basename(file_path)}: {e}")
+            continue
+        bytes_before += stat.st_size
+        bytes_after += os.path.getsize(compressed_path)
+        print(f"✅ {os.path.basename(compressed_path)}")
+
+    saved = bytes_before - bytes_after
+    ratio = bytes_before / bytes_after if bytes_after else 0.0
+    print(f"\n💾 {format_bytes(bytes_before)} -> {format_bytes(bytes_after)} "
+          f"(saved {format_bytes(saved)}, {ratio:.1f}x)")
+    if failed:
+        print(f"⚠️  {failed} report(s) could not be compressed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -134,13 +134,10 @@ class ChartBuilder:
         return fig
     
     @staticmethod
-    def create_partitions_per_topic(topics: List[Dict[str, Any]]) -> go.Figure:
-        """Create partitions per topic bar chart"""
+    def create_partitions_per_topic(topic_names: List[str], partition_counts: List[int]) -> go.Figure:
+        """Create partitions per topic bar chart for user topics"""
         
-        # Filter out internal topics and prepare data
-        user_topics = [t for t in topics if not t.get('isInternal', False)]
-        
-        if not user_topics:
+        if not topic_names:
             # Create empty chart
             fig = go.Figure()
             fig.add_annotation(
@@ -150,9 +147,6 @@ class ChartBuilder:
                 font={'size': 16, 'color': '#6c757d'}
             )
         else:
-            topic_names = [t['name'] for t in user_topics]
-            partition_counts = [t.get('partitions', 0) for t in user_topics]
-            
             fig = go.Figure(data=[
                 go.Bar(
                     x=topic_names,
@@ -179,10 +173,10 @@ class ChartBuilder:
         return fig
     
     @staticmethod
-    def create_consumer_groups_chart(consumer_groups: List[Dict[str, Any]]) -> go.Figure:
+    def create_consumer_groups_chart(consumer_summary: Dict[str, Any]) -> go.Figure:
         """Create consumer groups status chart"""
         
-        if not consumer_groups:
+        if not consumer_summary.get('total_groups', 0):
             fig = go.Figure()
             fig.add_annotation(
                 text="No consumer groups found",
@@ -193,12 +187,8 @@ class ChartBuilder:
             fig.update_layout(height=350, title="Consumer Groups Status")
             return fig
         
-        # Count groups by status
-        active_count = sum(1 for cg in consumer_groups if cg.get('members', 0) > 0)
-        inactive_count = len(consumer_groups) - active_count
-        
         labels = ['Active', 'Inactive']
-        values = [active_count, inactive_count]
+        values = [consumer_summary.get('active_groups', 0), consumer_summary.get('inactive_groups', 0)]
         colors = ['#28a745', '#ffc107']
         
         fig = go.Figure(data=[
@@ -221,10 +211,10 @@ class ChartBuilder:
         return fig
     
     @staticmethod
-    def create_replication_factor_chart(topics: List[Dict[str, Any]]) -> go.Figure:
-        """Create replication factor distribution chart"""
+    def create_replication_factor_chart(rf_counts: Dict[int, int]) -> go.Figure:
+        """Create replication factor distribution chart from topic counts per RF"""
         
-        if not topics:
+        if not rf_counts:
             fig = go.Figure()
             fig.add_annotation(
                 text="No topics found",
@@ -235,12 +225,6 @@ class ChartBuilder:
             fig.update_layout(height=350, title="Replication Factor Distribution")
             return fig
         
-        # Count topics by replication factor
-        rf_counts = {}
-        for topic in topics:
-            rf = topic.get('replicationFactor', 1)
-            rf_counts[rf] = rf_counts.get(rf, 0) + 1
-        
         rfs = list(rf_counts.keys())
         counts = list(rf_counts.values())
         
@@ -319,6 +303,57 @@ class ChartBuilder:
         
         return fig
 
+    
+    @staticmethod
+    def create_topics_trend(trend_df: pd.DataFrame) -> go.Figure:
+        """Create topics and partitions trend line chart"""
+        
+        if trend_df.empty:
+            fig = go.Figure()
+            fig.add_annotation(
+                text="No historical data available",
+                xref="paper", yref="paper",
+                x=0.5, y=0.5, showarrow=False,
+                font={'size': 16, 'color': '#6c757d'}
+            )
+            fig.update_layout(height=350, title="Topics Trend")
+            return fig
+        
+        fig = make_subplots(specs=[[{"secondary_y": True}]])
+        
+        fig.add_trace(go.Scatter(
+            x=trend_df['timestamp'],
+            y=trend_df['total_topics'],
+            mode='lines+markers',
+            name='Topics',
+            line=dict(color='#007bff', width=3),
+            hovertemplate='<b>Topics</b><br>Date: %{x}<br>Count: %{y}<extra></extra>'
+        ), secondary_y=False)
+        
+        fig.add_trace(go.Scatter(
+            x=trend_df['timestamp'],
+            y=trend_df['total_partitions'],
+            mode='lines+markers',
+            name='Partitions',
+            line=dict(color='#17a2b8', width=3, dash='dot'),
+            hovertemplate='<b>Partitions</b><br>Date: %{x}<br>Count: %{y}<extra></extra>'
+        ), secondary_y=True)
+        
+        fig.update_layout(
+            title="Topics Trend",
+            xaxis_title="Time",
+            height=350,
+            font={'family': "Inter, Arial"},
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            xaxis={'gridcolor': '#e0e0e0'},
+            legend={'orientation': 'h', 'y': -0.2}
+        )
+        fig.update_yaxes(title_text="Topics", gridcolor='#e0e0e0', secondary_y=False)
+        fig.update_yaxes(title_text="Partitions", showgrid=False, secondary_y=True)
+        
+        return fig
+
 
 class MetricsCards:
     """Helper class for creating metric cards data"""
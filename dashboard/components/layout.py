@@ -5,7 +5,23 @@ Contains reusable UI components and layouts
 
 import dash_bootstrap_components as dbc
 from dash import html, dcc, dash_table
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+
+HEALTH_TABLE_COLUMNS = [
+    {"name": "Status", "id": "status", "type": "text"},
+    {"name": "Health Check", "id": "name", "type": "text"},
+    {"name": "Message", "id": "message", "type": "text"},
+    {"name": "Recommendation", "id": "recommendation", "type": "text"}
+]
+
+TOPICS_TABLE_COLUMNS = [
+    {"name": "Topic", "id": "topic", "type": "text"},
+    {"name": "Partitions", "id": "partitions", "type": "numeric"},
+    {"name": "Replication Factor", "id": "replication_factor", "type": "numeric"},
+    {"name": "Under-replicated", "id": "under_replicated", "type": "numeric"},
+    {"name": "Internal", "id": "internal", "type": "text"}
+]
 
 
 class LayoutComponents:
@@ -70,6 +86,27 @@ class LayoutComponents:
             ])
         ], className="shadow-sm h-100")
     
+    @staticmethod
+    def create_trend_window_selector(selector_id: str, windows: List[str], default: str) -> dbc.Row:
+        """Create the time window selector for trend charts"""
+        return dbc.Row([
+            dbc.Col([
+                html.H5("📈 Trends", className="mb-0")
+            ], width="auto"),
+            dbc.Col([
+                dbc.RadioItems(
+                    id=selector_id,
+                    options=[{'label': window, 'value': window} for window in windows],
+                    value=default,
+                    inline=True,
+                    className="btn-group",
+                    inputClassName="btn-check",
+                    labelClassName="btn btn-outline-primary btn-sm",
+                    labelCheckedClassName="active"
+                )
+            ], width="auto", className="ms-auto")
+        ], className="mb-3 align-items-center")
+    
     @staticmethod
     def create_health_details_table(table_id: str) -> dbc.Card:
         """Create health details table card"""
@@ -83,6 +120,19 @@ class LayoutComponents:
             ])
         ], className="shadow-sm")
     
+    @staticmethod
+    def create_topics_table(table_id: str) -> dbc.Card:
+        """Create per-topic table card"""
+        return dbc.Card([
+            dbc.CardHeader([
+                html.H5("📋 Topics", className="mb-0"),
+                html.Small("Every topic of the report; sort and filter run on the server", className="text-muted")
+            ]),
+            dbc.CardBody([
+                html.Div(id=table_id)
+            ])
+        ], className="shadow-sm")
+    
     @staticmethod
     def create_cluster_info_card(info_id: str) -> dbc.Card:
         """Create cluster information card"""
@@ -113,19 +163,36 @@ class LayoutComponents:
         ], color=config['color'], className="me-2")
     
     @staticmethod
-    def create_data_table(data: List[Dict[str, Any]], table_id: str) -> dash_table.DataTable:
-        """Create a styled data table"""
+    def create_data_table(data: List[Dict[str, Any]], table_id: str,
+                          columns: Optional[List[Dict[str, Any]]] = None,
+                          page_count: Optional[int] = None, page_size: int = 15) -> dash_table.DataTable:
+        """Create a styled data table
+        
+        With a ``page_count`` the table is in custom mode: ``data`` is only
+        the first page, and paging, sorting and filtering are done by a
+        server-side callback that fills in ``data`` and ``page_count``.
+        """
         if not data:
             return html.Div([
                 html.P("No data available", className="text-muted text-center p-4")
             ])
         
-        columns = [
-            {"name": "Status", "id": "status", "type": "text"},
-            {"name": "Health Check", "id": "name", "type": "text"},
-            {"name": "Message", "id": "message", "type": "text"},
-            {"name": "Recommendation", "id": "recommendation", "type": "text"}
-        ]
+        if columns is None:
+            columns = HEALTH_TABLE_COLUMNS
+        
+        if page_count is not None:
+            table_mode = dict(
+                page_action="custom",
+                sort_action="custom",
+                filter_action="custom",
+                sort_mode="multi",
+                page_current=0,
+                page_count=page_count,
+                sort_by=[],
+                filter_query=""
+            )
+        else:
+            table_mode = dict(sort_action="native", filter_action="native")
         
         return dash_table.DataTable(
             id=table_id,
@@ -171,10 +238,9 @@ class LayoutComponents:
                     'color': 'black',
                 }
             ],
-            page_size=15,
-            sort_action="native",
-            filter_action="native",
-            style_table={'overflowX': 'auto'}
+            page_size=page_size,
+            style_table={'overflowX': 'auto'},
+            **table_mode
         )
     
     @staticmethod
@@ -228,6 +294,15 @@ class LayoutComponents:
                     )
                 ])
             ], width="auto"),
+            dbc.Col([
+                dcc.Dropdown(
+                    id="cluster-selector",
+                    options=[],
+                    placeholder="Latest report (all clusters)",
+                    clearable=True,
+                    style={"minWidth": "280px"}
+                )
+            ], width="auto"),
             dbc.Col([
                 html.Div([
                     html.Small("Last updated: ", className="text-muted"),
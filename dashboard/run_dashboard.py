@@ -60,9 +60,11 @@ def check_analysis_files(data_dir):
     if not data_dir or not os.path.exists(data_dir):
         return False, []
     
+    from utils.data_loader import KafkaDataLoader
+    
     json_files = []
     for file in os.listdir(data_dir):
-        if file.startswith('kafka-analysis-') and file.endswith('.json'):
+        if KafkaDataLoader.is_report_file(file):
             json_files.append(file)
     
     return len(json_files) > 0, json_files
@@ -91,6 +93,7 @@ Examples:
   python run_dashboard.py                          # Run with auto-detected data directory
   python run_dashboard.py --data-dir ./reports    # Use custom data directory
   python run_dashboard.py --port 8080             # Run on different port
+  python run_dashboard.py --push                  # Push new reports to open dashboards
   python run_dashboard.py --install               # Install dependencies first
         """
     )
@@ -105,6 +108,12 @@ Examples:
                        help='Run in debug mode')
     parser.add_argument('--install', action='store_true',
                        help='Install required dependencies first')
+    parser.add_argument('--no-watch', action='store_true',
+                       help='Disable filesystem watching and rescan on every refresh')
+    parser.add_argument('--no-background-refresh', action='store_true',
+                       help='Load reports in the request thread instead of a background refresher')
+    parser.add_argument('--push', action='store_true',
+                       help='Notify open dashboards of new reports over Server-Sent Events')
     
     args = parser.parse_args()
     
@@ -162,7 +171,9 @@ Examples:
         # Import and run dashboard
         from app import KafkaDashboard
         
-        dashboard = KafkaDashboard(data_dir=data_dir)
+        dashboard = KafkaDashboard(data_dir=data_dir, watch_reports=not args.no_watch,
+                                   background_refresh=not args.no_background_refresh,
+                                   push_updates=args.push)
         dashboard.run(debug=args.debug, port=args.port, host=args.host)
         
     except KeyboardInterrupt:
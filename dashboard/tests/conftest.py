@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make the dashboard packages importable, as the scripts do
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
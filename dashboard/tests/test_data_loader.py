@@ -0,0 +1,51 @@
+import gzip
+import json
+import os
+
+from utils.data_loader import KafkaDataLoader, _hash_stream_without_timestamp, report_body_hash
+
+
+def write_reports(data_dir, count, num_topics=200):
+    for index in range(count):
+        report = {
+            'timestamp': f"2026-10-01T00:{index:02d}:00Z",
+            'clusterInfo': {'clusterId': 'prod', 'brokers': [{'nodeId': 1}]},
+            'topics': [{'name': f"topic-{index}-{i}", 'partitions': 3, 'replicationFactor': 1}
+                       for i in range(num_topics)]
+        }
+        with open(os.path.join(data_dir, f"kafka-analysis-{1790000000000 + index}.json"), 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+def test_loaded_reports_are_held_by_the_body_cache_only(tmp_path):
+    write_reports(str(tmp_path), 10)
+    size = os.path.getsize(os.path.join(str(tmp_path), "kafka-analysis-1790000000000.json"))
+    loader = KafkaDataLoader(str(tmp_path), body_cache_bytes=size * 3 * 2)
+
+    for file_path, _ in loader.get_report_files():
+        loader.add_report_file(file_path)
+
+    stats = loader.get_body_cache_stats()
+    assert stats['entries'] == 2
+    assert stats['bytes'] <= size * 3 * 2
+
+    # Evicted reports are parsed again on their next use
+    first_path, first_stat = loader.get_report_files()[0]
+    misses = loader.get_cache_stats()['misses']
+    assert loader._load_report(first_path, first_stat)['timestamp'] == "2026-10-01T00:00:00Z"
+    assert loader.get_cache_stats()['misses'] == misses + 1
+
+
+def test_compressed_body_hash_matches_the_plain_file(tmp_path):
+    write_reports(str(tmp_path), 1, num_topics=50)
+    plain = os.path.join(str(tmp_path), "kafka-analysis-1790000000000.json")
+    with open(plain, 'rb') as f, gzip.open(plain + '.gz', 'wb') as compressed:
+        compressed.write(f.read())
+
+    expected = report_body_hash(plain)
+    assert expected[0] is not None
+    assert report_body_hash(plain + '.gz') == expected
+    # Chunk boundaries inside the timestamp field
+    for chunk_size in (7, 64, 1000):
+        with gzip.open(plain + '.gz', 'rb') as f:
+            assert _hash_stream_without_timestamp(f, chunk_size) == expected
@@ -0,0 +1,23 @@
+import numpy as np
+import plotly.graph_objects as go
+
+from utils.figure_cache import FigureCache
+
+
+def test_view_builds_once_and_returns_plain_json_data():
+    cache = FigureCache()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return go.Figure(go.Bar(x=np.arange(3), y=np.array([1.5, 2.0, 0.5])))
+
+    key = cache.make_key(('report', 1), 'partitions-chart')
+    first = cache.view(key, build)
+    second = cache.view(key, build)
+
+    assert len(builds) == 1
+    assert second is first
+    assert first['data'][0]['y'] == [1.5, 2.0, 0.5]
+    assert go.Figure(first).data[0].type == 'bar'
+    assert cache.get_stats()['hits'] == 1
@@ -0,0 +1,110 @@
+import os
+from datetime import timedelta
+
+import pytest
+
+from utils.history_store import (
+    HistoryStore, METRIC_COLUMNS, PYARROW_AVAILABLE, ParquetHistoryBackend, RetentionPolicy, TieredHistoryStore
+)
+
+
+HOUR_MS = 60 * 60 * 1000
+START_MS = 1_790_000_000_000
+
+
+def metric_row(index, timestamp=None):
+    row = {column: index for column in METRIC_COLUMNS}
+    row['health_score'] = float(index % 100)
+    row['report_id'] = f"report-{index}"
+    row['timestamp'] = START_MS + index * HOUR_MS if timestamp is None else timestamp
+    return row
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow is not installed")
+def test_parquet_compaction_after_restart_keeps_rows(tmp_path):
+    store_dir = str(tmp_path / "history")
+
+    store = HistoryStore(store_dir, backend="parquet")
+    for index in range(ParquetHistoryBackend.COMPACT_THRESHOLD):
+        store.append_metrics([metric_row(index)])
+    assert len([name for name in os.listdir(store_dir) if name.endswith('.parquet')]) == 1
+
+    # A new process numbers its parts after the compacted one
+    store = HistoryStore(store_dir, backend="parquet")
+    for index in range(64, 64 + ParquetHistoryBackend.COMPACT_THRESHOLD - 1):
+        store.append_metrics([metric_row(index)])
+
+    store = HistoryStore(store_dir, backend="parquet")
+    assert len(store) == 127
+    assert len(store.query(['health_score'])) == 127
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow is not installed")
+def test_parquet_writers_sharing_a_store_do_not_collide(tmp_path):
+    store_dir = str(tmp_path / "history")
+    dashboard = HistoryStore(store_dir, backend="parquet")
+    backfill = HistoryStore(store_dir, backend="parquet")
+
+    for index in range(100):
+        (dashboard if index % 2 else backfill).append_metrics([metric_row(index)])
+
+    assert len(HistoryStore(store_dir, backend="parquet").query(['total_topics'])) == 100
+
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow is not installed")
+def test_parquet_writers_sharing_a_store_store_each_report_once(tmp_path):
+    store_dir = str(tmp_path / "history")
+    dashboard = HistoryStore(store_dir, backend="parquet")
+    backfill = HistoryStore(store_dir, backend="parquet")
+
+    assert dashboard.append_metrics([metric_row(index) for index in range(10)]) == 10
+    assert backfill.append_metrics([metric_row(index) for index in range(5, 15)]) == 5
+    assert dashboard.append_metrics([metric_row(index) for index in range(20)]) == 5
+
+    assert len(HistoryStore(store_dir, backend="parquet").query(['total_topics'])) == 20
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow is not installed")
+def test_parquet_compaction_drops_duplicate_reports(tmp_path):
+    store_dir = str(tmp_path / "history")
+    backend = ParquetHistoryBackend(store_dir)
+    backend.append([metric_row(index) for index in range(10)])
+    # Written by an older version without the lock file
+    backend.append([metric_row(index) for index in range(5, 15)])
+
+    backend.compact()
+    assert len(backend.query(['total_topics'], None, None)) == 15
+
+
+@pytest.mark.parametrize("backend", [
+    pytest.param("parquet", marks=pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow is not installed")),
+    "sqlite"
+])
+def test_late_rows_rebuild_rolled_up_buckets(tmp_path, backend):
+    store_dir = str(tmp_path / "history")
+    day_ms = 24 * HOUR_MS
+    day_start = START_MS // day_ms * day_ms
+    now = day_start + 30 * day_ms
+    policy = RetentionPolicy(full_age=timedelta(days=1), hourly_age=timedelta(days=10))
+
+    # One report every other hour for two days, rolled up hourly and daily
+    store = TieredHistoryStore(store_dir, policy, backend=backend)
+    store.append_metrics([metric_row(index, day_start + index * HOUR_MS) for index in range(0, 48, 2)])
+    assert store.rollup(now) == {'daily': 2, 'hourly': 24}
+
+    # A late report in an hour that is already rolled up, written by another process
+    late = metric_row(1, day_start + HOUR_MS // 2)
+    late['health_score'] = 50.0
+    TieredHistoryStore(store_dir, policy, backend=backend).append_metrics([late])
+
+    store = TieredHistoryStore(store_dir, policy, backend=backend)
+    assert store.rollup(now) == {'daily': 1, 'hourly': 1}
+    assert store.rollup(now) == {'daily': 0, 'hourly': 0}
+
+    hourly = store.rollups['hourly'].query(['health_score'])
+    assert len(hourly) == 24
+    assert hourly['health_score'].iloc[0] == 25.0
+    daily = store.rollups['daily'].query(['health_score'])
+    assert len(daily) == 2
+    assert daily['health_score'].iloc[0] == pytest.approx((sum(range(0, 24, 2)) + 50) / 13)
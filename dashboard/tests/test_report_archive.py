@@ -0,0 +1,74 @@
+import copy
+import gzip
+import json
+import os
+
+from utils.report_archive import ReportArchive
+
+
+def make_report(index, cluster='prod'):
+    return {
+        'timestamp': f"2026-10-01T00:{index:02d}:00Z",
+        'clusterInfo': {'clusterId': cluster, 'brokers': [{'nodeId': 1}]},
+        'topics': [{'name': f"topic-{i}", 'partitions': i + index % 3} for i in range(5)],
+        'consumerGroups': [{'groupId': f"group-{i}", 'members': (i + index) % 2} for i in range(3)]
+    }
+
+
+def test_reopen_with_another_keyframe_interval(tmp_path):
+    archive = ReportArchive(str(tmp_path), keyframe_interval=5)
+    for index in range(12):
+        archive.append(make_report(index), f"report-{index}")
+
+    archive = ReportArchive(str(tmp_path), keyframe_interval=50)
+    for index in range(12, 20):
+        archive.append(make_report(index), f"report-{index}")
+
+    archive = ReportArchive(str(tmp_path), keyframe_interval=3)
+    for index in range(20):
+        assert archive.get(f"report-{index}") == make_report(index)
+
+
+def test_unindexed_record_after_crash_is_skipped(tmp_path):
+    archive = ReportArchive(str(tmp_path), keyframe_interval=10)
+    for index in range(3):
+        archive.append(make_report(index), f"report-{index}")
+
+    # A crash after the segment write but before the index write
+    entry = archive.append(make_report(3), "report-3")
+    index_path = os.path.join(archive._cluster_dir('prod'), ReportArchive.INDEX_FILE)
+    with open(index_path, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    with open(index_path, 'w', encoding='utf-8') as f:
+        f.writelines(lines[:-1])
+
+    archive = ReportArchive(str(tmp_path), keyframe_interval=10)
+    assert "report-3" not in archive
+    for index in range(3, 6):
+        archive.append(make_report(index), f"report-{index}")
+    for index in range(6):
+        assert archive.get(f"report-{index}") == make_report(index)
+    assert entry.position == 3
+
+
+def test_similar_cluster_ids_get_separate_directories(tmp_path):
+    archive = ReportArchive(str(tmp_path))
+    archive.append(make_report(0, 'prod/east'), "a")
+    archive.append(make_report(1, 'prod:east'), "b")
+
+    archive = ReportArchive(str(tmp_path))
+    assert archive.get("a") == make_report(0, 'prod/east')
+    assert archive.get("b") == make_report(1, 'prod:east')
+
+
+def test_rollback_removes_the_last_append(tmp_path):
+    archive = ReportArchive(str(tmp_path), keyframe_interval=10)
+    archive.append(make_report(0), "report-0")
+    entry = archive.append(make_report(1), "report-1")
+    archive.rollback(entry)
+    assert "report-1" not in archive
+
+    archive.append(make_report(2), "report-2")
+    archive = ReportArchive(str(tmp_path), keyframe_interval=10)
+    assert len(archive) == 2
+    assert archive.get("report-2") == make_report(2)
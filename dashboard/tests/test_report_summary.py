@@ -0,0 +1,54 @@
+import copy
+
+from utils.report_summary import ReportSummary
+
+
+def make_report():
+    return {
+        'timestamp': "2026-10-01T00:00:00Z",
+        'clusterInfo': {'clusterId': 'prod', 'brokers': [{'nodeId': 0}, {'nodeId': 1}]},
+        'topics': [
+            {'name': name, 'partitions': 2, 'replicationFactor': rf,
+             'partitionDetails': [{'id': i, 'leader': 0, 'replicas': [0, 1], 'isr': isr}
+                                  for i, isr in enumerate(isrs)]}
+            for name, rf, isrs in (('orders', 3, [[0, 1], [0]]), ('payments', 2, [[0, 1], [0, 1]]),
+                                   ('audit', 3, [[0, 1], [0, 1]]))
+        ]
+    }
+
+
+def test_swapped_replication_factors_change_the_topics_key():
+    report = make_report()
+    swapped = copy.deepcopy(report)
+    swapped['topics'][1]['replicationFactor'], swapped['topics'][2]['replicationFactor'] = 3, 2
+
+    assert ReportSummary(report).section_key('topics') != ReportSummary(swapped).section_key('topics')
+
+
+def test_moved_under_replicated_partition_changes_the_partitions_key():
+    report = make_report()
+    moved = copy.deepcopy(report)
+    moved['topics'][0]['partitionDetails'][1]['isr'] = [0, 1]
+    moved['topics'][1]['partitionDetails'][1]['isr'] = [0]
+
+    summary, moved_summary = ReportSummary(report), ReportSummary(moved)
+    assert summary.partition_summary == moved_summary.partition_summary
+    assert summary.under_replicated_by_topic.tolist() == [1, 0, 0]
+    assert moved_summary.under_replicated_by_topic.tolist() == [0, 1, 0]
+    assert summary.section_key('partitions') != moved_summary.section_key('partitions')
+
+
+def test_topic_rows_key_follows_the_topics_table_columns():
+    report = make_report()
+    later = copy.deepcopy(report)
+    later['timestamp'] = "2026-10-01T01:00:00Z"
+    swapped = copy.deepcopy(report)
+    swapped['topics'][1]['replicationFactor'], swapped['topics'][2]['replicationFactor'] = 3, 2
+    moved = copy.deepcopy(report)
+    moved['topics'][0]['partitionDetails'][1]['isr'] = [0, 1]
+    moved['topics'][1]['partitionDetails'][1]['isr'] = [0]
+
+    key = ReportSummary(report).section_key('topic_rows')
+    assert ReportSummary(later).section_key('topic_rows') == key
+    assert ReportSummary(swapped).section_key('topic_rows') != key
+    assert ReportSummary(moved).section_key('topic_rows') != key
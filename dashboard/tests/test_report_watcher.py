@@ -0,0 +1,38 @@
+import gzip
+import json
+import os
+
+from utils.data_loader import KafkaDataLoader
+from utils.report_watcher import ReportWatcher
+
+
+def write_report(path, timestamp):
+    report = {'timestamp': timestamp, 'clusterInfo': {'clusterId': 'prod'}, 'topics': []}
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'wt', encoding='utf-8') as f:
+        json.dump(report, f)
+
+
+def test_poll_does_not_reschedule_rejected_or_duplicate_files(tmp_path):
+    data_dir = str(tmp_path)
+    write_report(os.path.join(data_dir, "kafka-analysis-2026-10-01T00-00-00.json"), "2026-10-01T00:00:00Z")
+    # A report that is being compressed: both copies exist
+    write_report(os.path.join(data_dir, "kafka-analysis-2026-10-02T00-00-00.json"), "2026-10-02T00:00:00Z")
+    write_report(os.path.join(data_dir, "kafka-analysis-2026-10-02T00-00-00.json.gz"), "2026-10-02T00:00:00Z")
+    with open(os.path.join(data_dir, "kafka-analysis-2026-10-03T00-00-00.json"), 'w') as f:
+        f.write('{"timestamp": ')
+
+    loader = KafkaDataLoader(data_dir, quarantine_after=3600)
+    loader.watching = True
+    watcher = ReportWatcher(loader, debounce=0, stable_checks=1, max_parse_attempts=1)
+
+    watcher._poll_directory()
+    assert len(watcher._pending) == 4
+    watcher._process_pending()
+    assert not watcher._pending
+    assert len(loader.get_report_files()) == 2
+
+    version = loader.data_version
+    watcher._poll_directory()
+    assert not watcher._pending
+    assert loader.data_version == version
@@ -0,0 +1,30 @@
+import numpy as np
+
+from utils.table_query import IndexedTable, parse_filter_query
+
+
+def make_table():
+    return IndexedTable({
+        'topic': [f"topic-{i % 7}" for i in range(100)],
+        'created': [f"2026-{1 + i % 12:02d}-01" for i in range(100)],
+        'partitions': np.arange(100) % 5
+    })
+
+
+def test_nbytes_counts_ranks_and_cached_selections():
+    table = make_table()
+    columns_only = table.nbytes
+
+    table.page(0, 10, [{'column_id': 'topic', 'direction': 'asc'}], '{topic} icontains "TOPIC-1"')
+    assert table.nbytes > columns_only + table.num_rows * 8
+
+
+def test_datestartswith_selects_by_prefix():
+    assert parse_filter_query('{created} datestartswith 2026-03') == [
+        ('created', 'datestartswith', '2026-03', '2026-03', False)
+    ]
+    table = make_table()
+    selected = table.select('{created} datestartswith 2026-03')
+    assert len(selected) == 9
+    assert set(table.columns['created'][selected]) == {'2026-03-01'}
+    assert len(table.select('{partitions} datestartswith 2')) == 0
@@ -0,0 +1,101 @@
+"""
+Compression helpers for Kafka Dashboard
+Transparent access to gzip, zstd and bzip2 compressed analysis reports
+"""
+
+import bz2
+import gzip
+import io
+import os
+import shutil
+from typing import BinaryIO, Callable, Dict, Optional, TextIO
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _open_zstd(file_path: str, mode: str = 'rb', level: Optional[int] = None) -> BinaryIO:
+    if zstandard is None:
+        raise ImportError("zstandard is required to read or write .zst reports")
+    if 'w' in mode:
+        return zstandard.open(file_path, mode, cctx=zstandard.ZstdCompressor(level=level or 10))
+    return zstandard.open(file_path, mode)
+
+
+def _open_gzip(file_path: str, mode: str = 'rb', level: Optional[int] = None) -> BinaryIO:
+    return gzip.open(file_path, mode, compresslevel=level or 6)
+
+
+def _open_bz2(file_path: str, mode: str = 'rb', level: Optional[int] = None) -> BinaryIO:
+    return bz2.open(file_path, mode, compresslevel=level or 9)
+
+
+# File suffix -> opener(path, mode, level) returning a binary stream
+COMPRESSION_OPENERS: Dict[str, Callable[..., BinaryIO]] = {
+    '.gz': _open_gzip,
+    '.zst': _open_zstd,
+    '.bz2': _open_bz2
+}
+
+
+def compression_suffix(file_path: str) -> str:
+    """Return the compression suffix of a path, or '' if uncompressed"""
+    for suffix in COMPRESSION_OPENERS:
+        if file_path.endswith(suffix):
+            return suffix
+    return ''
+
+
+def strip_compression_suffix(file_path: str) -> str:
+    """Drop a compression suffix, e.g. report.json.gz -> report.json"""
+    suffix = compression_suffix(file_path)
+    return file_path[:-len(suffix)] if suffix else file_path
+
+
+def open_report_binary(file_path: str) -> BinaryIO:
+    """Open a report for reading, decompressing on the fly if needed"""
+    suffix = compression_suffix(file_path)
+    if suffix:
+        return COMPRESSION_OPENERS[suffix](file_path, 'rb')
+    return open(file_path, 'rb')
+
+
+def open_report_text(file_path: str) -> TextIO:
+    """Open a report as UTF-8 text, decompressing on the fly if needed"""
+    return io.TextIOWrapper(open_report_binary(file_path), encoding='utf-8')
+
+
+def compress_file(file_path: str, suffix: str = '.gz', level: Optional[int] = None,
+                  remove_original: bool = True) -> str:
+    """Compress a file next to itself and return the new path
+
+    The compressed copy is written under a temporary name, synced and
+    given the original's timestamps before it is renamed into place, so
+    report ordering is preserved and readers never see a partial file.
+    """
+    if suffix not in COMPRESSION_OPENERS:
+        raise ValueError(f"Unsupported compression: {suffix}")
+
+    directory, name = os.path.split(file_path)
+    target_path = file_path + suffix
+    # A leading dot keeps the temporary file out of report discovery
+    tmp_path = os.path.join(directory, f".{name}{suffix}.tmp")
+
+    stat = os.stat(file_path)
+    try:
+        with open(file_path, 'rb') as source, COMPRESSION_OPENERS[suffix](tmp_path, 'wb', level) as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+        with open(tmp_path, 'rb') as f:
+            os.fsync(f.fileno())
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    if remove_original:
+        os.remove(file_path)
+    return target_path
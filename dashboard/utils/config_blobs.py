@@ -0,0 +1,162 @@
+"""
+Topic config blob stores for Kafka Dashboard
+Interns the per-topic config maps of reports by content hash, in memory and on disk
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional
+
+
+# Marks a topic config stored in a DiskBlobStore: {"$blob": "<hash>"}
+BLOB_REF = '$blob'
+
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """BLAKE2b digest of a config map's canonical JSON form"""
+    encoded = json.dumps(config, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class ConfigBlobStore:
+    """In-process store of distinct topic config maps
+
+    Topics of one cluster, and the same topic across runs, mostly carry
+    identical configs, so each distinct map is kept once and topics keep
+    its small integer id (or the shared dict itself). Stored maps are
+    shared and must be treated as read-only.
+    """
+
+    def __init__(self):
+        self._ids: Dict[Any, int] = {}
+        self._configs: List[Dict[str, Any]] = []
+        self._hashes: List[str] = []
+        self._lock = threading.Lock()
+        self.references = 0
+
+    def __len__(self) -> int:
+        return len(self._configs)
+
+    @staticmethod
+    def _key(config: Dict[str, Any]) -> Any:
+        # Analyzer configs map names to flat {value, isDefault, isSensitive}
+        # dicts; a tuple of their items is a much cheaper lookup key than a
+        # digest. Other shapes fall back to the content hash.
+        key = tuple((name, tuple(entry.items()) if type(entry) is dict else entry)
+                    for name, entry in config.items())
+        try:
+            hash(key)
+        except TypeError:
+            return config_hash(config)
+        return key
+
+    def intern(self, config: Optional[Dict[str, Any]]) -> int:
+        """Id of the stored copy of ``config``; -1 for a missing config"""
+        if config is None:
+            return -1
+        key = self._key(config)
+        with self._lock:
+            self.references += 1
+            config_id = self._ids.get(key)
+            if config_id is None:
+                config_id = self._ids[key] = len(self._configs)
+                self._configs.append(config)
+                self._hashes.append(config_hash(config))
+        return config_id
+
+    def canonical(self, config: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """The shared dict equal to ``config``"""
+        config_id = self.intern(config)
+        return None if config_id < 0 else self._configs[config_id]
+
+    def get(self, config_id: int) -> Optional[Dict[str, Any]]:
+        return None if config_id < 0 else self._configs[config_id]
+
+    def hash_of(self, config_id: int) -> Optional[str]:
+        return None if config_id < 0 else self._hashes[config_id]
+
+    def stats(self) -> Dict[str, int]:
+        return {'distinct_configs': len(self), 'references': self.references}
+
+
+# Process-wide store used by the loader
+TOPIC_CONFIGS = ConfigBlobStore()
+
+
+class DiskBlobStore:
+    """Content-addressed files of topic config maps
+
+    Each distinct map is written once to ``<blob_dir>/<aa>/<hash>.json``;
+    reports refer to it as ``{"$blob": "<hash>"}``. Recently read blobs
+    are kept in memory.
+    """
+
+    def __init__(self, blob_dir: str, cache_size: int = 4096):
+        self.blob_dir = blob_dir
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(blob_dir, exist_ok=True)
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.blob_dir, digest[:2], f"{digest}.json")
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self._cache or os.path.exists(self._path(digest))
+
+    def put(self, config: Dict[str, Any]) -> str:
+        """Store a config map if it is new; returns its hash"""
+        digest = config_hash(config)
+        if digest in self:
+            return digest
+
+        path = self._path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(config, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        self._remember(digest, config)
+        return digest
+
+    def get(self, digest: str) -> Dict[str, Any]:
+        with self._lock:
+            config = self._cache.get(digest)
+            if config is not None:
+                self._cache.move_to_end(digest)
+                return config
+
+        with open(self._path(digest), 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        self._remember(digest, config)
+        return config
+
+    def _remember(self, digest: str, config: Dict[str, Any]) -> None:
+        with self._lock:
+            self._cache[digest] = config
+            self._cache.move_to_end(digest)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def externalize_topics(self, topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Copies of ``topics`` whose config maps are replaced by blob references"""
+        result = []
+        for topic in topics:
+            config = topic.get('config') if isinstance(topic, dict) else None
+            if isinstance(config, dict) and BLOB_REF not in config:
+                topic = dict(topic, config={BLOB_REF: self.put(config)})
+            result.append(topic)
+        return result
+
+    def resolve_topics(self, topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Copies of ``topics`` with blob references replaced by the config maps"""
+        result = []
+        for topic in topics:
+            config = topic.get('config') if isinstance(topic, dict) else None
+            if isinstance(config, dict) and BLOB_REF in config:
+                topic = dict(topic, config=self.get(config[BLOB_REF]))
+            result.append(topic)
+        return result
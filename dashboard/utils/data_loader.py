@@ -3,75 +3,892 @@ Data loader utilities for Kafka Dashboard
 Handles loading and processing Kafka analysis reports
 """
 
+import gc
+import hashlib
 import json
+import mmap
 import os
+import re
+import threading
+import time
+import uuid
 import pandas as pd
-from datetime import datetime
-from typing import Dict, List, Optional, Any
-import glob
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Tuple, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+from utils.cache import ByteBoundedLRU
+from utils.compression import compression_suffix, open_report_binary, strip_compression_suffix
+from utils.config_blobs import TOPIC_CONFIGS
+from utils.history_store import (
+    Duration, HistoryStore, TimeBound, extract_report_metrics, thin_to_step, to_duration_ms, to_epoch_ms
+)
+from utils.json_stream import Projection, load_projected, parse_projection, projection_key
+from utils.partition_matrix import PartitionMatrix
+from utils.report_summary import ReportSummary, file_checksum, report_content_hash
+from utils.report_validation import Quarantine, ReportValidationError, validate_report
+from utils.topic_table import TopicTable
+
+
+REPORT_PREFIX = "kafka-analysis-"
+REPORT_SUFFIX = ".json"
+
+# Fields needed by the summary views; used with streaming projected parsing
+SUMMARY_PROJECTION = parse_projection([
+    'timestamp',
+    'vendor',
+    'summary',
+    'clusterInfo',
+    'topics[].name/partitions/replicationFactor/isInternal/errorCode',
+    'consumerGroups[].groupId/members/state/protocolType',
+    'healthChecks.vendor/totalChecks/passedChecks/failedChecks/checks'
+])
+
+# Fields needed to identify the cluster a report belongs to
+CLUSTER_PROJECTION = parse_projection(['clusterInfo.clusterId'])
+
+# Parsed report bodies take roughly this many times their pretty-printed JSON size in memory
+BODY_MEMORY_FACTOR = 3
+
+# Number of ReportSummary objects memoized by content hash
+SUMMARY_CACHE_SIZE = 256
+
+# The analyzer writes a single top-level "timestamp"; it is left out of body hashes
+TIMESTAMP_FIELD = re.compile(rb'"timestamp"\s*:\s*("(?:[^"\\]|\\.)*")')
+# Longest timestamp field the streaming hash matches across a chunk boundary
+TIMESTAMP_FIELD_MAX_BYTES = 4096
+
+# Topics and health checks carry the analyzer's vendor; the first one is read
+VENDOR_FIELD = re.compile(rb'"vendor"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+# Fields needed by the trend views
+TREND_PROJECTION = parse_projection([
+    'timestamp',
+    'summary',
+    'healthChecks.totalChecks/passedChecks/failedChecks'
+])
+
+
+_simdjson_local = threading.local()
+_gc_pause_lock = threading.Lock()
+_gc_pause_depth = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def _gc_paused():
+    """Pause the cyclic GC while decoding
+    
+    Decoding allocates millions of containers, which otherwise triggers
+    repeated full collections; the pause is reference-counted across threads.
+    """
+    global _gc_pause_depth, _gc_was_enabled
+    with _gc_pause_lock:
+        if _gc_pause_depth == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pause_depth += 1
+    try:
+        yield
+    finally:
+        with _gc_pause_lock:
+            _gc_pause_depth -= 1
+            if _gc_pause_depth == 0 and _gc_was_enabled:
+                gc.enable()
+
+
+def _decode_orjson(buffer: memoryview) -> Any:
+    return orjson.loads(buffer)
+
+
+def _decode_simdjson(buffer: memoryview) -> Any:
+    # Parsers are reusable but not thread-safe, so keep one per thread
+    parser = getattr(_simdjson_local, 'parser', None)
+    if parser is None:
+        parser = _simdjson_local.parser = simdjson.Parser()
+    return parser.parse(buffer, True)
+
+
+def _decode_stdlib(buffer: memoryview) -> Any:
+    return json.loads(str(buffer, 'utf-8'))
+
+
+# Available JSON decoders, fastest first
+JSON_DECODERS: Dict[str, Callable[[memoryview], Any]] = {}
+if orjson is not None:
+    JSON_DECODERS['orjson'] = _decode_orjson
+if simdjson is not None:
+    JSON_DECODERS['simdjson'] = _decode_simdjson
+JSON_DECODERS['json'] = _decode_stdlib
+
+
+def get_json_decoder(name: str = "auto") -> Tuple[str, Callable[[memoryview], Any]]:
+    """Resolve a decoder name, picking the fastest installed one for 'auto'"""
+    if name == "auto":
+        name = next(iter(JSON_DECODERS))
+    if name not in JSON_DECODERS:
+        raise ValueError(f"JSON decoder '{name}' is not available "
+                         f"(installed: {', '.join(JSON_DECODERS)})")
+    return name, JSON_DECODERS[name]
+
+
+def read_report_file(file_path: str, decoder: str = "auto") -> Any:
+    """Memory-map a report file and decode it straight from the mapped bytes
+    
+    Compressed reports (.json.gz, .json.zst, .json.bz2) are decompressed
+    as a stream into memory and decoded from there.
+    """
+    _, decode = get_json_decoder(decoder)
+    
+    if compression_suffix(file_path):
+        with open_report_binary(file_path) as f:
+            raw = f.read()
+        if not raw:
+            raise ValueError(f"Report file is empty: {file_path}")
+        with memoryview(raw) as view, _gc_paused():
+            return decode(view)
+    
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"Report file is empty: {file_path}")
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # The view must be released before the mapping can be closed
+            with memoryview(mapped) as view, _gc_paused():
+                return decode(view)
+
+
+def _hash_without_timestamp(buffer) -> Tuple[Optional[str], Optional[str]]:
+    matches = list(TIMESTAMP_FIELD.finditer(buffer))
+    if len(matches) != 1:
+        return None, None
+    
+    match = matches[0]
+    digest = hashlib.blake2b(digest_size=16)
+    with memoryview(buffer) as view:
+        digest.update(view[:match.start()])
+        digest.update(view[match.end():])
+    return digest.hexdigest(), json.loads(match.group(1))
+
+
+def _hash_stream_without_timestamp(f, chunk_size: int = 1 << 20) -> Tuple[Optional[str], Optional[str]]:
+    """_hash_without_timestamp over a stream, one chunk at a time"""
+    digest = hashlib.blake2b(digest_size=16)
+    timestamps = []
+    pending = b''
+    while True:
+        chunk = f.read(chunk_size)
+        buffer = pending + chunk
+        start = 0
+        for match in TIMESTAMP_FIELD.finditer(buffer):
+            digest.update(buffer[start:match.start()])
+            timestamps.append(match.group(1))
+            start = match.end()
+        if not chunk:
+            digest.update(buffer[start:])
+            break
+        # Hold back a tail so a field split across chunks is matched whole
+        cut = max(start, len(buffer) - TIMESTAMP_FIELD_MAX_BYTES)
+        digest.update(buffer[start:cut])
+        pending = buffer[cut:]
+    
+    if len(timestamps) != 1:
+        return None, None
+    return digest.hexdigest(), json.loads(timestamps[0])
+
+
+def report_body_hash(file_path: str) -> Tuple[Optional[str], Optional[str]]:
+    """Hash a report's bytes with its timestamp field left out
+    
+    Returns (body hash, timestamp). The hash is None unless the file has
+    exactly one timestamp field, since only then can the report be rebuilt
+    from a shared body plus its own timestamp. Compressed reports are
+    hashed as they are decompressed, without holding the whole document.
+    """
+    if compression_suffix(file_path):
+        with open_report_binary(file_path) as f:
+            return _hash_stream_without_timestamp(f)
+    
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None, None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return _hash_without_timestamp(mapped)
+
+
+def read_report_vendor(file_path: str, chunk_size: int = 1 << 16) -> Optional[str]:
+    """Return the first vendor field of a report, reading only as far as needed"""
+    with open_report_binary(file_path) as f:
+        buffer = b''
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return None
+            # Keep a short overlap so a field split across chunks still matches
+            buffer = buffer[-256:] + chunk
+            match = VENDOR_FIELD.search(buffer)
+            if match:
+                return json.loads(match.group(1))
+
+
+def report_id(file_path: str) -> str:
+    """Stable report identity: the file name without any compression suffix"""
+    return strip_compression_suffix(os.path.basename(file_path))
+
+
+def report_epoch_ms(file_path: str, stat: os.stat_result) -> int:
+    """Report time in epoch milliseconds, from the file name or else its mtime"""
+    name = report_id(file_path)
+    stamp = name[len(REPORT_PREFIX):-len(REPORT_SUFFIX)]
+    if stamp.isdigit():
+        return int(stamp)
+    return stat.st_mtime_ns // 1_000_000
 
 
 class KafkaDataLoader:
     """Handles loading and processing Kafka analysis data"""
     
-    def __init__(self, data_dir: str = "../kafka-analysis"):
+    def __init__(self, data_dir: str = "../kafka-analysis", projection: Projection = None,
+                 decoder: str = "auto", body_cache_bytes: int = 512 * 1024 * 1024,
+                 compact_topics: bool = True, deduplicate: bool = True,
+                 quarantine_dir: Optional[str] = None, quarantine_after: float = 60.0):
         self.data_dir = data_dir
+        # Default projection for loaded reports; None loads the full document
+        self.projection = projection
+        # JSON decoder used for full documents ('auto', 'orjson', 'simdjson' or 'json')
+        self.decoder, _ = get_json_decoder(decoder)
+        # Replace each report's topics list with a TopicTable and a
+        # PartitionMatrix of NumPy arrays
+        self.compact_topics = compact_topics
+        # Share one parsed body between reports that differ only in timestamp
+        self.deduplicate = deduplicate
+        # Reports that fail to decode or validate are moved here once they
+        # have not been modified for quarantine_after seconds (younger ones
+        # may still be being written)
+        self.quarantine = Quarantine(quarantine_dir or os.path.join(data_dir, '.quarantine'))
+        self.quarantine_after = quarantine_after
+        # Rejected files: path -> (stat key, reason); skipped until they change
+        self._rejected: Dict[str, Tuple[Tuple[int, int, int], str]] = {}
+        self._quarantine_lock = threading.Lock()
+        self.quarantined = 0
         
-    def get_latest_report(self) -> Optional[Dict[str, Any]]:
-        """Load the most recent Kafka analysis report"""
-        try:
-            if not os.path.exists(self.data_dir):
-                return None
+        # Loaded reports keyed by (path, projection) -> ((size, mtime_ns, inode), body
+        # cache key, timestamp); the bodies themselves only live in the body cache
+        self._report_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int, int], Tuple, Any]] = {}
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+        self.dedup_hits = 0
+        self.dedup_misses = 0
+        
+        # Known report files and a version that changes whenever they do
+        self._known_files: Dict[str, os.stat_result] = {}
+        self._sorted_files: Optional[List[Tuple[str, os.stat_result]]] = None
+        self._index_lock = threading.Lock()
+        self.data_version = 0
+        # Distinguishes this loader's versions from those of earlier processes,
+        # so a browser that outlived a server restart never matches a new ETag
+        self.generation = uuid.uuid4().hex[:8]
+        # Set while a ReportWatcher keeps the index current
+        self.watching = False
+        
+        # Parsed report bodies, bounded by estimated memory: one per file, or
+        # one per body hash for reports that share a deduplicated body
+        self._body_cache = ByteBoundedLRU(body_cache_bytes)
+        self._handles: Dict[str, 'ReportHandle'] = {}
+        self._handles_list: List['ReportHandle'] = []
+        # The same handles ordered by report time, with their epoch ms for bisect
+        self._handles_by_time: List['ReportHandle'] = []
+        self._handle_epochs: List[int] = []
+        self._handles_version = -1
+        
+        # Per-cluster latest handle and time index, keyed by clusterInfo.clusterId
+        self._cluster_latest: Dict[str, 'ReportHandle'] = {}
+        self._cluster_handles_by_time: Dict[str, List['ReportHandle']] = {}
+        self._cluster_epochs: Dict[str, List[int]] = {}
+        self._cluster_version = -1
+        
+        # Single-pass summaries keyed by (content hash, projection)
+        self._summaries: "OrderedDict[Tuple[str, str], ReportSummary]" = OrderedDict()
+        self._summary_lock = threading.Lock()
+    
+    @staticmethod
+    def is_report_file(name: str) -> bool:
+        """Check whether a file name follows the analysis report naming pattern
+        
+        Both plain and compressed (.gz, .zst, .bz2) reports match.
+        """
+        return name.startswith(REPORT_PREFIX) and strip_compression_suffix(name).endswith(REPORT_SUFFIX)
+    
+    @staticmethod
+    def stat_key(stat: os.stat_result) -> Tuple[int, int, int]:
+        return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+    
+    def scan_report_files(self) -> Dict[str, os.stat_result]:
+        """Map report file paths in the data directory to their stat results"""
+        files = {}
+        if not os.path.isdir(self.data_dir):
+            return files
+        
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                if not self.is_report_file(entry.name):
+                    continue
+                try:
+                    if entry.is_file():
+                        files[entry.path] = entry.stat()
+                except OSError:
+                    # File removed between listing and stat
+                    continue
+        
+        return files
+    
+    def refresh_index(self) -> bool:
+        """Rescan the data directory and update the set of known reports
+        
+        Returns True if any report was added, changed or removed.
+        """
+        files = self.scan_report_files()
+        
+        with self._index_lock:
+            known = self._known_files
+            changed = files.keys() != known.keys() or any(
+                self.stat_key(stat) != self.stat_key(known[path])
+                for path, stat in files.items()
+            )
+            if changed:
+                self._known_files = files
+                self._sorted_files = None
+                self.data_version += 1
+        
+        if changed:
+            self._evict_missing(set(files))
+        return changed
+    
+    def add_report_file(self, file_path: str, preload: bool = True) -> bool:
+        """Register a new or rewritten report file
+        
+        With ``preload`` the file is parsed into the cache first, so a file
+        that cannot be parsed yet raises instead of being published.
+        Returns True if the set of known reports changed.
+        """
+        stat = os.stat(file_path)
+        if preload:
+            # The watcher retries files that fail here; they are only
+            # quarantined once published
+            self._load_report(file_path, stat, self.projection, quarantine=False)
+        
+        with self._index_lock:
+            previous = self._known_files.get(file_path)
+            if previous is not None and self.stat_key(previous) == self.stat_key(stat):
+                return False
+            self._known_files[file_path] = stat
+            self._sorted_files = None
+            self.data_version += 1
+        return True
+    
+    def remove_report_file(self, file_path: str) -> bool:
+        """Forget a deleted report file; returns True if it was known"""
+        with self._index_lock:
+            if self._known_files.pop(file_path, None) is None:
+                return False
+            self._sorted_files = None
+            self.data_version += 1
+        
+        self._evict_missing(set(self._known_files))
+        return True
+    
+    def check_for_updates(self) -> int:
+        """Return the current data version
+        
+        While a ReportWatcher keeps the index current this is a plain
+        attribute read; otherwise the directory is rescanned first.
+        """
+        if not self.watching:
+            self.refresh_index()
+        if self._rejected:
+            self.quarantine_rejected()
+        return self.data_version
+    
+    def make_etag(self, version: Optional[int] = None) -> str:
+        """Opaque tag of a data version (default: the current one)
+        
+        Versions only ever increase within a loader; the tag adds the
+        loader's generation so it stays unique across restarts.
+        """
+        if version is None:
+            version = self.data_version
+        return f"{self.generation}-{version}"
+    
+    @property
+    def data_etag(self) -> str:
+        return self.make_etag()
+    
+    def get_indexed_files(self) -> Dict[str, os.stat_result]:
+        """Every file in the index with its stat result
+        
+        Unlike get_report_files this includes rejected files and both
+        copies of a report that is being compressed.
+        """
+        with self._index_lock:
+            return dict(self._known_files)
+    
+    def get_report_files(self) -> List[Tuple[str, os.stat_result]]:
+        """List known report files with their stat results, oldest first"""
+        if not self.watching:
+            self.refresh_index()
+        
+        with self._index_lock:
+            if self._sorted_files is None:
+                # While a report is being compressed both copies exist briefly;
+                # list it once, preferring the plain file
+                by_report = {}
+                for file_path, stat in self._known_files.items():
+                    rejected = self._rejected.get(file_path)
+                    if rejected is not None and rejected[0] == self.stat_key(stat):
+                        continue
+                    current = by_report.get(report_id(file_path))
+                    if current is None or len(file_path) < len(current[0]):
+                        by_report[report_id(file_path)] = (file_path, stat)
                 
-            # Find all JSON analysis files
-            pattern = os.path.join(self.data_dir, "kafka-analysis-*.json")
-            json_files = glob.glob(pattern)
+                self._sorted_files = sorted(
+                    by_report.values(),
+                    key=lambda item: (item[1].st_mtime_ns, item[0])
+                )
+            return self._sorted_files
+    
+    def _load_report(self, file_path: str, stat: os.stat_result,
+                     projection: Projection = None, quarantine: bool = True) -> Dict[str, Any]:
+        """Return the parsed report, reusing the cached body if the file is unchanged
+        
+        Bodies are held by the byte-bounded body cache only; a report whose
+        body was evicted is parsed again.
+        """
+        key = self.stat_key(stat)
+        cache_key = (file_path, projection_key(projection) if projection is not None else '')
+        
+        with self._cache_lock:
+            cached = self._report_cache.get(cache_key)
+        if cached is not None and cached[0] == key:
+            _, body_key, timestamp = cached
+            body = self._body_cache.get(body_key)
+            if body is not None:
+                with self._cache_lock:
+                    self.cache_hits += 1
+                if body_key[0] == 'body':
+                    return self._share_body(file_path, stat, projection, body, body_key[1], timestamp)
+                return body
+        
+        data = self._read_validated(file_path, stat, projection, quarantine)
+        
+        body_hash = data['_metadata'].get('body_hash')
+        if body_hash is not None:
+            # read_report keeps the shared body under its hash
+            body_key = ('body', body_hash, cache_key[1])
+        else:
+            body_key = ('report',) + cache_key + (key,)
+            self._body_cache.put(body_key, data, stat.st_size * BODY_MEMORY_FACTOR)
+        
+        with self._cache_lock:
+            self.cache_misses += 1
+            self._report_cache[cache_key] = (key, body_key, data.get('timestamp'))
+        
+        return data
+    
+    def _read_validated(self, file_path: str, stat: os.stat_result,
+                        projection: Projection = None, quarantine: bool = True) -> Dict[str, Any]:
+        """read_report, remembering files that fail so they are not parsed again
+        
+        A rejected file is left out of get_report_files until it changes,
+        and with ``quarantine`` it is moved to the quarantine directory once
+        it is old enough.
+        """
+        key = self.stat_key(stat)
+        rejected = self._rejected.get(file_path)
+        if rejected is not None and rejected[0] == key:
+            raise ReportValidationError(rejected[1])
+        
+        try:
+            return self.read_report(file_path, stat, projection)
+        except ValueError as e:
+            # Decoding errors (truncated or half-written files) are ValueErrors too
+            reason = str(e) or type(e).__name__
+            with self._index_lock:
+                self._rejected[file_path] = (key, reason)
+                if file_path in self._known_files:
+                    self._sorted_files = None
+                    self.data_version += 1
+            if quarantine:
+                self.quarantine_rejected()
+            if isinstance(e, ReportValidationError):
+                raise
+            raise ReportValidationError(reason) from e
+    
+    def quarantine_rejected(self) -> int:
+        """Move rejected files that are no longer being written to quarantine
+        
+        Returns the number of files moved.
+        """
+        with self._quarantine_lock:
+            return self._quarantine_rejected()
+    
+    def _quarantine_rejected(self) -> int:
+        moved = 0
+        now = time.time()
+        for file_path, (key, reason) in list(self._rejected.items()):
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                self._rejected.pop(file_path, None)
+                continue
+            if self.stat_key(stat) != key:
+                # Rewritten since; it gets a fresh look
+                self._rejected.pop(file_path, None)
+                with self._index_lock:
+                    self._sorted_files = None
+                    self.data_version += 1
+                continue
+            if now - stat.st_mtime < self.quarantine_after:
+                continue
             
-            if not json_files:
-                return None
+            try:
+                target = self.quarantine.move(file_path, reason)
+            except OSError as e:
+                # Keep skipping it; it will be retried on the next check
+                print(f"Error quarantining {file_path}: {e}")
+                continue
+            print(f"🚫 Quarantined {os.path.basename(file_path)}: {reason} -> {target}")
+            self._rejected.pop(file_path, None)
+            self.remove_report_file(file_path)
+            self.quarantined += 1
+            moved += 1
+        return moved
+    
+    def read_report(self, file_path: str, stat: os.stat_result,
+                    projection: Projection = None) -> Dict[str, Any]:
+        """Parse a report, or share the body of an already parsed identical one
+        
+        Periodic reports of a stable cluster usually differ only in their
+        timestamp. Such reports are parsed once; each further one is a
+        shallow copy of that body with its own timestamp and file metadata.
+        """
+        if not self.deduplicate:
+            return self.parse_report(file_path, stat, projection)
+        
+        try:
+            body_hash, timestamp = report_body_hash(file_path)
+        except (OSError, ValueError) as e:
+            print(f"Error hashing {file_path}: {e}")
+            body_hash = None
+        if body_hash is None:
+            return self.parse_report(file_path, stat, projection)
+        
+        body_key = ('body', body_hash, projection_key(projection) if projection is not None else '')
+        body = self._body_cache.get(body_key)
+        if body is None:
+            body = self.parse_report(file_path, stat, projection)
+            self._body_cache.put(body_key, body, stat.st_size * BODY_MEMORY_FACTOR)
+            with self._cache_lock:
+                self.dedup_misses += 1
+        else:
+            with self._cache_lock:
+                self.dedup_hits += 1
+        
+        return self._share_body(file_path, stat, projection, body, body_hash, timestamp)
+    
+    def _share_body(self, file_path: str, stat: os.stat_result, projection: Projection,
+                    body: Dict[str, Any], body_hash: str, timestamp: Any) -> Dict[str, Any]:
+        """Shallow copy of a shared body with a report's own timestamp and file metadata"""
+        data = dict(body)
+        if 'timestamp' in body:
+            data['timestamp'] = timestamp
+        data['_metadata'] = self._file_metadata(file_path, stat, projection)
+        data['_metadata']['body_hash'] = body_hash
+        data['_metadata']['content_hash'] = hashlib.blake2b(
+            f"{body_hash}:{timestamp}".encode('utf-8'), digest_size=16
+        ).hexdigest()
+        return data
+    
+    def _file_metadata(self, file_path: str, stat: os.stat_result,
+                       projection: Projection = None) -> Dict[str, Any]:
+        metadata = {
+            'filename': os.path.basename(file_path),
+            'report_id': report_id(file_path),
+            'filepath': file_path,
+            'last_modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
+        }
+        if projection is not None:
+            metadata['projection'] = projection_key(projection)
+        return metadata
+    
+    def parse_report(self, file_path: str, stat: os.stat_result,
+                      projection: Projection = None) -> Dict[str, Any]:
+        """Read a report file, bypassing the caches, and attach its file metadata"""
+        if projection is not None:
+            data = load_projected(file_path, projection)
+        else:
+            data = read_report_file(file_path, self.decoder)
+        
+        error = validate_report(data)
+        if error:
+            raise ReportValidationError(error)
+        
+        # Add file metadata
+        data['_metadata'] = self._file_metadata(file_path, stat, projection)
+        
+        if self.compact_topics and isinstance(data.get('topics'), list):
+            data['partition_matrix'] = PartitionMatrix.from_topics(data['topics'])
+            data['topics'] = TopicTable.from_topics(data['topics'])
+        elif isinstance(data.get('topics'), list):
+            # Topics keep a shared copy of each distinct config map
+            for topic in data['topics']:
+                if isinstance(topic, dict) and isinstance(topic.get('config'), dict):
+                    topic['config'] = TOPIC_CONFIGS.canonical(topic['config'])
+        
+        return data
+    
+    def _evict_missing(self, present_paths: set) -> None:
+        """Drop cached reports whose files no longer exist"""
+        with self._cache_lock:
+            stale = [cache_key for cache_key in self._report_cache if cache_key[0] not in present_paths]
+            body_keys = [self._report_cache.pop(cache_key)[1] for cache_key in stale]
+            self.cache_evictions += len(stale)
+        for body_key in body_keys:
+            # Shared bodies may still back other reports; they age out on their own
+            if body_key[0] == 'report':
+                self._body_cache.pop(body_key)
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Return report cache counters"""
+        with self._cache_lock:
+            return {
+                'entries': len(self._report_cache),
+                'hits': self.cache_hits,
+                'misses': self.cache_misses,
+                'evictions': self.cache_evictions,
+                'dedup_hits': self.dedup_hits,
+                'dedup_misses': self.dedup_misses,
+                'distinct_topic_configs': len(TOPIC_CONFIGS),
+                'rejected': len(self._rejected),
+                'quarantined': self.quarantined
+            }
+    
+    def clear_cache(self) -> None:
+        """Forget all cached reports"""
+        with self._cache_lock:
+            self._report_cache.clear()
+        self._body_cache.clear()
+    
+    def get_report_handles(self) -> List['ReportHandle']:
+        """List handles for all known reports, oldest first
+        
+        Handles only carry file metadata; bodies are loaded on demand.
+        """
+        report_files = self.get_report_files()
+        
+        with self._index_lock:
+            if self._handles_version == self.data_version:
+                return self._handles_list
             
-            # Get the most recent file by modification time
-            latest_file = max(json_files, key=os.path.getmtime)
+            handles = []
+            live = {}
+            for file_path, stat in report_files:
+                handle = self._handles.get(file_path)
+                if handle is None or handle.key != self.stat_key(stat):
+                    handle = ReportHandle(self, file_path, stat)
+                live[file_path] = handle
+                handles.append(handle)
             
-            with open(latest_file, 'r') as f:
-                data = json.load(f)
-                
-            # Add file metadata
-            data['_metadata'] = {
-                'filename': os.path.basename(latest_file),
-                'filepath': latest_file,
-                'last_modified': datetime.fromtimestamp(os.path.getmtime(latest_file)).isoformat()
+            self._handles = live
+            self._handles_list = handles
+            self._handles_by_time = sorted(handles, key=lambda handle: (handle.epoch_ms, handle.filepath))
+            self._handle_epochs = [handle.epoch_ms for handle in self._handles_by_time]
+            self._handles_version = self.data_version
+            return handles
+    
+    def _update_cluster_index(self) -> None:
+        """Group report handles by cluster once per data version
+        
+        Cluster ids are read from the leading clusterInfo section of each
+        new file and kept on its handle, so only new reports are touched.
+        """
+        handles = self.get_report_handles()
+        with self._index_lock:
+            if self._cluster_version == self._handles_version:
+                return
+            version = self._handles_version
+            handles_by_time = self._handles_by_time
+        
+        latest: Dict[str, ReportHandle] = {}
+        for handle in handles:
+            # Handles are in modification order, so the last one wins
+            latest[handle.cluster_id] = handle
+        
+        by_time: Dict[str, List[ReportHandle]] = {}
+        for handle in handles_by_time:
+            by_time.setdefault(handle.cluster_id, []).append(handle)
+        
+        with self._index_lock:
+            self._cluster_latest = latest
+            self._cluster_handles_by_time = by_time
+            self._cluster_epochs = {
+                cluster_id: [handle.epoch_ms for handle in cluster_handles]
+                for cluster_id, cluster_handles in by_time.items()
+            }
+            self._cluster_version = version
+    
+    def get_clusters(self) -> List[Dict[str, Any]]:
+        """Clusters with reports in the data directory, by cluster id"""
+        self._update_cluster_index()
+        with self._index_lock:
+            latest = dict(self._cluster_latest)
+            counts = {cluster_id: len(handles) for cluster_id, handles in self._cluster_handles_by_time.items()}
+        
+        return [
+            {
+                'cluster_id': cluster_id,
+                'vendor': handle.vendor,
+                'report_count': counts.get(cluster_id, 0),
+                'latest_timestamp': handle.timestamp
             }
+            for cluster_id, handle in sorted(latest.items())
+        ]
+    
+    def get_range(self, start: TimeBound = None, end: TimeBound = None,
+                  step: Duration = None, cluster: Optional[str] = None) -> List['ReportHandle']:
+        """Handles of the reports timed within [start, end], oldest first
+        
+        With a step (milliseconds or timedelta) only the first report of
+        each step-aligned bucket is returned. Lookups bisect a sorted index
+        of report times, so no report outside the result is touched. With a
+        cluster id only that cluster's reports are considered.
+        """
+        if cluster is None:
+            self.get_report_handles()
+            with self._index_lock:
+                handles = self._handles_by_time
+                epochs = self._handle_epochs
+        else:
+            self._update_cluster_index()
+            with self._index_lock:
+                handles = self._cluster_handles_by_time.get(cluster, [])
+                epochs = self._cluster_epochs.get(cluster, [])
+        
+        start_ms, end_ms = to_epoch_ms(start), to_epoch_ms(end)
+        lo = bisect_left(epochs, start_ms) if start_ms is not None else 0
+        hi = bisect_right(epochs, end_ms) if end_ms is not None else len(epochs)
+        
+        step_ms = to_duration_ms(step)
+        if not step_ms:
+            return handles[lo:hi]
+        
+        selected = []
+        i = lo
+        while i < hi:
+            selected.append(handles[i])
+            # Jump to the first report of the next bucket
+            i = bisect_left(epochs, (epochs[i] // step_ms + 1) * step_ms, i + 1, hi)
+        return selected
+    
+    def get_latest_handle(self, cluster: Optional[str] = None) -> Optional['ReportHandle']:
+        """Return the handle of the most recent report, optionally of one cluster"""
+        if cluster is not None:
+            self._update_cluster_index()
+            with self._index_lock:
+                return self._cluster_latest.get(cluster)
+        
+        handles = self.get_report_handles()
+        return handles[-1] if handles else None
+    
+    def load_report_body(self, handle: 'ReportHandle') -> Dict[str, Any]:
+        """Load a full report body through the byte-bounded body cache"""
+        return self._load_report(handle.filepath, handle.stat)
+    
+    def get_body_cache_stats(self) -> Dict[str, Any]:
+        """Return body cache size and hit-rate counters"""
+        return self._body_cache.get_stats()
+    
+    def summarize_report(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Compact summary of a report, without per-topic or per-group lists"""
+        return self.get_report_summary(data).to_compact_dict()
+    
+    def get_report_summary(self, data: Dict[str, Any]) -> ReportSummary:
+        """Single-pass summary of a report, memoized by its content hash
+        
+        Every dashboard callback and chart reads from this object, so a
+        report is walked once no matter how many views render it.
+        """
+        if not data:
+            return ReportSummary({})
+        
+        summary_key = (report_content_hash(data), data.get('_metadata', {}).get('projection', ''))
+        with self._summary_lock:
+            summary = self._summaries.get(summary_key)
+            if summary is not None:
+                self._summaries.move_to_end(summary_key)
+                return summary
+        
+        summary = ReportSummary(data)
+        with self._summary_lock:
+            self._summaries[summary_key] = summary
+            while len(self._summaries) > SUMMARY_CACHE_SIZE:
+                self._summaries.popitem(last=False)
+        return summary
+        
+    def get_latest_report(self, cluster: Optional[str] = None,
+                          projection: Projection = None) -> Optional[Dict[str, Any]]:
+        """Load the most recent Kafka analysis report
+        
+        With a cluster id, the most recent report of that cluster is looked
+        up in the per-cluster index. With a projection (see
+        SUMMARY_PROJECTION) the file is streamed and only the projected
+        fields are built.
+        """
+        try:
+            if cluster is not None:
+                handle = self.get_latest_handle(cluster)
+                if handle is None:
+                    return None
+                return self._load_report(handle.filepath, handle.stat, projection or self.projection)
+            
+            # Known report files, sorted by modification time, newest last
+            report_files = self.get_report_files()
             
-            return data
+            if not report_files:
+                return None
+            
+            latest_file, stat = report_files[-1]
+            
+            return self._load_report(latest_file, stat, projection or self.projection)
             
         except Exception as e:
             print(f"Error loading report: {e}")
             return None
     
-    def get_all_reports(self) -> List[Dict[str, Any]]:
-        """Load all available Kafka analysis reports"""
+    def get_all_reports(self, projection: Projection = None) -> List[Dict[str, Any]]:
+        """Load all available Kafka analysis reports
+        
+        Only new or modified files are parsed; unchanged files are served from
+        the cache and deleted files are evicted from it.
+        """
         try:
-            if not os.path.exists(self.data_dir):
-                return []
-                
-            pattern = os.path.join(self.data_dir, "kafka-analysis-*.json")
-            json_files = glob.glob(pattern)
-            
             reports = []
-            for file_path in sorted(json_files, key=os.path.getmtime):
+            for file_path, stat in self.get_report_files():
                 try:
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                        
-                    # Add metadata
-                    data['_metadata'] = {
-                        'filename': os.path.basename(file_path),
-                        'filepath': file_path,
-                        'last_modified': datetime.fromtimestamp(os.path.getmtime(file_path)).isoformat()
-                    }
-                    
-                    reports.append(data)
+                    reports.append(self._load_report(file_path, stat, projection or self.projection))
                 except Exception as e:
                     print(f"Error loading {file_path}: {e}")
                     continue
@@ -84,140 +901,192 @@ class KafkaDataLoader:
     
     def get_health_score(self, data: Dict[str, Any]) -> float:
         """Calculate health score from analysis data"""
-        if not data or 'healthChecks' not in data:
-            return 0.0
-            
-        health_checks = data['healthChecks']
-        total_checks = health_checks.get('totalChecks', 0)
-        passed_checks = health_checks.get('passedChecks', 0)
-        
-        return (passed_checks / total_checks * 100) if total_checks > 0 else 0.0
+        return self.get_report_summary(data).health_score
     
     def get_topics_summary(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract topics summary from analysis data"""
-        if not data:
-            return {}
-            
-        summary = data.get('summary', {})
-        topics = data.get('topics', [])
-        
-        # Calculate additional metrics
-        user_topics = [t for t in topics if not t.get('isInternal', False)]
-        internal_topics = [t for t in topics if t.get('isInternal', False)]
-        
-        total_partitions = sum(t.get('partitions', 0) for t in topics)
-        avg_partitions = total_partitions / len(topics) if topics else 0
-        
-        return {
-            'total_topics': len(topics),
-            'user_topics': len(user_topics),
-            'internal_topics': len(internal_topics),
-            'total_partitions': total_partitions,
-            'avg_partitions_per_topic': round(avg_partitions, 2),
-            'topics_with_errors': sum(1 for t in topics if t.get('errorCode', 0) != 0)
-        }
+        return self.get_report_summary(data).topics_summary
     
     def get_broker_info(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract broker information from analysis data"""
-        if not data or 'clusterInfo' not in data:
-            return {}
-            
-        cluster_info = data['clusterInfo']
-        brokers = cluster_info.get('brokers', [])
-        
-        return {
-            'total_brokers': len(brokers),
-            'cluster_id': cluster_info.get('clusterId', 'Unknown'),
-            'controller': cluster_info.get('controller', 'Unknown'),
-            'brokers': brokers
-        }
+        return self.get_report_summary(data).broker_info
     
     def get_consumer_groups_summary(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract consumer groups summary"""
-        if not data or 'consumerGroups' not in data:
-            return {}
-            
-        consumer_groups = data['consumerGroups']
-        
-        active_groups = sum(1 for cg in consumer_groups if cg.get('members', 0) > 0)
-        inactive_groups = len(consumer_groups) - active_groups
-        
-        return {
-            'total_groups': len(consumer_groups),
-            'active_groups': active_groups,
-            'inactive_groups': inactive_groups,
-            'groups': consumer_groups
-        }
+        return self.get_report_summary(data).consumer_summary
+    
+    def get_partition_summary(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract broker load, leader skew and under-replication counts"""
+        return self.get_report_summary(data).partition_summary
     
     def extract_health_checks_details(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract detailed health checks information"""
-        if not data or 'healthChecks' not in data:
-            return []
-            
-        health_checks = data['healthChecks']
-        checks = health_checks.get('checks', [])
-        
-        detailed_checks = []
-        for i, check in enumerate(checks):
-            # Map the check details (this would need to be enhanced based on actual data structure)
-            detailed_checks.append({
-                'id': i,
-                'name': f"Health Check {i+1}",
-                'status': 'PASSED',  # This would come from actual data
-                'message': check.get('description', 'No description available'),
-                'recommendation': check.get('recommendation', 'No recommendation')
-            })
-            
-        return detailed_checks
+        return self.get_report_summary(data).health_details
+
+
+class ReportHandle:
+    """Lightweight reference to a report file
+    
+    File metadata is available without parsing; the cluster id, checksum,
+    body and summary are computed on first use.
+    """
+    
+    def __init__(self, loader: KafkaDataLoader, file_path: str, stat: os.stat_result):
+        self.loader = loader
+        self.filepath = file_path
+        self.filename = os.path.basename(file_path)
+        self.report_id = report_id(file_path)
+        self.stat = stat
+        self.size = stat.st_size
+        self.epoch_ms = report_epoch_ms(file_path, stat)
+        
+        self._cluster_id: Optional[str] = None
+        self._vendor: Optional[str] = None
+        self._checksum: Optional[str] = None
+        self._summary: Optional[Dict[str, Any]] = None
+        self._trend_metrics: Optional[Dict[str, Any]] = None
+    
+    def __repr__(self) -> str:
+        return f"ReportHandle({self.filename!r}, size={self.size})"
+    
+    @property
+    def key(self) -> Tuple[int, int, int]:
+        return KafkaDataLoader.stat_key(self.stat)
+    
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.epoch_ms / 1000, tz=timezone.utc)
+    
+    @property
+    def cluster_id(self) -> str:
+        """Cluster id, read by streaming only the leading clusterInfo section"""
+        if self._cluster_id is None:
+            try:
+                data = load_projected(self.filepath, CLUSTER_PROJECTION)
+                self._cluster_id = str(data.get('clusterInfo', {}).get('clusterId', 'Unknown'))
+            except Exception as e:
+                print(f"Error reading cluster id from {self.filepath}: {e}")
+                self._cluster_id = 'Unknown'
+        return self._cluster_id
+    
+    @property
+    def vendor(self) -> str:
+        """Analyzer vendor, read from the first vendor field in the file"""
+        if self._vendor is None:
+            try:
+                self._vendor = read_report_vendor(self.filepath) or 'Unknown'
+            except Exception as e:
+                print(f"Error reading vendor from {self.filepath}: {e}")
+                self._vendor = 'Unknown'
+        return self._vendor
+    
+    @property
+    def checksum(self) -> str:
+        """BLAKE2b digest of the file contents"""
+        if self._checksum is None:
+            self._checksum = file_checksum(self.filepath)
+        return self._checksum
+    
+    def load(self) -> Dict[str, Any]:
+        """Load the full report body"""
+        return self.loader.load_report_body(self)
+    
+    def summary(self) -> Dict[str, Any]:
+        """Derived summary of the report, kept after the body is evicted"""
+        if self._summary is None:
+            self._summary = self.loader.summarize_report(self.load())
+        return self._summary
+    
+    def trend_metrics(self) -> Optional[Dict[str, Any]]:
+        """History store metrics, stream-parsed from the trend fields only"""
+        if self._trend_metrics is None:
+            report = self.loader._load_report(self.filepath, self.stat, TREND_PROJECTION)
+            self._trend_metrics = extract_report_metrics(report)
+        return self._trend_metrics
 
 
 class HistoricalDataProcessor:
-    """Process historical data for trend analysis"""
+    """Process historical data for trend analysis
     
-    def __init__(self, reports: List[Dict[str, Any]]):
-        self.reports = reports
+    Trend queries read from, in order of preference: a HistoryStore (only
+    the needed columns), a KafkaDataLoader (only the reports in the time
+    window, via get_range), or a list of already loaded reports. A
+    TieredHistoryStore serves the aged parts of a window from its hourly
+    and daily rollups, so long ranges read few rows.
+    """
     
-    def get_health_score_trend(self) -> pd.DataFrame:
-        """Get health score trend over time"""
-        data_loader = KafkaDataLoader()
+    HEALTH_TREND_COLUMNS = ['health_score', 'total_checks', 'passed_checks', 'failed_checks']
+    TOPICS_TREND_COLUMNS = ['total_topics', 'user_topics', 'total_partitions']
+    
+    def __init__(self, reports: Optional[List[Dict[str, Any]]] = None,
+                 store: Optional[HistoryStore] = None,
+                 loader: Optional[KafkaDataLoader] = None,
+                 cluster: Optional[str] = None):
+        self.reports = reports or []
+        self.store = store
+        self.loader = loader
+        # Restricts loader-backed trends to one cluster
+        self.cluster = cluster
         
-        trend_data = []
-        for report in self.reports:
-            timestamp = report.get('timestamp', report.get('_metadata', {}).get('last_modified'))
-            health_score = data_loader.get_health_score(report)
-            
-            trend_data.append({
-                'timestamp': timestamp,
-                'health_score': health_score,
-                'total_checks': report.get('healthChecks', {}).get('totalChecks', 0),
-                'passed_checks': report.get('healthChecks', {}).get('passedChecks', 0),
-                'failed_checks': report.get('healthChecks', {}).get('failedChecks', 0)
-            })
-        
-        df = pd.DataFrame(trend_data)
+        if self.store is not None and self.reports:
+            self.store.ingest(self.reports)
+    
+    @staticmethod
+    def _metrics_frame(rows: List[Dict[str, Any]], columns: List[str]) -> pd.DataFrame:
+        df = pd.DataFrame([{'timestamp': row['timestamp'], **{column: row[column] for column in columns}}
+                           for row in rows])
         if not df.empty:
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df = df.sort_values('timestamp')
-            
+            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms', utc=True)
+            df = df.sort_values('timestamp').reset_index(drop=True)
         return df
     
-    def get_topics_trend(self) -> pd.DataFrame:
-        """Get topics trend over time"""
-        trend_data = []
+    def _build_trend(self, columns: List[str], start: TimeBound, end: TimeBound) -> pd.DataFrame:
+        """Build a trend DataFrame from in-memory reports"""
+        start_ms, end_ms = to_epoch_ms(start), to_epoch_ms(end)
+        
+        rows = []
         for report in self.reports:
-            timestamp = report.get('timestamp', report.get('_metadata', {}).get('last_modified'))
-            summary = report.get('summary', {})
-            
-            trend_data.append({
-                'timestamp': timestamp,
-                'total_topics': summary.get('totalTopics', 0),
-                'user_topics': summary.get('userTopics', 0),
-                'total_partitions': summary.get('totalPartitions', 0)
-            })
-        
-        df = pd.DataFrame(trend_data)
-        if not df.empty:
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df = df.sort_values('timestamp')
-            
-        return df
+            metrics = extract_report_metrics(report)
+            if metrics is None:
+                continue
+            if start_ms is not None and metrics['timestamp'] < start_ms:
+                continue
+            if end_ms is not None and metrics['timestamp'] > end_ms:
+                continue
+            rows.append(metrics)
+        
+        return self._metrics_frame(rows, columns)
+    
+    def _load_trend(self, columns: List[str], start: TimeBound, end: TimeBound,
+                    step: Duration) -> pd.DataFrame:
+        """Build a trend DataFrame from the loader's reports in the window"""
+        rows = []
+        for handle in self.loader.get_range(start, end, step, self.cluster):
+            try:
+                metrics = handle.trend_metrics()
+            except Exception as e:
+                print(f"Error loading trend metrics from {handle.filename}: {e}")
+                continue
+            if metrics is not None:
+                rows.append(metrics)
+        
+        return self._metrics_frame(rows, columns)
+    
+    def get_trend(self, columns: List[str], start: TimeBound = None, end: TimeBound = None,
+                  step: Duration = None) -> pd.DataFrame:
+        """Metric columns over [start, end], at most one point per step"""
+        if self.store is not None:
+            return thin_to_step(self.store.query(columns, start, end), step)
+        if self.loader is not None:
+            return self._load_trend(columns, start, end, step)
+        return thin_to_step(self._build_trend(columns, start, end), step)
+    
+    def get_health_score_trend(self, start: TimeBound = None, end: TimeBound = None,
+                               step: Duration = None) -> pd.DataFrame:
+        """Get health score trend over time"""
+        return self.get_trend(self.HEALTH_TREND_COLUMNS, start, end, step)
+    
+    def get_topics_trend(self, start: TimeBound = None, end: TimeBound = None,
+                         step: Duration = None) -> pd.DataFrame:
+        """Get topics trend over time"""
+        return self.get_trend(self.TOPICS_TREND_COLUMNS, start, end, step)
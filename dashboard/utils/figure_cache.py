@@ -0,0 +1,50 @@
+"""
+Figure cache for Kafka Dashboard
+Keeps built Plotly figures and Dash components so repeat views skip rebuilding them
+"""
+
+import hashlib
+import json
+from typing import Any, Callable, Dict, Hashable
+
+from plotly.io.json import to_json_plotly
+
+from utils.cache import ByteBoundedLRU
+
+
+class FigureCache:
+    """Byte-bounded LRU of callback outputs, kept as plain JSON data
+
+    ``view`` returns the output for a key, building it only on a miss. A
+    built figure or component is encoded once with Plotly's JSON encoder
+    (the one Dash uses) and decoded again, so the cached value is made of
+    plain dicts, lists and numbers: a hit skips ChartBuilder, and Dash
+    re-encodes the value without walking figure objects or NumPy arrays.
+    Entries are weighed by their encoded size. Callers must not modify
+    returned values, which are shared between requests.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self._cache = ByteBoundedLRU(max_bytes)
+
+    @staticmethod
+    def make_key(report_key: Hashable, kind: str, params: Hashable = ()) -> str:
+        """Cache key of one view of a report, e.g. a chart for a time window"""
+        encoded = repr((report_key, kind, params)).encode('utf-8')
+        return f"{kind}:{hashlib.blake2b(encoded, digest_size=12).hexdigest()}"
+
+    def view(self, key: str, build: Callable[[], Any]) -> Any:
+        """Callback output for ``key``, built on a miss"""
+        value = self._cache.get(key)
+        if value is None:
+            encoded = to_json_plotly(build())
+            value = json.loads(encoded)
+            self._cache.put(key, value, len(encoded))
+        return value
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return size and hit-rate counters"""
+        return self._cache.get_stats()
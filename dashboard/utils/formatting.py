@@ -0,0 +1,12 @@
+"""
+Formatting helpers for Kafka Dashboard
+Human-readable values for the command-line tools
+"""
+
+
+def format_bytes(size: float) -> str:
+    """Size in B, KB, MB or GB with one decimal, e.g. '1.5 MB'"""
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if abs(size) < 1024 or unit == 'GB':
+            return f"{size:.1f} {unit}"
+        size /= 1024
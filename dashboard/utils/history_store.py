@@ -0,0 +1,629 @@
+"""
+History store for Kafka Dashboard
+Persists per-report scalar metrics in a columnar on-disk store so that
+trend queries read only the columns and time range they need
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import uuid
+import pandas as pd
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Union
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as pa_dataset
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# Scalar metrics extracted once per report at ingest time
+METRIC_COLUMNS = [
+    'health_score',
+    'total_checks',
+    'passed_checks',
+    'failed_checks',
+    'total_topics',
+    'user_topics',
+    'internal_topics',
+    'total_partitions',
+    'consumer_groups'
+]
+
+TimeBound = Union[None, int, float, str, datetime, pd.Timestamp]
+Duration = Union[None, int, float, timedelta, pd.Timedelta]
+
+
+def to_epoch_ms(value: TimeBound) -> Optional[int]:
+    """Convert a timestamp-like value to epoch milliseconds"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if isinstance(value, pd.Timestamp):
+        value = value.to_pydatetime()
+    return int(value.timestamp() * 1000)
+
+
+def to_duration_ms(value: Duration) -> Optional[int]:
+    """Convert a duration (milliseconds or timedelta) to milliseconds"""
+    if value is None:
+        return None
+    if isinstance(value, timedelta):
+        return int(value.total_seconds() * 1000)
+    return int(value)
+
+
+def thin_to_step(df: pd.DataFrame, step: Duration) -> pd.DataFrame:
+    """Keep the first row of each step-aligned time bucket of a trend frame"""
+    step_ms = to_duration_ms(step)
+    if not step_ms or df.empty:
+        return df
+    buckets = df['timestamp'].dt.floor(pd.Timedelta(milliseconds=step_ms))
+    return df[~buckets.duplicated()].reset_index(drop=True)
+
+
+def extract_report_metrics(report: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Extract the scalar metrics stored for a single report"""
+    metadata = report.get('_metadata', {})
+    timestamp = report.get('timestamp', metadata.get('last_modified'))
+    if not timestamp:
+        return None
+
+    health_checks = report.get('healthChecks', {})
+    summary = report.get('summary', {})
+    total_checks = health_checks.get('totalChecks', 0)
+    passed_checks = health_checks.get('passedChecks', 0)
+
+    return {
+        'report_id': metadata.get('report_id', metadata.get('filename', timestamp)),
+        'timestamp': to_epoch_ms(timestamp),
+        'health_score': (passed_checks / total_checks * 100) if total_checks > 0 else 0.0,
+        'total_checks': total_checks,
+        'passed_checks': passed_checks,
+        'failed_checks': health_checks.get('failedChecks', 0),
+        'total_topics': summary.get('totalTopics', 0),
+        'user_topics': summary.get('userTopics', 0),
+        'internal_topics': summary.get('internalTopics', 0),
+        'total_partitions': summary.get('totalPartitions', 0),
+        'consumer_groups': summary.get('consumerGroups', 0)
+    }
+
+
+class ParquetHistoryBackend:
+    """Append-only Parquet dataset, one file per ingest batch
+
+    Part files are named ``part-<seq>-<random>.parquet``: the sequence
+    continues from the highest existing part, and the random suffix keeps
+    names unique when several processes (e.g. the dashboard and
+    backfill.py) write the same store. Such writers take turns through a
+    lock file (see ``locked``) and pick up each other's report ids from
+    part files they have not read yet, so a report is stored once.
+    """
+
+    # Merge batch files once there are this many of them
+    COMPACT_THRESHOLD = 64
+
+    PART_NAME = re.compile(r'^part-(\d+)')
+
+    LOCK_FILE = '.lock'
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        os.makedirs(store_dir, exist_ok=True)
+        self._batch_seq = max(
+            (int(match.group(1)) for match in
+             (self.PART_NAME.match(os.path.basename(path)) for path in self._part_files()) if match),
+            default=0
+        )
+        # Part files whose report ids this process has read or written
+        self._seen_parts: set = set()
+
+    def _part_files(self) -> List[str]:
+        return sorted(
+            os.path.join(self.store_dir, name)
+            for name in os.listdir(self.store_dir)
+            if name.endswith('.parquet')
+        )
+
+    def _schema(self) -> 'pa.Schema':
+        fields = [pa.field('report_id', pa.string()), pa.field('timestamp', pa.int64())]
+        fields.append(pa.field('health_score', pa.float64()))
+        fields.extend(pa.field(column, pa.int64()) for column in METRIC_COLUMNS[1:])
+        return pa.schema(fields)
+
+    def _dataset(self) -> 'pa_dataset.Dataset':
+        # Only the part files: the store directory also holds e.g. the backfill checkpoint
+        return pa_dataset.dataset(self._part_files(), format='parquet')
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the store's lock file while checking for and writing reports"""
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.store_dir, self.LOCK_FILE), 'a') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def load_report_ids(self) -> set:
+        self._seen_parts = set()
+        return self.new_report_ids()
+
+    def new_report_ids(self) -> set:
+        """Report ids in part files written since the last call, e.g. by other processes"""
+        part_files = self._part_files()
+        unseen = [path for path in part_files if path not in self._seen_parts]
+        self._seen_parts = set(part_files)
+        if not unseen:
+            return set()
+        table = pa_dataset.dataset(unseen, format='parquet').to_table(columns=['report_id'])
+        return set(table.column('report_id').to_pylist())
+
+    def _write_part(self, table: 'pa.Table') -> str:
+        self._batch_seq += 1
+        path = os.path.join(self.store_dir, f"part-{self._batch_seq:08d}-{uuid.uuid4().hex[:8]}.parquet")
+        tmp_path = path + '.tmp'
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+        self._seen_parts.add(path)
+        return path
+
+    def append(self, rows: List[Dict[str, Any]]) -> None:
+        table = pa.Table.from_pylist(rows, schema=self._schema()).sort_by('timestamp')
+        self._write_part(table)
+
+        if len(self._part_files()) >= self.COMPACT_THRESHOLD:
+            self.compact()
+
+    def replace(self, rows: List[Dict[str, Any]]) -> None:
+        """Write rows, replacing stored rows with the same report ids
+
+        Rewrites the whole dataset into one file, so it is meant for small
+        stores such as the rollup tiers.
+        """
+        part_files = self._part_files()
+        table = pa.Table.from_pylist(rows, schema=self._schema())
+        if part_files:
+            stored = pa_dataset.dataset(part_files, format='parquet').to_table()
+            keep = pc.invert(pc.is_in(stored.column('report_id'), value_set=table.column('report_id')))
+            table = pa.concat_tables([stored.filter(keep).cast(table.schema), table])
+        self._replace_parts(part_files, table.sort_by('timestamp'))
+
+    def compact(self) -> None:
+        """Merge all batch files into a single time-sorted file"""
+        part_files = self._part_files()
+        if len(part_files) < 2:
+            return
+        table = pa_dataset.dataset(part_files, format='parquet').to_table()
+        # Drop copies of a report written before writers shared the lock file
+        duplicated = table.column('report_id').to_pandas().duplicated().to_numpy()
+        if duplicated.any():
+            table = table.filter(pa.array(~duplicated))
+        self._replace_parts(part_files, table.sort_by('timestamp'))
+
+    def _replace_parts(self, part_files: List[str], table: 'pa.Table') -> None:
+        path = self._write_part(table)
+        for old_path in part_files:
+            if old_path != path:
+                os.remove(old_path)
+                self._seen_parts.discard(old_path)
+
+    def query(self, columns: List[str], start_ms: Optional[int], end_ms: Optional[int]) -> pd.DataFrame:
+        if not self._part_files():
+            return pd.DataFrame(columns=['timestamp'] + columns)
+
+        expression = None
+        field = pa_dataset.field('timestamp')
+        if start_ms is not None:
+            expression = field >= start_ms
+        if end_ms is not None:
+            upper = field <= end_ms
+            expression = upper if expression is None else expression & upper
+
+        table = self._dataset().to_table(columns=['timestamp'] + columns, filter=expression)
+        return table.to_pandas()
+
+
+class SQLiteHistoryBackend:
+    """SQLite fallback used when pyarrow is not installed"""
+
+    def __init__(self, store_dir: str):
+        os.makedirs(store_dir, exist_ok=True)
+        self.db_path = os.path.join(store_dir, 'history.sqlite')
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+
+        metric_defs = ", ".join(
+            f"{column} {'REAL' if column == 'health_score' else 'INTEGER'}"
+            for column in METRIC_COLUMNS
+        )
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS report_metrics ("
+            f"report_id TEXT PRIMARY KEY, timestamp INTEGER NOT NULL, {metric_defs})"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_report_metrics_timestamp ON report_metrics(timestamp)"
+        )
+        self._conn.commit()
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        # The report_id primary key keeps rows unique across processes
+        yield
+
+    def load_report_ids(self) -> set:
+        return {row[0] for row in self._conn.execute("SELECT report_id FROM report_metrics")}
+
+    def new_report_ids(self) -> set:
+        return set()
+
+    def append(self, rows: List[Dict[str, Any]]) -> None:
+        self._insert(rows, "INSERT OR IGNORE")
+
+    def replace(self, rows: List[Dict[str, Any]]) -> None:
+        self._insert(rows, "INSERT OR REPLACE")
+
+    def _insert(self, rows: List[Dict[str, Any]], statement: str) -> None:
+        columns = ['report_id', 'timestamp'] + METRIC_COLUMNS
+        placeholders = ", ".join("?" for _ in columns)
+        self._conn.executemany(
+            f"{statement} INTO report_metrics ({', '.join(columns)}) VALUES ({placeholders})",
+            [tuple(row[column] for column in columns) for row in rows]
+        )
+        self._conn.commit()
+
+    def compact(self) -> None:
+        self._conn.execute("VACUUM")
+
+    def query(self, columns: List[str], start_ms: Optional[int], end_ms: Optional[int]) -> pd.DataFrame:
+        clauses = []
+        params = []
+        if start_ms is not None:
+            clauses.append("timestamp >= ?")
+            params.append(start_ms)
+        if end_ms is not None:
+            clauses.append("timestamp <= ?")
+            params.append(end_ms)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        sql = f"SELECT timestamp, {', '.join(columns)} FROM report_metrics{where} ORDER BY timestamp"
+        return pd.read_sql_query(sql, self._conn, params=params)
+
+
+class HistoryStore:
+    """Columnar store of per-report metrics backing the trend queries"""
+
+    def __init__(self, store_dir: str, backend: str = "auto"):
+        self.store_dir = store_dir
+
+        if backend == "auto":
+            backend = "parquet" if PYARROW_AVAILABLE else "sqlite"
+        if backend == "parquet":
+            if not PYARROW_AVAILABLE:
+                raise ImportError("pyarrow is required for the parquet history backend")
+            self.backend = ParquetHistoryBackend(store_dir)
+        elif backend == "sqlite":
+            self.backend = SQLiteHistoryBackend(store_dir)
+        else:
+            raise ValueError(f"Unknown history backend: {backend}")
+
+        self.backend_name = backend
+        self._lock = threading.Lock()
+        self._report_ids = self.backend.load_report_ids()
+
+    def __len__(self) -> int:
+        return len(self._report_ids)
+
+    def __contains__(self, report_id: str) -> bool:
+        return report_id in self._report_ids
+
+    def ingest(self, reports: Iterable[Dict[str, Any]]) -> int:
+        """Extract and append metrics for reports not yet in the store
+
+        Returns the number of newly stored reports.
+        """
+        rows = []
+        for report in reports:
+            metadata = report.get('_metadata', {})
+            report_id = metadata.get('report_id', metadata.get('filename', report.get('timestamp')))
+            if report_id is None or report_id in self._report_ids:
+                continue
+            try:
+                metrics = extract_report_metrics(report)
+            except (TypeError, ValueError) as e:
+                print(f"Error extracting metrics from {report_id}: {e}")
+                continue
+            if metrics is not None:
+                rows.append(metrics)
+
+        return self.append_metrics(rows)
+
+    def append_metrics(self, rows: List[Dict[str, Any]]) -> int:
+        """Append precomputed metric rows (see extract_report_metrics)
+
+        Rows for reports already in the store are skipped; returns the
+        number of rows written.
+        """
+        with self._lock, self.backend.locked():
+            self._report_ids.update(self.backend.new_report_ids())
+            new_rows = []
+            for row in rows:
+                if row['report_id'] not in self._report_ids:
+                    self._report_ids.add(row['report_id'])
+                    new_rows.append(row)
+
+            if new_rows:
+                self.backend.append(new_rows)
+
+        return len(new_rows)
+
+    def replace_metrics(self, rows: List[Dict[str, Any]]) -> int:
+        """Write metric rows, replacing stored rows with the same report ids"""
+        with self._lock, self.backend.locked():
+            if rows:
+                self.backend.replace(rows)
+                self._report_ids.update(row['report_id'] for row in rows)
+        return len(rows)
+
+    def query(self, columns: List[str], start: TimeBound = None, end: TimeBound = None) -> pd.DataFrame:
+        """Read the given metric columns within [start, end], sorted by time"""
+        unknown = [column for column in columns if column not in METRIC_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown metric columns: {', '.join(unknown)}")
+
+        with self._lock:
+            df = self.backend.query(columns, to_epoch_ms(start), to_epoch_ms(end))
+
+        if not df.empty:
+            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms', utc=True)
+            df = df.sort_values('timestamp').reset_index(drop=True)
+
+        return df
+
+    def compact(self) -> None:
+        """Merge incremental writes into a compact layout"""
+        with self._lock, self.backend.locked():
+            self.backend.compact()
+
+
+def rollup_metrics(df: pd.DataFrame, bucket: Duration, tier: str) -> List[Dict[str, Any]]:
+    """Aggregate per-report metric rows into one row per time bucket
+
+    The health score is averaged over the bucket; counts keep the last
+    value seen in it. Rows are stamped with the bucket start.
+    """
+    bucket_ms = to_duration_ms(bucket)
+    if df.empty:
+        return []
+
+    buckets = df['timestamp'].dt.floor(pd.Timedelta(milliseconds=bucket_ms))
+    aggregates = {column: 'mean' if column == 'health_score' else 'last' for column in METRIC_COLUMNS}
+    grouped = df.groupby(buckets, sort=True).agg(aggregates)
+
+    rows = []
+    for bucket_start, values in zip(grouped.index, grouped.to_dict('records')):
+        timestamp = to_epoch_ms(bucket_start)
+        row = {'report_id': f"{tier}:{timestamp}", 'timestamp': timestamp}
+        row.update({column: float(values[column]) if column == 'health_score' else int(values[column])
+                    for column in METRIC_COLUMNS})
+        rows.append(row)
+    return rows
+
+
+class RetentionPolicy:
+    """Ages at which report history moves to coarser tiers
+
+    Reports younger than ``full_age`` are kept as they are; older history
+    is kept as hourly rollups until ``hourly_age`` and as daily rollups
+    after that. With ``delete_originals`` report files older than
+    ``full_age`` may be removed once their metrics are stored.
+    """
+
+    def __init__(self, full_age: Duration = timedelta(days=7), hourly_age: Duration = timedelta(days=90),
+                 delete_originals: bool = False):
+        self.full_age_ms = to_duration_ms(full_age)
+        self.hourly_age_ms = to_duration_ms(hourly_age)
+        if self.hourly_age_ms < self.full_age_ms:
+            raise ValueError("hourly_age must not be shorter than full_age")
+        self.delete_originals = delete_originals
+
+    def full_cutoff_ms(self, now: TimeBound = None) -> int:
+        """Reports timed before this are past the full-resolution tier"""
+        return self._now_ms(now) - self.full_age_ms
+
+    def hourly_cutoff_ms(self, now: TimeBound = None) -> int:
+        """History timed before this is read from daily rollups"""
+        return self._now_ms(now) - self.hourly_age_ms
+
+    @staticmethod
+    def _now_ms(now: TimeBound) -> int:
+        return to_epoch_ms(now if now is not None else datetime.now(timezone.utc))
+
+
+class TieredHistoryStore(HistoryStore):
+    """History store with hourly and daily rollup tiers
+
+    Per-report metrics are stored as in HistoryStore. ``rollup`` adds
+    hourly rollups of history older than the policy's ``full_age`` and
+    daily rollups of history older than ``hourly_age``, in their own
+    stores under ``<store_dir>/rollups``. ``query`` stitches a time range
+    together from the coarsest tier that covers each part of it, so
+    long-range trends read a few rows per hour or day instead of every
+    report. Parts not rolled up yet are read at full resolution.
+
+    Rows appended for a time that is already rolled up (late reports or a
+    backfill) mark their buckets dirty in ``<store_dir>/rollups/dirty``;
+    the next ``rollup`` rebuilds those buckets. Per-report rows are kept
+    after they are rolled up, since rebuilding a bucket reads them.
+    """
+
+    TIERS = [
+        ('daily', timedelta(days=1)),
+        ('hourly', timedelta(hours=1))
+    ]
+
+    DIRTY_FILE = 'dirty'
+
+    def __init__(self, store_dir: str, policy: Optional[RetentionPolicy] = None, backend: str = "auto"):
+        super().__init__(store_dir, backend=backend)
+        self.policy = policy or RetentionPolicy()
+        self.rollups = {
+            tier: HistoryStore(os.path.join(store_dir, 'rollups', tier), backend=self.backend_name)
+            for tier, _ in self.TIERS
+        }
+        self._covered_until = {tier: self._rollup_end(tier) for tier, _ in self.TIERS}
+        self._dirty_path = os.path.join(store_dir, 'rollups', self.DIRTY_FILE)
+
+    def _bucket_ms(self, tier: str) -> int:
+        return to_duration_ms(dict(self.TIERS)[tier])
+
+    def _rollup_end(self, tier: str) -> Optional[int]:
+        """End (exclusive, epoch ms) of the last rolled up bucket of a tier"""
+        store = self.rollups[tier]
+        if not len(store):
+            return None
+        last = store.query(['health_score'])['timestamp'].iloc[-1]
+        return to_epoch_ms(last) + self._bucket_ms(tier)
+
+    def _tier_limit_ms(self, tier: str, now: TimeBound) -> int:
+        if tier == 'daily':
+            return self.policy.hourly_cutoff_ms(now)
+        return self.policy.full_cutoff_ms(now)
+
+    def append_metrics(self, rows: List[Dict[str, Any]]) -> int:
+        """Append metric rows, marking rolled up buckets they fall in as dirty"""
+        late = [row['timestamp'] for row in rows if row['report_id'] not in self]
+        written = super().append_metrics(rows)
+        if written:
+            self._mark_dirty(late)
+        return written
+
+    def _mark_dirty(self, timestamps: List[int]) -> None:
+        lines = set()
+        for tier, _ in self.TIERS:
+            covered = self._covered_until[tier]
+            if covered is None:
+                continue
+            bucket_ms = self._bucket_ms(tier)
+            lines.update(f"{tier} {timestamp // bucket_ms * bucket_ms}\n"
+                         for timestamp in timestamps if timestamp < covered)
+        if lines:
+            # Appends from several processes (e.g. backfill.py) interleave by line
+            with open(self._dirty_path, 'a', encoding='utf-8') as f:
+                f.write(''.join(sorted(lines)))
+
+    def _take_dirty(self) -> Dict[str, set]:
+        """Dirty buckets per tier; the dirty file is moved aside while they are rebuilt"""
+        dirty: Dict[str, set] = {tier: set() for tier, _ in self.TIERS}
+        pending_path = self._dirty_path + '.pending'
+        try:
+            # A file left by an interrupted rollup is rebuilt again
+            if not os.path.exists(pending_path):
+                os.replace(self._dirty_path, pending_path)
+            with open(pending_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) == 2 and parts[0] in dirty and parts[1].isdigit():
+                        dirty[parts[0]].add(int(parts[1]))
+        except FileNotFoundError:
+            pass
+        return dirty
+
+    def _rebuild(self, tier: str, bucket: timedelta, bucket_starts: Iterable[int]) -> int:
+        """Recompute rolled up buckets from the per-report rows"""
+        bucket_ms = self._bucket_ms(tier)
+        covered = self._covered_until[tier]
+        rows = []
+        for start_ms in sorted(bucket_starts):
+            if covered is None or start_ms >= covered:
+                # Not rolled up yet; rollup builds it as usual
+                continue
+            df = super().query(METRIC_COLUMNS, start_ms, start_ms + bucket_ms - 1)
+            rows.extend(rollup_metrics(df, bucket, tier))
+        return self.rollups[tier].replace_metrics(rows)
+
+    def rollup(self, now: TimeBound = None) -> Dict[str, int]:
+        """Roll up complete buckets that have aged out of finer tiers
+
+        Dirty buckets are rebuilt first; then only buckets after the last
+        rolled up one are built, from the per-report rows. Returns the
+        number of new or rebuilt rows per tier.
+        """
+        dirty = self._take_dirty()
+        written = {}
+        for tier, bucket in self.TIERS:
+            rebuilt = self._rebuild(tier, bucket, dirty[tier])
+            bucket_ms = self._bucket_ms(tier)
+            # Only whole buckets that ended before the tier's age limit
+            end_ms = self._tier_limit_ms(tier, now) // bucket_ms * bucket_ms
+            start_ms = self._covered_until[tier]
+            if start_ms is not None and start_ms >= end_ms:
+                written[tier] = rebuilt
+                continue
+
+            df = super().query(METRIC_COLUMNS, start_ms, end_ms - 1)
+            written[tier] = rebuilt + self.rollups[tier].append_metrics(rollup_metrics(df, bucket, tier))
+            if written[tier] > rebuilt:
+                self._covered_until[tier] = self._rollup_end(tier)
+
+        try:
+            os.remove(self._dirty_path + '.pending')
+        except FileNotFoundError:
+            pass
+        return written
+
+    def tier_for(self, timestamp: TimeBound, now: TimeBound = None) -> str:
+        """Tier a point in time is read from: 'daily', 'hourly' or 'full'"""
+        timestamp_ms = to_epoch_ms(timestamp)
+        for tier, _ in self.TIERS:
+            covered = self._covered_until[tier]
+            if covered is not None and timestamp_ms < min(covered, self._tier_limit_ms(tier, now)):
+                return tier
+        return 'full'
+
+    def query(self, columns: List[str], start: TimeBound = None, end: TimeBound = None,
+              now: TimeBound = None) -> pd.DataFrame:
+        """Read metric columns within [start, end] from the tiers covering it"""
+        start_ms = to_epoch_ms(start)
+        end_ms = to_epoch_ms(end)
+
+        frames = []
+        for tier, _ in self.TIERS:
+            covered = self._covered_until[tier]
+            if covered is None:
+                continue
+            # This tier serves [start_ms, limit); finer tiers continue from there
+            limit = min(covered, self._tier_limit_ms(tier, now))
+            if end_ms is not None:
+                limit = min(limit, end_ms + 1)
+            if start_ms is not None and start_ms >= limit:
+                continue
+            frames.append(self.rollups[tier].query(columns, start_ms, limit - 1))
+            start_ms = limit
+
+        if end_ms is None or start_ms is None or start_ms <= end_ms:
+            frames.append(super().query(columns, start_ms, end_ms))
+
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame(columns=['timestamp'] + columns)
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
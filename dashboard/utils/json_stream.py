@@ -0,0 +1,220 @@
+"""
+Streaming JSON parsing for Kafka Dashboard
+Reads large analysis reports incrementally and builds only the projected fields
+"""
+
+import json
+import re
+from typing import Dict, Iterable, Optional, Any, TextIO, Union
+
+from utils.compression import open_report_text
+
+
+# A projection is a tree of field names; None means "keep the whole value".
+# It applies element-wise to arrays, so ``topics[].name`` and ``topics.name``
+# describe the same selection.
+Projection = Optional[Dict[str, Any]]
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+
+
+def parse_projection(fields: Union[str, Iterable[str]]) -> Dict[str, Any]:
+    """Build a projection tree from field specs
+
+    Each spec is a dotted path where ``[]`` marks an array and the last
+    segment may list several fields separated by ``/``, e.g.
+    ``topics[].name/partitions/replicationFactor/isInternal`` or
+    ``healthChecks.totalChecks/passedChecks/failedChecks``.
+    """
+    if isinstance(fields, str):
+        fields = [fields]
+
+    tree: Dict[str, Any] = {}
+    for spec in fields:
+        segments = [segment.replace('[]', '') for segment in spec.strip().split('.')]
+        leaves = segments.pop().split('/')
+
+        node = tree
+        for segment in segments:
+            child = node.get(segment, {})
+            if child is None:
+                # A parent path is already selected in full
+                break
+            node[segment] = child
+            node = child
+        else:
+            for leaf in leaves:
+                node[leaf] = None
+
+    return tree
+
+
+def projection_key(projection: Projection) -> str:
+    """Return a stable string identifying a projection"""
+    return json.dumps(projection, sort_keys=True)
+
+
+def apply_projection(value: Any, projection: Projection) -> Any:
+    """Select the projected fields from an already decoded value"""
+    if projection is None:
+        return value
+    if isinstance(value, dict):
+        return {
+            key: apply_projection(value[key], sub_projection)
+            for key, sub_projection in projection.items()
+            if key in value
+        }
+    if isinstance(value, list):
+        return [apply_projection(item, projection) for item in value]
+    return value
+
+
+class JsonStreamReader:
+    """Incremental JSON tokenizer over a text file
+
+    Values are decoded with the C-accelerated ``raw_decode``; containers
+    that are projected or skipped are walked one child at a time, so memory
+    stays bounded by the largest single child rather than the file size.
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int = 1 << 16):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size: int) -> bool:
+        """Append up to ``size`` characters, dropping the consumed prefix"""
+        if self.eof:
+            return False
+        chunk = self.fp.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill(self.chunk_size):
+                return ''
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} but found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def read_value(self) -> Any:
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Value continues past the buffer; grow it geometrically
+                if not self._fill(max(self.chunk_size, len(self.buffer) - self.pos)):
+                    raise
+                continue
+
+            # A number ending at the buffer edge may continue in the next chunk
+            if end == len(self.buffer) and self._fill(self.chunk_size):
+                continue
+
+            self.pos = end
+            return value
+
+    def iter_array(self):
+        """Iterate over an array; the caller must consume each element"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield
+            separator = self.peek()
+            self.pos += 1
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f"Expected ',' or ']' in array but found {separator or 'end of file'!r}")
+
+    def iter_object(self):
+        """Iterate over object keys; the caller must consume each value"""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self.expect(':')
+            yield key
+            separator = self.peek()
+            self.pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise ValueError(f"Expected ',' or '}}' in object but found {separator or 'end of file'!r}")
+
+    def skip_value(self) -> None:
+        """Consume the next value, decoding at most one child at a time"""
+        char = self.peek()
+        if char == '[':
+            for _ in self.iter_array():
+                self.read_value()
+        elif char == '{':
+            for _ in self.iter_object():
+                self.read_value()
+        else:
+            self.read_value()
+
+    def read_projected(self, projection: Projection, stop_when_complete: bool = False) -> Any:
+        """Decode the next value keeping only the projected fields
+
+        With ``stop_when_complete`` an object is returned as soon as all of
+        its projected keys have been read, leaving the rest unconsumed.
+        """
+        if projection is None:
+            return self.read_value()
+
+        char = self.peek()
+        if char == '{':
+            result = {}
+            remaining = set(projection)
+            for key in self.iter_object():
+                if key in projection:
+                    result[key] = self.read_projected(projection[key])
+                    remaining.discard(key)
+                    if stop_when_complete and not remaining:
+                        return result
+                else:
+                    self.skip_value()
+            return result
+
+        if char == '[':
+            # Elements are decoded whole and then projected
+            return [apply_projection(self.read_value(), projection) for _ in self.iter_array()]
+
+        return self.read_value()
+
+
+def load_projected(file_path: str, projection: Projection, chunk_size: int = 1 << 16) -> Dict[str, Any]:
+    """Stream a report file and build only the projected fields
+
+    Compressed reports are decompressed incrementally as they are read.
+    """
+    with open_report_text(file_path) as f:
+        reader = JsonStreamReader(f, chunk_size)
+        data = reader.read_projected(projection, stop_when_complete=True)
+
+    if not isinstance(data, dict):
+        raise ValueError("Report root must be a JSON object")
+
+    return data
@@ -0,0 +1,146 @@
+"""
+Partition matrices for Kafka Dashboard
+Stores per-partition leader, replica and ISR assignments as flat NumPy arrays
+"""
+
+import numpy as np
+from typing import Dict, List, Any, Iterable, Optional
+
+
+def _partition_details(topic: Dict[str, Any]) -> List[Dict[str, Any]]:
+    # Analysis reports use partitionDetails; detailed topic info
+    # (getDetailedTopicInfo) puts the list under partitions
+    details = topic.get('partitionDetails')
+    if details is None and isinstance(topic.get('partitions'), list):
+        details = topic['partitions']
+    return details or []
+
+
+class PartitionMatrix:
+    """One row per partition across all topics of a report
+
+    ``topic_index`` points into the report's topic list (and TopicTable),
+    ``leader`` is -1 when the partition has none, and the replica and ISR
+    broker lists are stored in CSR form: the brokers of row ``i`` are
+    ``replicas[replica_offsets[i]:replica_offsets[i + 1]]``.
+    """
+
+    def __init__(self, topic_index: np.ndarray, partition_id: np.ndarray, leader: np.ndarray,
+                 replica_offsets: np.ndarray, replicas: np.ndarray,
+                 isr_offsets: np.ndarray, isr: np.ndarray):
+        self.topic_index = topic_index
+        self.partition_id = partition_id
+        self.leader = leader
+        self.replica_offsets = replica_offsets
+        self.replicas = replicas
+        self.isr_offsets = isr_offsets
+        self.isr = isr
+
+    @classmethod
+    def from_topics(cls, topics: List[Dict[str, Any]]) -> 'PartitionMatrix':
+        """Build the matrix from the decoded ``topics`` list in one pass"""
+        topic_index: List[int] = []
+        partition_id: List[int] = []
+        leader: List[int] = []
+        replica_counts: List[int] = []
+        replicas: List[int] = []
+        isr_counts: List[int] = []
+        isr: List[int] = []
+
+        for index, topic in enumerate(topics):
+            for partition in _partition_details(topic):
+                topic_index.append(index)
+                partition_id.append(partition.get('id', partition.get('partitionId', -1)))
+                partition_leader = partition.get('leader')
+                leader.append(-1 if partition_leader is None else partition_leader)
+                partition_replicas = partition.get('replicas') or []
+                replica_counts.append(len(partition_replicas))
+                replicas.extend(partition_replicas)
+                partition_isr = partition.get('isr') or []
+                isr_counts.append(len(partition_isr))
+                isr.extend(partition_isr)
+
+        return cls(
+            topic_index=np.array(topic_index, dtype=np.int32),
+            partition_id=np.array(partition_id, dtype=np.int32),
+            leader=np.array(leader, dtype=np.int32),
+            replica_offsets=cls._offsets(replica_counts),
+            replicas=np.array(replicas, dtype=np.int32),
+            isr_offsets=cls._offsets(isr_counts),
+            isr=np.array(isr, dtype=np.int32)
+        )
+
+    @staticmethod
+    def _offsets(counts: List[int]) -> np.ndarray:
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return offsets
+
+    def __len__(self) -> int:
+        return len(self.partition_id)
+
+    def __repr__(self) -> str:
+        return f"PartitionMatrix({len(self)} partitions, {self.nbytes} bytes)"
+
+    @property
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in (
+            self.topic_index, self.partition_id, self.leader,
+            self.replica_offsets, self.replicas, self.isr_offsets, self.isr
+        ))
+
+    def replica_counts(self) -> np.ndarray:
+        return np.diff(self.replica_offsets)
+
+    def isr_counts(self) -> np.ndarray:
+        return np.diff(self.isr_offsets)
+
+    def under_replicated_mask(self) -> np.ndarray:
+        """Partitions whose in-sync replica set is smaller than the replica set"""
+        return self.isr_counts() < self.replica_counts()
+
+    def under_replicated_count(self) -> int:
+        return int(np.count_nonzero(self.under_replicated_mask()))
+
+    def offline_count(self) -> int:
+        """Partitions without a leader"""
+        return int(np.count_nonzero(self.leader < 0))
+
+    def under_replicated_by_topic(self, num_topics: int) -> np.ndarray:
+        """Under-replicated partition count per topic index"""
+        return np.bincount(self.topic_index[self.under_replicated_mask()], minlength=num_topics)
+
+    def broker_load(self, broker_ids: Optional[Iterable[int]] = None) -> Dict[int, Dict[str, int]]:
+        """Leader and replica counts per broker
+
+        Brokers listed in ``broker_ids`` are included even if they hold nothing.
+        """
+        load: Dict[int, Dict[str, int]] = {
+            int(broker_id): {'leaders': 0, 'replicas': 0} for broker_id in broker_ids or []
+        }
+
+        leaders = self.leader[self.leader >= 0]
+        for field, brokers in (('leaders', leaders), ('replicas', self.replicas)):
+            ids, counts = np.unique(brokers, return_counts=True)
+            for broker_id, count in zip(ids.tolist(), counts.tolist()):
+                load.setdefault(broker_id, {'leaders': 0, 'replicas': 0})[field] = count
+
+        return dict(sorted(load.items()))
+
+    def leader_skew(self, broker_ids: Optional[Iterable[int]] = None) -> float:
+        """Most leaders on one broker relative to the mean (1.0 is perfectly balanced)"""
+        leader_counts = np.array([entry['leaders'] for entry in self.broker_load(broker_ids).values()])
+        if leader_counts.size == 0 or leader_counts.sum() == 0:
+            return 0.0
+        return float(leader_counts.max() / leader_counts.mean())
+
+    def summary(self, broker_ids: Optional[Iterable[int]] = None) -> Dict[str, Any]:
+        """Partition health figures for the dashboard"""
+        broker_ids = list(broker_ids or [])
+        return {
+            'total_partitions': len(self),
+            'under_replicated_partitions': self.under_replicated_count(),
+            'offline_partitions': self.offline_count(),
+            'leader_skew': round(self.leader_skew(broker_ids), 2),
+            'broker_load': self.broker_load(broker_ids)
+        }
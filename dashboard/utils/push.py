@@ -0,0 +1,105 @@
+"""
+Server push for Kafka Dashboard
+Notifies open dashboards of new data versions over Server-Sent Events
+"""
+
+import json
+import threading
+from typing import Any, Dict, Iterator, Optional
+
+from flask import Flask, Response, request
+
+
+PUSH_EVENTS_PATH = '/_push/events'
+
+
+def format_event(event: str, data: Dict[str, Any], event_id: Optional[str] = None) -> str:
+    """One ``text/event-stream`` message"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+class PushChannel:
+    """Broadcasts the current data ETag to Server-Sent Events clients
+
+    ``publish`` is called with each new ETag; every connected stream then
+    sends a ``version`` event carrying it. Only the latest ETag is kept, so
+    a slow client skips versions instead of queueing them. Streams send a
+    comment every ``heartbeat`` seconds so dropped connections are noticed,
+    and clients reconnect on their own (after ``retry_ms``) with the last
+    ETag they saw as ``Last-Event-ID``.
+    """
+
+    def __init__(self, heartbeat: float = 15.0, retry_ms: int = 5000):
+        self.heartbeat = heartbeat
+        self.retry_ms = retry_ms
+        self._etag: Optional[str] = None
+        self._condition = threading.Condition()
+        self._closed = False
+        self.clients = 0
+        self.published = 0
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self._etag
+
+    def publish(self, etag: str) -> None:
+        """Notify all clients of a new data version"""
+        with self._condition:
+            if etag == self._etag:
+                return
+            self._etag = etag
+            self.published += 1
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """End all streams, e.g. on shutdown"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def events(self, last_event_id: Optional[str] = None) -> Iterator[str]:
+        """Event stream for one client
+
+        The current ETag is sent right away unless the client already saw
+        it, so a reconnecting client catches up on what it missed.
+        """
+        seen = last_event_id
+        with self._condition:
+            self.clients += 1
+        try:
+            yield f"retry: {self.retry_ms}\n\n"
+            while True:
+                with self._condition:
+                    if self._etag == seen and not self._closed:
+                        self._condition.wait(self.heartbeat)
+                    if self._closed:
+                        return
+                    etag = self._etag
+                if etag is not None and etag != seen:
+                    seen = etag
+                    yield format_event('version', {'etag': etag}, event_id=etag)
+                else:
+                    yield ": keep-alive\n\n"
+        finally:
+            with self._condition:
+                self.clients -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {'clients': self.clients, 'published': self.published, 'etag': self._etag}
+
+    def register(self, server: Flask, path: str = PUSH_EVENTS_PATH) -> None:
+        """Serve the event stream from a Flask app"""
+        def push_events():
+            response = Response(self.events(request.headers.get('Last-Event-ID')),
+                                mimetype='text/event-stream')
+            response.headers['Cache-Control'] = 'no-cache'
+            # Stop reverse proxies from buffering the stream
+            response.headers['X-Accel-Buffering'] = 'no'
+            return response
+
+        server.add_url_rule(path, 'push_events', push_events)
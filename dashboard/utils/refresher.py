@@ -0,0 +1,164 @@
+"""
+Background refresher for Kafka Dashboard
+Builds dashboard data snapshots off the request path and swaps them in atomically
+"""
+
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Callable, Optional
+
+from utils.data_loader import KafkaDataLoader, ReportHandle
+
+
+class DashboardSnapshot:
+    """Everything the dashboard callbacks read for one data version
+
+    Snapshots are built once and never modified, so a callback that holds
+    one sees a consistent view even while a newer one is being built.
+    """
+
+    def __init__(self, version: int, etag: str, handles: List[ReportHandle],
+                 latest: Optional[Dict[str, Any]],
+                 latest_by_cluster: Dict[str, Optional[Dict[str, Any]]],
+                 handles_by_cluster: Dict[str, List[ReportHandle]],
+                 clusters: List[Dict[str, Any]]):
+        self.version = version
+        self.etag = etag
+        self.handles = handles
+        self.latest = latest
+        self.latest_by_cluster = latest_by_cluster
+        self.handles_by_cluster = handles_by_cluster
+        self.clusters = clusters
+        self.built_at = datetime.now()
+
+    def __repr__(self) -> str:
+        return f"DashboardSnapshot(version={self.version}, reports={len(self.handles)})"
+
+    def latest_report(self, cluster: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Most recent report, of one cluster if given"""
+        if cluster:
+            return self.latest_by_cluster.get(cluster)
+        return self.latest
+
+    def report_handles(self, cluster: Optional[str] = None) -> List[ReportHandle]:
+        """Report handles oldest first, of one cluster if given"""
+        if cluster:
+            return self.handles_by_cluster.get(cluster, [])
+        return self.handles
+
+
+class SnapshotRefresher:
+    """Background thread that keeps a double-buffered DashboardSnapshot current
+
+    Every ``interval`` seconds (or when woken) the loader's data version is
+    checked; when it changed, new reports are loaded and summarized into a
+    back buffer that is then swapped with the front one under a lock.
+    Callbacks only read ``current``, so disk I/O and parsing stay off the
+    request path. ``on_refresh`` runs in the refresher thread after each
+    swap, e.g. to append trend metrics to the history store.
+    """
+
+    def __init__(self, data_loader: KafkaDataLoader, interval: float = 2.0,
+                 on_refresh: Optional[Callable[[DashboardSnapshot], None]] = None):
+        self.data_loader = data_loader
+        self.interval = interval
+        self.on_refresh = on_refresh
+
+        self._front: Optional[DashboardSnapshot] = None
+        self._back: Optional[DashboardSnapshot] = None
+        self._swap_lock = threading.Lock()
+        # Serializes builds between the refresher thread and synchronous callers
+        self._build_lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start refreshing in the background; the first snapshot is built right away"""
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="snapshot-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def current(self) -> Optional[DashboardSnapshot]:
+        """The front snapshot, or None before the first one is built"""
+        return self._front
+
+    def wake(self) -> None:
+        """Check for new data now instead of at the next interval"""
+        self._wake_event.set()
+
+    def snapshot(self) -> DashboardSnapshot:
+        """Current snapshot, building it in the caller's thread if there is none
+
+        Without a running refresher thread every call checks for new data,
+        as the dashboard did before snapshots.
+        """
+        current = self._front
+        if current is None or not self.running:
+            return self.refresh()
+        return current
+
+    def refresh(self) -> DashboardSnapshot:
+        """Build and swap in a new snapshot if the data version changed"""
+        with self._build_lock:
+            version = self.data_loader.check_for_updates()
+            current = self._front
+            if current is not None and current.version == version:
+                return current
+
+            snapshot = self._build(version)
+            with self._swap_lock:
+                # The old front becomes the back buffer; readers holding it are unaffected
+                self._front, self._back = snapshot, self._front
+
+        if self.on_refresh is not None:
+            try:
+                self.on_refresh(snapshot)
+            except Exception as e:
+                print(f"Error after refreshing dashboard data: {e}")
+        return snapshot
+
+    def _build(self, version: int) -> DashboardSnapshot:
+        loader = self.data_loader
+        handles = loader.get_report_handles()
+        clusters = loader.get_clusters()
+
+        latest = loader.get_latest_report()
+        latest_by_cluster = {}
+        handles_by_cluster = {}
+        for cluster in clusters:
+            cluster_id = cluster['cluster_id']
+            latest_by_cluster[cluster_id] = loader.get_latest_report(cluster_id)
+            handles_by_cluster[cluster_id] = loader.get_range(cluster=cluster_id)
+
+        # Summaries are memoized by the loader, so callbacks find them ready
+        for report in [latest, *latest_by_cluster.values()]:
+            if report:
+                loader.get_report_summary(report)
+
+        return DashboardSnapshot(version, loader.make_etag(version), handles, latest,
+                                 latest_by_cluster, handles_by_cluster, clusters)
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Error in snapshot refresher: {e}")
+            self._wake_event.wait(self.interval)
+            self._wake_event.clear()
@@ -0,0 +1,507 @@
+"""
+Report archive for Kafka Dashboard
+Stores each cluster's reports as structural deltas against the previous
+report, with a full keyframe every N reports
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+from bisect import bisect_right, insort
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+
+from utils.config_blobs import DiskBlobStore
+from utils.history_store import TimeBound, to_epoch_ms
+
+
+# Fields that identify the items of report lists: topics by name,
+# consumer groups by groupId, brokers by nodeId, partitions by id
+KEY_FIELDS = ('name', 'groupId', 'nodeId', 'id', 'partitionId')
+
+
+def _list_key(old: List[Any], new: List[Any]) -> Optional[str]:
+    """Key field shared by the dict items of both lists, if any"""
+    if not (old or new):
+        return None
+    items = old + new
+    if not all(isinstance(item, dict) for item in items):
+        return None
+    for field in KEY_FIELDS:
+        if all(isinstance(item.get(field), (str, int)) for item in items):
+            if len({item[field] for item in old}) == len(old) and len({item[field] for item in new}) == len(new):
+                return field
+    return None
+
+
+def _diff(old: Any, new: Any) -> Optional[Tuple[str, Any]]:
+    """None if equal, ('p', delta) to patch old, or ('s', new) to replace it"""
+    if isinstance(old, dict) and isinstance(new, dict):
+        delta = _diff_dict(old, new)
+        return None if delta is None else ('p', delta)
+    if isinstance(old, list) and isinstance(new, list):
+        field = _list_key(old, new)
+        if field is not None:
+            delta = _diff_keyed_list(old, new, field)
+            return None if delta is None else ('p', delta)
+    # Compare types too: 1 == 1.0 == True in Python but not in JSON
+    if type(old) is type(new) and old == new:
+        return None
+    return ('s', new)
+
+
+def _diff_dict(old: Dict[str, Any], new: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    sets: Dict[str, Any] = {}
+    patches: Dict[str, Any] = {}
+    for key, value in new.items():
+        if key not in old:
+            sets[key] = value
+            continue
+        change = _diff(old[key], value)
+        if change is not None:
+            (patches if change[0] == 'p' else sets)[key] = change[1]
+    deleted = [key for key in old if key not in new]
+
+    delta: Dict[str, Any] = {}
+    if sets:
+        delta['s'] = sets
+    if patches:
+        delta['p'] = patches
+    if deleted:
+        delta['d'] = deleted
+    expected_order = [key for key in old if key in new] + [key for key in new if key not in old]
+    if list(new) != expected_order:
+        delta['o'] = list(new)
+    return delta or None
+
+
+def _diff_keyed_list(old: List[Dict[str, Any]], new: List[Dict[str, Any]],
+                     field: str) -> Optional[Dict[str, Any]]:
+    old_items = {item[field]: item for item in old}
+    new_keys = [item[field] for item in new]
+    new_key_set = set(new_keys)
+
+    added = []
+    patches = []
+    for item in new:
+        key = item[field]
+        if key not in old_items:
+            added.append(item)
+            continue
+        change = _diff(old_items[key], item)
+        if change is not None:
+            patches.append([key, change[1]])
+    deleted = [key for key in old_items if key not in new_key_set]
+
+    delta: Dict[str, Any] = {}
+    if added:
+        delta['s'] = added
+    if patches:
+        delta['p'] = patches
+    if deleted:
+        delta['d'] = deleted
+    expected_order = [key for key in old_items if key in new_key_set] + [item[field] for item in added]
+    if new_keys != expected_order:
+        delta['o'] = new_keys
+    if not delta:
+        return None
+    delta['k'] = field
+    return delta
+
+
+def make_delta(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Structural delta that turns report ``old`` into ``new``
+
+    Dicts are diffed key by key and lists of topics, partitions, brokers
+    or consumer groups item by item, so a report that differs in one
+    topic's config stores only that config entry. Deltas are plain JSON.
+    """
+    return _diff_dict(old, new) or {}
+
+
+def apply_delta(base: Any, delta: Dict[str, Any]) -> Any:
+    """Apply a delta from make_delta to ``base`` without modifying it
+
+    Unchanged subtrees are shared between ``base`` and the result.
+    """
+    if 'k' in delta:
+        return _apply_keyed_list(base, delta)
+
+    result = dict(base)
+    for key in delta.get('d', ()):
+        result.pop(key, None)
+    for key, sub_delta in delta.get('p', {}).items():
+        result[key] = apply_delta(result[key], sub_delta)
+    result.update(delta.get('s', {}))
+    if 'o' in delta:
+        result = {key: result[key] for key in delta['o']}
+    return result
+
+
+def _apply_keyed_list(base: List[Dict[str, Any]], delta: Dict[str, Any]) -> List[Dict[str, Any]]:
+    field = delta['k']
+    items = {item[field]: item for item in base}
+    for key in delta.get('d', ()):
+        items.pop(key, None)
+    for key, sub_delta in delta.get('p', ()):
+        items[key] = apply_delta(items[key], sub_delta)
+    for item in delta.get('s', ()):
+        items[item[field]] = item
+
+    order = delta.get('o')
+    if order is None:
+        kept = [item[field] for item in base if item[field] in items]
+        order = kept + [item[field] for item in delta.get('s', ())]
+    return [items[key] for key in order]
+
+
+class ArchiveEntry:
+    """Index record of one archived report
+
+    ``position`` is the line of the report's record in its segment file;
+    indexes written before it was recorded leave it None.
+    """
+
+    __slots__ = ('report_id', 'cluster_id', 'epoch_ms', 'seq', 'segment', 'keyframe', 'source_bytes',
+                 'position')
+
+    def __init__(self, report_id: str, cluster_id: str, epoch_ms: int, seq: int,
+                 segment: int, keyframe: bool, source_bytes: int = 0, position: Optional[int] = None):
+        self.report_id = report_id
+        self.cluster_id = cluster_id
+        self.epoch_ms = epoch_ms
+        self.seq = seq
+        self.segment = segment
+        self.keyframe = keyframe
+        self.source_bytes = source_bytes
+        self.position = position
+
+    def __repr__(self) -> str:
+        kind = "keyframe" if self.keyframe else "delta"
+        return f"ArchiveEntry({self.report_id!r}, {kind}, seq={self.seq})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class ReportArchive:
+    """Delta-encoded, append-only report archive
+
+    Each cluster has its own chain under ``<archive_dir>/<cluster>-<hash>``:
+    a segment starts with a full keyframe and holds the deltas of the next
+    ``keyframe_interval - 1`` reports, each against the report before it.
+    Segments are gzip files with one JSON record per line, and
+    ``index.jsonl`` records the segment and line of each report, so a
+    report is rebuilt from at most one keyframe and the deltas indexed
+    after it. Segment and line are recorded rather than derived from
+    ``keyframe_interval``, so an archive can be reopened with another
+    interval, and records that a crash left out of the index are
+    skipped. Topic config maps are kept once in a content-addressed
+    DiskBlobStore under ``<archive_dir>/.blobs``; keyframes and deltas
+    only hold ``{"$blob": hash}`` references. Reconstructed reports share
+    unchanged parts with each other and must be treated as read-only.
+    """
+
+    INDEX_FILE = 'index.jsonl'
+    BLOB_DIR = '.blobs'
+
+    def __init__(self, archive_dir: str, keyframe_interval: int = 50, segment_cache_size: int = 4):
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+        self.archive_dir = archive_dir
+        self.keyframe_interval = keyframe_interval
+        os.makedirs(archive_dir, exist_ok=True)
+        self.blobs = DiskBlobStore(os.path.join(archive_dir, self.BLOB_DIR))
+
+        self._lock = threading.RLock()
+        # cluster id -> entries in append order, and (epoch_ms, seq) sorted by time
+        self._entries: Dict[str, List[ArchiveEntry]] = {}
+        self._by_time: Dict[str, List[Tuple[int, int]]] = {}
+        self._by_report_id: Dict[str, ArchiveEntry] = {}
+        # Last archived report per cluster, the base for the next delta
+        self._tail: Dict[str, Dict[str, Any]] = {}
+        # (cluster id, segment) -> decoded records
+        self._segments: "OrderedDict[Tuple[str, int], List[Dict[str, Any]]]" = OrderedDict()
+        self._segment_cache_size = segment_cache_size
+        # (cluster id, segment) -> records in the segment file, once known
+        self._segment_lengths: Dict[Tuple[str, int], int] = {}
+        # cluster id -> directory name found on disk
+        self._cluster_dirs: Dict[str, str] = {}
+        # Last append and the file sizes before it, for rollback
+        self._last_append: Optional[Tuple[ArchiveEntry, int, int]] = None
+
+        self._load_index()
+
+    @staticmethod
+    def _cluster_dirname(cluster_id: str) -> str:
+        # The hash keeps ids that sanitize to the same name apart
+        digest = hashlib.blake2b(cluster_id.encode('utf-8'), digest_size=4).hexdigest()
+        return f"{re.sub(r'[^A-Za-z0-9._-]', '_', cluster_id)}-{digest}"
+
+    def _cluster_dir(self, cluster_id: str) -> str:
+        dirname = self._cluster_dirs.get(cluster_id) or self._cluster_dirname(cluster_id)
+        return os.path.join(self.archive_dir, dirname)
+
+    def _segment_path(self, cluster_id: str, segment: int) -> str:
+        return os.path.join(self._cluster_dir(cluster_id), f"segment-{segment:08d}.jsonl.gz")
+
+    def _load_index(self) -> None:
+        for name in sorted(os.listdir(self.archive_dir)):
+            index_path = os.path.join(self.archive_dir, name, self.INDEX_FILE)
+            if not os.path.isfile(index_path):
+                continue
+            with open(index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = ArchiveEntry(**json.loads(line))
+                    except (ValueError, TypeError):
+                        # A line cut short by a crash during append
+                        continue
+                    self._cluster_dirs.setdefault(entry.cluster_id, name)
+                    self._add_entry(entry)
+
+    def _add_entry(self, entry: ArchiveEntry) -> None:
+        self._entries.setdefault(entry.cluster_id, []).append(entry)
+        insort(self._by_time.setdefault(entry.cluster_id, []), (entry.epoch_ms, entry.seq))
+        self._by_report_id[entry.report_id] = entry
+
+    def __len__(self) -> int:
+        return len(self._by_report_id)
+
+    def __contains__(self, report_id: str) -> bool:
+        return report_id in self._by_report_id
+
+    def clusters(self) -> List[str]:
+        return sorted(self._entries)
+
+    def entries(self, cluster_id: str) -> List[ArchiveEntry]:
+        """Archived reports of a cluster, oldest first"""
+        with self._lock:
+            by_time = self._by_time.get(cluster_id, [])
+            entries = self._entries.get(cluster_id, [])
+            return [entries[seq] for _, seq in by_time]
+
+    def append(self, report: Dict[str, Any], report_id: str, epoch_ms: Optional[int] = None,
+               source_bytes: int = 0) -> ArchiveEntry:
+        """Archive a report after the previous one of its cluster
+
+        The cluster comes from ``clusterInfo.clusterId`` and the time from
+        ``timestamp`` unless ``epoch_ms`` is given. Loader-only keys such
+        as ``_metadata`` are not archived.
+        """
+        report = {key: value for key, value in report.items() if not key.startswith('_')}
+        if isinstance(report.get('topics'), list):
+            report['topics'] = self.blobs.externalize_topics(report['topics'])
+        cluster_id = str(report.get('clusterInfo', {}).get('clusterId', 'Unknown'))
+        if epoch_ms is None:
+            epoch_ms = to_epoch_ms(report.get('timestamp'))
+        if epoch_ms is None:
+            raise ValueError(f"Report {report_id} has no timestamp")
+
+        with self._lock:
+            if report_id in self._by_report_id:
+                return self._by_report_id[report_id]
+
+            entries = self._entries.get(cluster_id, [])
+            seq = len(entries)
+            if entries:
+                last = entries[-1]
+                in_segment = sum(1 for entry in entries[-self.keyframe_interval:] if entry.segment == last.segment)
+                keyframe = in_segment >= self.keyframe_interval
+                segment = last.segment + 1 if keyframe else last.segment
+            else:
+                keyframe, segment = True, 0
+
+            if keyframe:
+                record = {'report_id': report_id, 'keyframe': report}
+            else:
+                previous = self._tail.get(cluster_id)
+                if previous is None:
+                    previous = self._reconstruct_entry(entries[-1])
+                record = {'report_id': report_id, 'delta': make_delta(previous, report)}
+
+            cluster_dir = self._cluster_dir(cluster_id)
+            os.makedirs(cluster_dir, exist_ok=True)
+            segment_path = self._segment_path(cluster_id, segment)
+            index_path = os.path.join(cluster_dir, self.INDEX_FILE)
+            # Counts records a crash may have left out of the index as well
+            position = self._segment_length(cluster_id, segment)
+            sizes = (self._file_size(segment_path), self._file_size(index_path))
+
+            # Each append adds a gzip member; readers see one stream
+            with gzip.open(segment_path, 'at', encoding='utf-8') as f:
+                f.write(json.dumps(record, separators=(',', ':')) + '\n')
+            self._segment_lengths[(cluster_id, segment)] = position + 1
+
+            entry = ArchiveEntry(report_id, cluster_id, epoch_ms, seq, segment, keyframe, source_bytes,
+                                 position)
+            with open(index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry.to_dict()) + '\n')
+
+            self._add_entry(entry)
+            self._tail[cluster_id] = report
+            self._segments.pop((cluster_id, segment), None)
+            self._last_append = (entry, *sizes)
+            return entry
+
+    def rollback(self, entry: ArchiveEntry) -> None:
+        """Undo the most recent ``append``, e.g. after a failed verification"""
+        with self._lock:
+            if self._last_append is None or self._last_append[0] is not entry:
+                raise ValueError(f"Only the last appended report can be rolled back, not {entry.report_id}")
+            _, segment_size, index_size = self._last_append
+            self._last_append = None
+
+            cluster_dir = self._cluster_dir(entry.cluster_id)
+            for path, size in ((self._segment_path(entry.cluster_id, entry.segment), segment_size),
+                               (os.path.join(cluster_dir, self.INDEX_FILE), index_size)):
+                if size:
+                    os.truncate(path, size)
+                else:
+                    os.remove(path)
+
+            self._entries[entry.cluster_id].pop()
+            self._by_time[entry.cluster_id].remove((entry.epoch_ms, entry.seq))
+            if not self._entries[entry.cluster_id]:
+                del self._entries[entry.cluster_id]
+                del self._by_time[entry.cluster_id]
+            del self._by_report_id[entry.report_id]
+            self._tail.pop(entry.cluster_id, None)
+            self._segment_lengths[(entry.cluster_id, entry.segment)] = entry.position
+            self._segments.pop((entry.cluster_id, entry.segment), None)
+
+    @staticmethod
+    def _file_size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except FileNotFoundError:
+            return 0
+
+    def _segment_length(self, cluster_id: str, segment: int) -> int:
+        key = (cluster_id, segment)
+        length = self._segment_lengths.get(key)
+        if length is None:
+            if os.path.exists(self._segment_path(cluster_id, segment)):
+                length = len(self._read_segment(cluster_id, segment))
+            else:
+                length = 0
+            self._segment_lengths[key] = length
+        return length
+
+    def _read_segment(self, cluster_id: str, segment: int) -> List[Dict[str, Any]]:
+        key = (cluster_id, segment)
+        records = self._segments.get(key)
+        if records is not None:
+            self._segments.move_to_end(key)
+            return records
+
+        records = []
+        with gzip.open(self._segment_path(cluster_id, segment), 'rt', encoding='utf-8') as f:
+            try:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # A record cut short by a crash; keeps later lines in place
+                        records.append(None)
+            except EOFError:
+                # The last gzip member was cut short
+                pass
+
+        self._segments[key] = records
+        while len(self._segments) > self._segment_cache_size:
+            self._segments.popitem(last=False)
+        return records
+
+    def _record_position(self, entry: ArchiveEntry, records: List[Optional[Dict[str, Any]]]) -> int:
+        if entry.position is not None:
+            return entry.position
+        # Older indexes: the first record of the report in its segment
+        for position, record in enumerate(records):
+            if record is not None and record.get('report_id') == entry.report_id:
+                return position
+        raise ValueError(f"Report {entry.report_id} is missing from its archive segment")
+
+    def _reconstruct_entry(self, entry: ArchiveEntry) -> Dict[str, Any]:
+        """Replay the keyframe and the indexed deltas of a segment up to an entry
+
+        Records not in the index (left by a crash between the segment and
+        index writes) are skipped, and every replayed record must carry
+        the report id its index entry expects.
+        """
+        records = self._read_segment(entry.cluster_id, entry.segment)
+        entries = self._entries[entry.cluster_id]
+        chain = []
+        seq = entry.seq
+        while seq >= 0 and entries[seq].segment == entry.segment:
+            chain.append((self._record_position(entries[seq], records), entries[seq]))
+            seq -= 1
+        chain.sort(key=lambda item: item[0])
+
+        report = None
+        for position, indexed in chain:
+            record = records[position] if position < len(records) else None
+            if record is None or record.get('report_id') != indexed.report_id:
+                raise ValueError(f"Archive segment {entry.segment} of {entry.cluster_id} "
+                                 f"does not match its index at report {indexed.report_id}")
+            if 'keyframe' in record:
+                report = record['keyframe']
+            elif report is None:
+                raise ValueError(f"Archive segment {entry.segment} of {entry.cluster_id} has no keyframe")
+            else:
+                report = apply_delta(report, record['delta'])
+        return report
+
+    def _resolve(self, report: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace topic config blob references with the config maps"""
+        if not isinstance(report.get('topics'), list):
+            return report
+        return dict(report, topics=self.blobs.resolve_topics(report['topics']))
+
+    def get(self, report_id: str) -> Optional[Dict[str, Any]]:
+        """Rebuild an archived report by its report id"""
+        with self._lock:
+            entry = self._by_report_id.get(report_id)
+            return None if entry is None else self._resolve(self._reconstruct_entry(entry))
+
+    def reconstruct(self, at: TimeBound, cluster_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Rebuild the most recent report timed at or before ``at``
+
+        Without a cluster id the latest such report of any cluster is
+        returned. Returns None if nothing was archived by then.
+        """
+        at_ms = to_epoch_ms(at)
+        with self._lock:
+            best = None
+            for cluster in ([cluster_id] if cluster_id is not None else self._entries):
+                by_time = self._by_time.get(cluster, [])
+                i = bisect_right(by_time, (at_ms, float('inf')))
+                if i and (best is None or by_time[i - 1][0] > best[0]):
+                    best = (by_time[i - 1][0], cluster, by_time[i - 1][1])
+            if best is None:
+                return None
+            _, cluster, seq = best
+            return self._resolve(self._reconstruct_entry(self._entries[cluster][seq]))
+
+    def stats(self) -> Dict[str, Any]:
+        """Archived report count and on-disk size against the source files"""
+        archive_bytes = 0
+        for root, _, files in os.walk(self.archive_dir):
+            archive_bytes += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+        with self._lock:
+            entries = list(self._by_report_id.values())
+        source_bytes = sum(entry.source_bytes for entry in entries)
+        return {
+            'reports': len(entries),
+            'clusters': len(self._entries),
+            'keyframes': sum(1 for entry in entries if entry.keyframe),
+            'archive_bytes': archive_bytes,
+            'source_bytes': source_bytes,
+            'ratio': round(source_bytes / archive_bytes, 1) if archive_bytes else 0.0
+        }
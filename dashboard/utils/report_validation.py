@@ -0,0 +1,195 @@
+"""
+Report validation for Kafka Dashboard
+Checks parsed reports against a precompiled schema and quarantines broken files
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Callable, Optional
+
+
+class ReportValidationError(ValueError):
+    """A report file that cannot be decoded or does not match REPORT_SCHEMA"""
+
+
+Validator = Callable[[Any], Optional[str]]
+
+# JSON schema type names -> Python types (bool is excluded from numbers below)
+JSON_TYPES = {
+    'object': dict,
+    'array': list,
+    'string': str,
+    'integer': int,
+    'number': (int, float),
+    'boolean': bool,
+    'null': type(None)
+}
+
+
+# The parts of the analyzer's saveJson output the dashboard relies on.
+# Sections are optional (projected loads only contain some of them), but
+# those present must have these shapes.
+REPORT_SCHEMA: Dict[str, Any] = {
+    'type': 'object',
+    'properties': {
+        'timestamp': {'type': 'string'},
+        'vendor': {'type': ['string', 'null']},
+        'clusterInfo': {
+            'type': 'object',
+            'properties': {
+                'brokers': {'type': 'array', 'items': {'type': 'object'}}
+            }
+        },
+        'topics': {
+            'type': 'array',
+            'items': {
+                'type': 'object',
+                'required': ['name'],
+                'properties': {
+                    'name': {'type': 'string'},
+                    'partitions': {'type': ['integer', 'array']},
+                    'replicationFactor': {'type': ['integer', 'null']},
+                    'isInternal': {'type': ['boolean', 'null']},
+                    'errorCode': {'type': ['integer', 'null']},
+                    'config': {'type': ['object', 'null']}
+                }
+            }
+        },
+        'consumerGroups': {'type': 'array', 'items': {'type': 'object'}},
+        'summary': {'type': 'object'},
+        'healthChecks': {
+            'type': 'object',
+            'properties': {
+                'totalChecks': {'type': 'integer'},
+                'passedChecks': {'type': 'integer'},
+                'failedChecks': {'type': 'integer'},
+                'checks': {'type': 'array', 'items': {'type': 'object'}}
+            }
+        }
+    }
+}
+
+
+def _type_check(type_names: List[str], path: str) -> Validator:
+    python_types = tuple(JSON_TYPES[name] for name in type_names)
+    rejects_bool = 'boolean' not in type_names
+    expected = " or ".join(type_names)
+
+    def check(value: Any) -> Optional[str]:
+        if not isinstance(value, python_types) or (rejects_bool and isinstance(value, bool)):
+            return f"{path}: expected {expected}, got {type(value).__name__}"
+        return None
+    return check
+
+
+def compile_schema(schema: Dict[str, Any], path: str = "report") -> Validator:
+    """Compile a JSON schema subset into a validator function
+
+    Supports ``type`` (a name or list of names), ``required``,
+    ``properties`` and ``items``. The schema is walked once here; the
+    returned function only runs the resulting checks and returns the
+    first error message, or None for a valid value.
+    """
+    checks: List[Validator] = []
+
+    type_names = schema.get('type')
+    if type_names is not None:
+        checks.append(_type_check(type_names if isinstance(type_names, list) else [type_names], path))
+
+    required = schema.get('required', [])
+    properties = {
+        name: compile_schema(sub_schema, f"{path}.{name}")
+        for name, sub_schema in schema.get('properties', {}).items()
+    }
+    if required or properties:
+        def check_object(value: Any) -> Optional[str]:
+            if not isinstance(value, dict):
+                return None
+            for name in required:
+                if name not in value:
+                    return f"{path}: missing '{name}'"
+            for name, validate in properties.items():
+                if name in value:
+                    error = validate(value[name])
+                    if error:
+                        return error
+            return None
+        checks.append(check_object)
+
+    if 'items' in schema:
+        validate_item = compile_schema(schema['items'], f"{path}[]")
+
+        def check_items(value: Any) -> Optional[str]:
+            if not isinstance(value, list):
+                return None
+            for index, item in enumerate(value):
+                error = validate_item(item)
+                if error:
+                    return error.replace(f"{path}[]", f"{path}[{index}]", 1)
+            return None
+        checks.append(check_items)
+
+    def validate(value: Any) -> Optional[str]:
+        for check in checks:
+            error = check(value)
+            if error:
+                return error
+        return None
+    return validate
+
+
+# Compiled once at import
+validate_report: Validator = compile_schema(REPORT_SCHEMA)
+
+
+class Quarantine:
+    """Directory that broken report files are moved to
+
+    Each file is kept under its own name (with a numeric suffix if taken)
+    next to a ``<name>.reason.json`` recording why and when it was moved.
+    """
+
+    REASON_SUFFIX = '.reason.json'
+
+    def __init__(self, quarantine_dir: str):
+        self.quarantine_dir = quarantine_dir
+
+    def move(self, file_path: str, reason: str) -> str:
+        """Move a file into quarantine; returns its new path"""
+        os.makedirs(self.quarantine_dir, exist_ok=True)
+        name = os.path.basename(file_path)
+        target = os.path.join(self.quarantine_dir, name)
+        counter = 1
+        while os.path.exists(target):
+            target = os.path.join(self.quarantine_dir, f"{name}.{counter}")
+            counter += 1
+
+        size = os.path.getsize(file_path)
+        os.replace(file_path, target)
+
+        record = {
+            'file': os.path.basename(target),
+            'original_path': os.path.abspath(file_path),
+            'reason': reason,
+            'size': size,
+            'quarantined_at': datetime.now(timezone.utc).isoformat()
+        }
+        with open(target + self.REASON_SUFFIX, 'w', encoding='utf-8') as f:
+            json.dump(record, f, indent=2)
+        return target
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Reason records of quarantined files, oldest first"""
+        if not os.path.isdir(self.quarantine_dir):
+            return []
+        records = []
+        for name in os.listdir(self.quarantine_dir):
+            if not name.endswith(self.REASON_SUFFIX):
+                continue
+            try:
+                with open(os.path.join(self.quarantine_dir, name), 'r', encoding='utf-8') as f:
+                    records.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return sorted(records, key=lambda record: record.get('quarantined_at', ''))
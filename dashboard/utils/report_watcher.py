@@ -0,0 +1,251 @@
+"""
+Report watcher for Kafka Dashboard
+Keeps the data loader's set of known reports current from filesystem events
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from utils.data_loader import KafkaDataLoader
+
+
+# inotify event masks (see <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+WRITE_EVENTS = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+REMOVE_EVENTS = IN_DELETE | IN_MOVED_FROM
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """Load libc with the inotify entry points, or None if unsupported"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class ReportWatcher:
+    """Background thread that pushes new report files into a KafkaDataLoader
+
+    On Linux the data directory is watched with inotify; elsewhere (or if
+    the directory cannot be watched) it falls back to periodic rescans.
+    A changed file is only published after no events arrived for
+    ``debounce`` seconds and its size stayed the same across
+    ``stable_checks`` consecutive checks, so reports that ``saveJson`` is
+    still writing are never parsed half-way. ``on_change`` runs in the
+    watcher thread whenever the loader's data version changed.
+    """
+
+    def __init__(self, data_loader: KafkaDataLoader, debounce: float = 1.0,
+                 stable_checks: int = 2, poll_interval: float = 30.0,
+                 max_parse_attempts: int = 5,
+                 on_change: Optional[Callable[[], None]] = None):
+        self.data_loader = data_loader
+        self.debounce = debounce
+        self.stable_checks = stable_checks
+        self.poll_interval = poll_interval
+        self.max_parse_attempts = max_parse_attempts
+        self.on_change = on_change
+
+        # path -> (deadline, last seen size, checks at that size, parse attempts)
+        self._pending: Dict[str, Tuple[float, int, int, int]] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._inotify_fd: Optional[int] = None
+        self.mode = None
+
+    def start(self) -> None:
+        """Index existing reports and start watching for new ones"""
+        if self._thread is not None:
+            return
+
+        self.data_loader.refresh_index()
+        self._inotify_fd = self._open_inotify()
+        self.mode = "inotify" if self._inotify_fd is not None else "polling"
+        self.data_loader.watching = True
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="report-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching; the loader goes back to rescanning on demand"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+        self.data_loader.watching = False
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _open_inotify(self) -> Optional[int]:
+        libc = _load_libc()
+        if libc is None or not os.path.isdir(self.data_loader.data_dir):
+            return None
+
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return None
+
+        watch = libc.inotify_add_watch(fd, os.fsencode(self.data_loader.data_dir), WATCH_MASK)
+        if watch < 0:
+            os.close(fd)
+            return None
+        return fd
+
+    def _run(self) -> None:
+        next_poll = time.monotonic() + self.poll_interval
+        version = self.data_loader.data_version
+        while not self._stop_event.is_set():
+            try:
+                if self._inotify_fd is not None:
+                    self._wait_for_events()
+                else:
+                    self._stop_event.wait(min(self.poll_interval, self._time_to_next_deadline()))
+                    if time.monotonic() >= next_poll:
+                        self._poll_directory()
+                        next_poll = time.monotonic() + self.poll_interval
+                self._process_pending()
+                if self.on_change is not None and self.data_loader.data_version != version:
+                    version = self.data_loader.data_version
+                    self.on_change()
+            except Exception as e:
+                print(f"Error in report watcher: {e}")
+                self._stop_event.wait(1.0)
+
+    def _time_to_next_deadline(self) -> float:
+        if not self._pending:
+            return 1.0
+        next_deadline = min(deadline for deadline, _, _, _ in self._pending.values())
+        return max(0.0, min(1.0, next_deadline - time.monotonic()))
+
+    def _wait_for_events(self) -> None:
+        readable, _, _ = select.select([self._inotify_fd], [], [], self._time_to_next_deadline())
+        if not readable:
+            return
+
+        try:
+            buffer = os.read(self._inotify_fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buffer):
+            _, mask, _, name_len = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = buffer[offset:offset + name_len].rstrip(b'\0')
+            offset += name_len
+            self._handle_event(mask, os.fsdecode(name))
+
+    def _handle_event(self, mask: int, name: str) -> None:
+        if self._inotify_fd is None:
+            # Watch was dropped while handling an earlier event in this batch
+            return
+
+        if mask & IN_Q_OVERFLOW:
+            # Events were dropped; fall back to a full rescan
+            self.data_loader.refresh_index()
+            return
+
+        if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+            # The data directory itself went away; keep going by polling
+            print("⚠️  Data directory is no longer watchable, falling back to polling")
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+            self.mode = "polling"
+            self.data_loader.refresh_index()
+            return
+
+        if not KafkaDataLoader.is_report_file(name):
+            return
+
+        path = os.path.join(self.data_loader.data_dir, name)
+        if mask & REMOVE_EVENTS:
+            self._pending.pop(path, None)
+            self.data_loader.remove_report_file(path)
+        elif mask & WRITE_EVENTS:
+            self._schedule(path)
+
+    def _schedule(self, path: str) -> None:
+        """(Re)start the debounce window for a file"""
+        _, last_size, _, attempts = self._pending.get(path, (0.0, -1, 0, 0))
+        self._pending[path] = (time.monotonic() + self.debounce, last_size, 0, attempts)
+
+    def _poll_directory(self) -> None:
+        """Detect new or changed files by comparing a rescan with the index"""
+        # The full index, so rejected files and compressed duplicates that
+        # get_report_files leaves out are not scheduled again on every poll
+        known = {path: KafkaDataLoader.stat_key(stat)
+                 for path, stat in self.data_loader.get_indexed_files().items()}
+        current = self.data_loader.scan_report_files()
+
+        for path in known.keys() - current.keys():
+            self._pending.pop(path, None)
+            self.data_loader.remove_report_file(path)
+        for path, stat in current.items():
+            if known.get(path) != KafkaDataLoader.stat_key(stat) and path not in self._pending:
+                self._schedule(path)
+
+    def _process_pending(self) -> None:
+        now = time.monotonic()
+        for path, (deadline, last_size, stable_count, attempts) in list(self._pending.items()):
+            if deadline > now:
+                continue
+
+            try:
+                size = os.stat(path).st_size
+            except FileNotFoundError:
+                self._pending.pop(path, None)
+                self.data_loader.remove_report_file(path)
+                continue
+
+            # Wait until the same non-zero size was seen on consecutive checks
+            stable_count = stable_count + 1 if size == last_size and size > 0 else 1
+            if stable_count < self.stable_checks:
+                self._pending[path] = (now + self.debounce, size, stable_count, attempts)
+                continue
+
+            try:
+                self.data_loader.add_report_file(path)
+                self._pending.pop(path, None)
+            except Exception as e:
+                attempts += 1
+                if attempts >= self.max_parse_attempts:
+                    print(f"Error loading {path}: {e}")
+                    self._pending.pop(path, None)
+                    self.data_loader.add_report_file(path, preload=False)
+                else:
+                    # Probably still being written; check again later
+                    self._pending[path] = (now + self.debounce * attempts, size, 1, attempts)
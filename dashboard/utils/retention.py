@@ -0,0 +1,94 @@
+"""
+Retention for Kafka Dashboard
+Moves aging report history into rollup tiers and optionally removes old report files
+"""
+
+import os
+from typing import Dict, List, Any, Iterable
+
+from utils.data_loader import KafkaDataLoader, ReportHandle
+from utils.history_store import HistoryStore, TieredHistoryStore, TimeBound
+
+
+def ingest_trend_metrics(store: HistoryStore, handles: Iterable[ReportHandle]) -> int:
+    """Store trend metrics of reports not yet in the history store
+
+    Only the trend fields of each new report are parsed. Returns the number
+    of newly stored reports.
+    """
+    rows = []
+    for handle in handles:
+        if handle.report_id in store:
+            continue
+        try:
+            metrics = handle.trend_metrics()
+        except Exception as e:
+            print(f"Error loading trend metrics from {handle.filename}: {e}")
+            continue
+        if metrics is not None:
+            rows.append(metrics)
+    return store.append_metrics(rows)
+
+
+class RetentionManager:
+    """Applies a TieredHistoryStore's RetentionPolicy to a report directory
+
+    Reports younger than the policy's ``full_age`` are left alone. Metrics
+    of every report are stored first, then aged history is rolled up into
+    the hourly and daily tiers. With ``delete_originals`` report files
+    past ``full_age`` are removed, but only once their metrics are stored.
+    """
+
+    def __init__(self, data_loader: KafkaDataLoader, store: TieredHistoryStore):
+        self.data_loader = data_loader
+        self.store = store
+        self.policy = store.policy
+
+    def expired_handles(self, now: TimeBound = None) -> List[ReportHandle]:
+        """Reports older than the full-resolution tier, oldest first"""
+        cutoff_ms = self.policy.full_cutoff_ms(now)
+        return [handle for handle in self.data_loader.get_range() if handle.epoch_ms < cutoff_ms]
+
+    def apply(self, now: TimeBound = None, dry_run: bool = False) -> Dict[str, Any]:
+        """Ingest, roll up and (if enabled) delete; returns what was done
+
+        With ``dry_run`` nothing is written or deleted; the result lists
+        what would be.
+        """
+        handles = self.data_loader.get_report_handles()
+        expired = self.expired_handles(now)
+        result: Dict[str, Any] = {
+            'reports': len(handles),
+            'expired': len(expired),
+            'ingested': 0,
+            'rolled_up': {},
+            'deleted': 0,
+            'freed_bytes': 0
+        }
+
+        if dry_run:
+            result['ingested'] = sum(1 for handle in handles if handle.report_id not in self.store)
+        else:
+            result['ingested'] = ingest_trend_metrics(self.store, handles)
+            result['rolled_up'] = self.store.rollup(now)
+
+        if not self.policy.delete_originals:
+            return result
+
+        for handle in expired:
+            # Never delete a report whose metrics could not be stored
+            if handle.report_id not in self.store and not dry_run:
+                continue
+            if not dry_run:
+                try:
+                    os.remove(handle.filepath)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"Error deleting {handle.filepath}: {e}")
+                    continue
+                self.data_loader.remove_report_file(handle.filepath)
+            result['deleted'] += 1
+            result['freed_bytes'] += handle.size
+
+        return result
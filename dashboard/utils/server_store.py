@@ -0,0 +1,55 @@
+"""
+Server-side data store for Kafka Dashboard
+Keeps callback data on the server so browser stores only carry version tokens
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Union
+
+
+class ServerDataStore:
+    """Version-token keyed store shared by all dashboard sessions
+
+    ``put`` returns a token such as ``latest:3f9c01ab-42`` that is small enough to
+    live in a ``dcc.Store``; callbacks resolve it back to the server-side
+    value with ``get``. Only the most recent versions of each kind are kept.
+    """
+
+    def __init__(self, keep_versions: int = 4):
+        self.keep_versions = keep_versions
+        self._values: Dict[str, "OrderedDict[str, Any]"] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_token(kind: str, version: Union[int, str]) -> str:
+        return f"{kind}:{version}"
+
+    @staticmethod
+    def token_kind(token: str) -> str:
+        # Kinds may contain ':' (e.g. a cluster id); the version never does
+        return token.rsplit(':', 1)[0]
+
+    def put(self, kind: str, version: Union[int, str], value: Any) -> str:
+        """Store the value for a data version and return its token"""
+        token = self.make_token(kind, version)
+        with self._lock:
+            values = self._values.setdefault(kind, OrderedDict())
+            values[token] = value
+            values.move_to_end(token)
+            while len(values) > self.keep_versions:
+                values.popitem(last=False)
+        return token
+
+    def get(self, token: Optional[str], default: Any = None) -> Any:
+        """Resolve a token to its value, or ``default`` if it has expired"""
+        if not token:
+            return default
+        kind = self.token_kind(token)
+        with self._lock:
+            return self._values.get(kind, {}).get(token, default)
+
+    def __contains__(self, token: str) -> bool:
+        kind = self.token_kind(token)
+        with self._lock:
+            return token in self._values.get(kind, {})
@@ -0,0 +1,204 @@
+"""
+Server-side table queries for Kafka Dashboard
+Filters, sorts and pages column arrays for DataTables in custom paging mode
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# One clause of a DataTable filter_query, e.g. {partitions} >= 12 or {name} icontains "orders"
+_CLAUSE = re.compile(
+    r'^\s*\{(?P<column>[^}]+)\}\s*'
+    r'(?:(?P<case>[is]?)(?P<word>contains|datestartswith|eq|ne|lt|le|gt|ge)\b|(?P<symbol>>=|<=|!=|=|<|>))'
+    r'\s*(?P<value>.*?)\s*$'
+)
+_SYMBOLS = {'=': 'eq', '!=': 'ne', '<': 'lt', '<=': 'le', '>': 'gt', '>=': 'ge'}
+
+# (column, operator, value, value as typed, ignore case)
+FilterClause = Tuple[str, str, Any, str, bool]
+
+
+def parse_filter_query(query: Optional[str]) -> List[FilterClause]:
+    """Parse a DataTable ``filter_query`` into clauses
+
+    Supports the comparison, ``contains`` and ``datestartswith`` clauses
+    the filter row produces (with the ``i``/``s`` case prefixes), joined
+    with ``&&``. Clauses that cannot be parsed, such as ``is blank`` or
+    ``||``, are skipped, as the native filter does.
+    """
+    clauses = []
+    for part in (query or '').split(' && '):
+        match = _CLAUSE.match(part)
+        if not match:
+            continue
+        operator = match.group('word') or _SYMBOLS[match.group('symbol')]
+
+        text = match.group('value')
+        value: Any = text
+        if len(text) >= 2 and text[0] == text[-1] and text[0] in ('"', "'", '`'):
+            text = value = text[1:-1].replace('\\' + text[0], text[0])
+        else:
+            try:
+                value = float(text)
+            except ValueError:
+                pass
+        clauses.append((match.group('column'), operator, value, text, match.group('case') == 'i'))
+    return clauses
+
+
+class IndexedTable:
+    """Column arrays with cached sort ranks for server-side DataTable queries
+
+    Text columns are kept as NumPy string arrays and numeric columns as
+    int64/float64 arrays. Each column is ranked once, on first use, so
+    sorting a filtered selection only reorders precomputed ranks. Sorted
+    selections are cached per (filter, sort), so paging through them
+    only slices an index array and builds the visible rows. ``nbytes``
+    counts these ranks and selections as well as the columns, so it grows
+    as queries run.
+    """
+
+    def __init__(self, columns: Dict[str, Sequence[Any]], query_cache_size: int = 16):
+        self.columns: Dict[str, np.ndarray] = {}
+        for name, values in columns.items():
+            array = np.asarray(values)
+            if array.dtype.kind not in 'iufU':
+                array = np.asarray(['' if value is None else str(value) for value in values], dtype=str)
+            self.columns[name] = array
+
+        lengths = {len(array) for array in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns of a table must have the same length")
+        self.num_rows = lengths.pop() if lengths else 0
+
+        self.query_cache_size = query_cache_size
+        self._ranks: Dict[str, np.ndarray] = {}
+        self._lowered: Dict[str, np.ndarray] = {}
+        self._orders: "OrderedDict[Tuple[str, Tuple[Tuple[str, str], ...]], np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]], column_ids: Sequence[str]) -> 'IndexedTable':
+        return cls({column: [record.get(column) for record in records] for column in column_ids})
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __repr__(self) -> str:
+        return f"IndexedTable(rows={self.num_rows}, columns={list(self.columns)})"
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            orders = list(self._orders.values())
+        derived = list(self._ranks.values()) + list(self._lowered.values()) + orders
+        return sum(array.nbytes for array in list(self.columns.values()) + derived)
+
+    def _rank(self, column: str) -> np.ndarray:
+        # Dense ranks: equal values share a rank, so later sort keys break ties
+        rank = self._ranks.get(column)
+        if rank is None:
+            _, rank = np.unique(self.columns[column], return_inverse=True)
+            rank = self._ranks[column] = rank.astype(np.int64).reshape(-1)
+        return rank
+
+    def _lower(self, column: str) -> np.ndarray:
+        lowered = self._lowered.get(column)
+        if lowered is None:
+            lowered = self._lowered[column] = np.char.lower(self.columns[column])
+        return lowered
+
+    def _match(self, clause: FilterClause) -> Optional[np.ndarray]:
+        column, operator, value, text, ignore_case = clause
+        array = self.columns.get(column)
+        if array is None:
+            return None
+
+        if array.dtype.kind == 'U':
+            # Text columns compare with the value as typed
+            value = text
+            if ignore_case:
+                array, value = self._lower(column), value.lower()
+            if operator == 'contains':
+                return np.char.find(array, value) >= 0
+            if operator == 'datestartswith':
+                # Dates are ISO strings, so a prefix selects a year, month, day...
+                return np.char.startswith(array, value)
+        elif operator == 'contains':
+            return np.char.find(array.astype(str), text) >= 0
+        elif operator == 'datestartswith':
+            return np.zeros(self.num_rows, dtype=bool)
+        elif isinstance(value, str):
+            # A number column compared with text matches nothing
+            return np.zeros(self.num_rows, dtype=bool)
+
+        if operator == 'eq':
+            return array == value
+        if operator == 'ne':
+            return array != value
+        if operator == 'lt':
+            return array < value
+        if operator == 'le':
+            return array <= value
+        if operator == 'gt':
+            return array > value
+        return array >= value
+
+    def select(self, filter_query: Optional[str] = None) -> np.ndarray:
+        """Row indices matching a filter query, in table order"""
+        mask = np.ones(self.num_rows, dtype=bool)
+        for clause in parse_filter_query(filter_query):
+            matched = self._match(clause)
+            if matched is not None:
+                mask &= matched
+        return np.flatnonzero(mask)
+
+    def sort(self, selection: np.ndarray, sort_by: Optional[List[Dict[str, str]]] = None) -> np.ndarray:
+        """Reorder row indices by a DataTable ``sort_by`` list (first entry sorts first)"""
+        keys = []
+        for entry in reversed(sort_by or []):
+            column = entry.get('column_id')
+            if column not in self.columns:
+                continue
+            rank = self._rank(column)[selection]
+            keys.append(-rank if entry.get('direction') == 'desc' else rank)
+        if not keys:
+            return selection
+        return selection[np.lexsort(keys)]
+
+    def query(self, filter_query: Optional[str] = None,
+              sort_by: Optional[List[Dict[str, str]]] = None) -> np.ndarray:
+        """Row indices matching a filter query, in sort order"""
+        key = (filter_query or '',
+               tuple((entry.get('column_id'), entry.get('direction')) for entry in sort_by or []))
+        with self._lock:
+            ordered = self._orders.get(key)
+            if ordered is not None:
+                self._orders.move_to_end(key)
+                return ordered
+
+            ordered = self.sort(self.select(filter_query), sort_by)
+            self._orders[key] = ordered
+            while len(self._orders) > self.query_cache_size:
+                self._orders.popitem(last=False)
+        return ordered
+
+    def rows(self, indices: np.ndarray) -> List[Dict[str, Any]]:
+        """Row dicts for the given indices"""
+        columns = {name: array[indices].tolist() for name, array in self.columns.items()}
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+    def page(self, page_current: int = 0, page_size: int = 25,
+             sort_by: Optional[List[Dict[str, str]]] = None,
+             filter_query: Optional[str] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """Rows of one page and the number of pages, after filtering and sorting"""
+        ordered = self.query(filter_query, sort_by)
+        page_size = max(1, page_size or 1)
+        page_count = max(1, -(-len(ordered) // page_size))
+        start = min(max(0, page_current or 0), page_count - 1) * page_size
+        return self.rows(ordered[start:start + page_size]), page_count
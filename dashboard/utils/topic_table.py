@@ -0,0 +1,162 @@
+"""
+Topic tables for Kafka Dashboard
+Stores the per-topic fields of a report as NumPy arrays instead of dicts
+"""
+
+import threading
+import numpy as np
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
+
+from utils.config_blobs import TOPIC_CONFIGS, ConfigBlobStore
+
+
+class NameInterner:
+    """Maps names to small integer ids, shared by every report
+
+    Topic names repeat across thousands of reports of the same clusters,
+    so each distinct name is stored once and tables keep only its id.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def intern(self, name: str) -> int:
+        name_id = self._ids.get(name)
+        if name_id is None:
+            with self._lock:
+                name_id = self._ids.get(name)
+                if name_id is None:
+                    name_id = self._ids[name] = len(self._names)
+                    self._names.append(name)
+        return name_id
+
+    def intern_many(self, names: Iterable[str]) -> np.ndarray:
+        return np.fromiter((self.intern(name) for name in names), dtype=np.int32)
+
+    def lookup(self, name_ids: Iterable[int]) -> List[str]:
+        names = self._names
+        return [names[name_id] for name_id in name_ids]
+
+
+# Process-wide interner used by the loader
+TOPIC_NAMES = NameInterner()
+
+
+def _partition_count(topic: Dict[str, Any]) -> int:
+    # Detailed topic info carries the partition list itself
+    partitions = topic.get('partitions', 0)
+    if isinstance(partitions, list):
+        return len(partitions)
+    return partitions or 0
+
+
+class TopicTable:
+    """Struct-of-arrays view of a report's ``topics`` list
+
+    One array per field: interned name ids (int32), partitions (int32),
+    replicationFactor (int8), isInternal (bool) and errorCode (int16).
+    Config maps are kept once in a ConfigBlobStore and referenced by id
+    (int32, -1 when a topic has none). Iterating yields plain topic dicts
+    for code that expects the list form.
+    """
+
+    def __init__(self, name_ids: np.ndarray, partitions: np.ndarray, replication_factor: np.ndarray,
+                 is_internal: np.ndarray, error_code: np.ndarray, interner: NameInterner = TOPIC_NAMES,
+                 config_ids: Optional[np.ndarray] = None, config_store: ConfigBlobStore = TOPIC_CONFIGS):
+        self.name_ids = name_ids
+        self.partitions = partitions
+        self.replication_factor = replication_factor
+        self.is_internal = is_internal
+        self.error_code = error_code
+        self.interner = interner
+        if config_ids is None:
+            config_ids = np.full(len(name_ids), -1, dtype=np.int32)
+        self.config_ids = config_ids
+        self.config_store = config_store
+
+    @classmethod
+    def from_topics(cls, topics: List[Dict[str, Any]], interner: NameInterner = TOPIC_NAMES,
+                    config_store: ConfigBlobStore = TOPIC_CONFIGS) -> 'TopicTable':
+        """Build a table from the decoded ``topics`` list"""
+        count = len(topics)
+        return cls(
+            name_ids=interner.intern_many(str(topic.get('name', '')) for topic in topics),
+            partitions=np.fromiter((_partition_count(topic) for topic in topics), dtype=np.int32, count=count),
+            replication_factor=np.fromiter((topic.get('replicationFactor', 1) or 0 for topic in topics),
+                                           dtype=np.int8, count=count),
+            is_internal=np.fromiter((bool(topic.get('isInternal', False)) for topic in topics),
+                                    dtype=np.bool_, count=count),
+            error_code=np.fromiter((topic.get('errorCode', 0) or 0 for topic in topics),
+                                   dtype=np.int16, count=count),
+            interner=interner,
+            config_ids=np.fromiter((config_store.intern(topic.get('config')) for topic in topics),
+                                   dtype=np.int32, count=count),
+            config_store=config_store
+        )
+
+    def __len__(self) -> int:
+        return len(self.name_ids)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.to_records())
+
+    def __repr__(self) -> str:
+        return f"TopicTable({len(self)} topics, {self.nbytes} bytes)"
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the arrays (interned names and configs are shared and not counted)"""
+        return (self.name_ids.nbytes + self.partitions.nbytes + self.replication_factor.nbytes
+                + self.is_internal.nbytes + self.error_code.nbytes + self.config_ids.nbytes)
+
+    @property
+    def names(self) -> List[str]:
+        return self.interner.lookup(self.name_ids.tolist())
+
+    @property
+    def configs(self) -> List[Optional[Dict[str, Any]]]:
+        """Shared config map of each topic (None if the report had none)"""
+        get = self.config_store.get
+        return [get(config_id) for config_id in self.config_ids.tolist()]
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Expand back into topic dicts with the tabulated fields"""
+        return [
+            {'name': name, 'partitions': partitions, 'replicationFactor': rf,
+             'isInternal': internal, 'errorCode': error_code, 'config': config}
+            for name, partitions, rf, internal, error_code, config in zip(
+                self.names, self.partitions.tolist(), self.replication_factor.tolist(),
+                self.is_internal.tolist(), self.error_code.tolist(), self.configs)
+        ]
+
+    def summary(self) -> Dict[str, Any]:
+        """Topic counts as vectorized reductions (see KafkaDataLoader.get_topics_summary)"""
+        total_topics = len(self)
+        internal_topics = int(np.count_nonzero(self.is_internal))
+        # Sum in int64 so fleet-sized partition counts cannot overflow
+        total_partitions = int(self.partitions.sum(dtype=np.int64))
+
+        return {
+            'total_topics': total_topics,
+            'user_topics': total_topics - internal_topics,
+            'internal_topics': internal_topics,
+            'total_partitions': total_partitions,
+            'avg_partitions_per_topic': round(total_partitions / total_topics, 2) if total_topics else 0,
+            'topics_with_errors': int(np.count_nonzero(self.error_code))
+        }
+
+    def user_topic_series(self) -> Tuple[List[str], List[int]]:
+        """Names and partition counts of the non-internal topics, in report order"""
+        user = ~self.is_internal
+        return self.interner.lookup(self.name_ids[user].tolist()), self.partitions[user].tolist()
+
+    def replication_factor_counts(self) -> Dict[int, int]:
+        """Number of topics per replication factor, in order of first appearance"""
+        values, first_index, counts = np.unique(self.replication_factor, return_index=True, return_counts=True)
+        order = np.argsort(first_index)
+        return {int(values[i]): int(counts[i]) for i in order}